@@ -1,215 +1,366 @@
-"""Default configuration settings for the Finance Tracker application."""
+"""Default configuration settings for the Finance Tracker application.
 
+Currency and date format defaults follow the ``FT_REGION`` environment
+variable (``IN`` by default, or ``US``). The settings are built once and
+cached with :mod:`marshal` in ``__pycache__``, keyed by hashes of this file
+and the region, so later interpreter starts load a flat dict instead of
+re-executing the nested literals below. Settings are exposed read-only.
+"""
+
+import functools
+import hashlib
+import marshal
 import os
 from pathlib import Path
+from types import MappingProxyType
 
 # Base directory of the project
 BASE_DIR = Path(__file__).resolve().parent.parent
+DATA_DIR = BASE_DIR / "data"
+
+# Region selecting the currency and date format overlay ("IN" or "US")
+REGION = os.environ.get("FT_REGION", "IN").upper()
+
+CACHE_DIR = Path(__file__).resolve().parent / "__pycache__"
+
 
-# Database settings
-DATABASE = {
-    "default": {
-        "ENGINE": "sqlite",
-        "NAME": os.path.join(BASE_DIR, "data", "finance_tracker.db"),
+def _build():
+    """Build the default settings for the current region.
+
+    Every value must be marshal-serializable, so paths are stored as str.
+    """
+    regions = {
+        "IN": {
+            "DEFAULT_CURRENCY": "INR",
+            "SUPPORTED_CURRENCIES": ["INR", "USD", "EUR", "GBP"],
+            "DATE_FORMAT": "%d-%m-%Y",  # Indian format
+            "DATETIME_FORMAT": "%d-%m-%Y %H:%M:%S",
+        },
+        "US": {
+            "DEFAULT_CURRENCY": "USD",
+            "SUPPORTED_CURRENCIES": ["USD", "INR", "EUR", "GBP"],
+            "DATE_FORMAT": "%m-%d-%Y",  # US format
+            "DATETIME_FORMAT": "%m-%d-%Y %H:%M:%S",
+        },
     }
-}
-
-# Currency settings
-DEFAULT_CURRENCY = "INR"
-SUPPORTED_CURRENCIES = [
-    "INR",  # Indian Rupee
-    "USD",  # US Dollar
-    "EUR",  # Euro
-    "GBP",  # British Pound
-]
-
-# Indian Tax Brackets (FY 2023-24)
-TAX_BRACKETS = {
-    "OLD_REGIME": [
-        (250000, 0),  # Up to 2.5L: 0%
-        (500000, 0.05),  # 2.5L to 5L: 5%
-        (750000, 0.10),  # 5L to 7.5L: 10%
-        (1000000, 0.15),  # 7.5L to 10L: 15%
-        (1250000, 0.20),  # 10L to 12.5L: 20%
-        (1500000, 0.25),  # 12.5L to 15L: 25%
-        (float("inf"), 0.30),  # Above 15L: 30%
-    ],
-    "NEW_REGIME": [
-        (300000, 0),  # Up to 3L: 0%
-        (600000, 0.05),  # 3L to 6L: 5%
-        (900000, 0.10),  # 6L to 9L: 10%
-        (1200000, 0.15),  # 9L to 12L: 15%
-        (1500000, 0.20),  # 12L to 15L: 20%
-        (float("inf"), 0.30),  # Above 15L: 30%
-    ],
-}
-
-# UPI Settings
-UPI_SETTINGS = {
-    "ENABLED": True,
-    "PROVIDERS": ["Google Pay", "PhonePe", "Paytm", "BHIM", "Amazon Pay"],
-}
-
-# Date format settings
-DATE_FORMAT = "%d-%m-%Y"  # Indian format
-DATETIME_FORMAT = "%d-%m-%Y %H:%M:%S"
-
-# Category color schemes
-CATEGORY_COLORS = {
-    "income": "#28a745",  # Green
-    "expense": "#dc3545",  # Red
-    "transfer": "#17a2b8",  # Blue
-    "investment": "#ffc107",  # Yellow
-    "tax": "#6c757d",  # Grey
-}
-
-# Budget notification thresholds (percentage of budget)
-BUDGET_WARNING_THRESHOLD = 80
-BUDGET_DANGER_THRESHOLD = 95
-
-# Bill reminder settings
-REMINDER_SETTINGS = {
-    "ENABLED": True,
-    "DAYS_BEFORE": 3,
-    "NOTIFICATION_METHODS": ["app", "email"],
-    "RECURRING_BILLS": [
-        "Electricity",
-        "Water",
-        "Internet",
-        "Phone",
-        "DTH",
-        "Gas",
-        "Rent",
-        "Insurance",
-    ],
-}
 
-# File storage settings
-RECEIPT_STORAGE_PATH = os.path.join(BASE_DIR, "data", "receipts")
-EXPORT_PATH = os.path.join(BASE_DIR, "data", "exports")
-
-# Receipt scanning settings
-RECEIPT_SCAN_SETTINGS = {
-    "ENABLED": True,
-    "OCR_ENGINE": "tesseract",
-    "SUPPORTED_FORMATS": ["jpg", "jpeg", "png", "pdf"],
-    "AUTO_CATEGORIZE": True,
-}
-
-# Expense splitting settings
-SPLIT_SETTINGS = {
-    "ENABLED": True,
-    "METHODS": ["EQUAL", "PERCENTAGE", "EXACT", "SHARES"],
-    "SETTLEMENT_METHODS": ["UPI", "CASH", "BANK_TRANSFER"],
-}
-
-# Budget templates
-BUDGET_TEMPLATES = {
-    "CONSERVATIVE": {
-        "Housing": 30,  # Rent/EMI
-        "Transportation": 10,  # Fuel, maintenance
-        "Utilities": 10,  # Electricity, water, internet
-        "Groceries": 15,  # Food, household items
-        "Healthcare": 10,  # Medical expenses
-        "Entertainment": 5,  # Movies, dining out
-        "Savings": 20,  # Investments, emergency fund
-    },
-    "AGGRESSIVE_SAVING": {
-        "Housing": 25,
-        "Transportation": 8,
-        "Utilities": 8,
-        "Groceries": 12,
-        "Healthcare": 7,
-        "Entertainment": 5,
-        "Savings": 35,
-    },
-}
-
-# Logging settings
-LOGGING = {
-    "version": 1,
-    "disable_existing_loggers": False,
-    "formatters": {
-        "verbose": {
-            "format": "{levelname} {asctime} {module} {message}",
-            "style": "{",
+    settings = {
+        # Database settings
+        "DATABASE": {
+            "default": {
+                "ENGINE": "sqlite",
+                "NAME": str(DATA_DIR / "finance_tracker.db"),
+            }
         },
-        "simple": {
-            "format": "{levelname} {message}",
-            "style": "{",
+
+        # Indian Tax Brackets (FY 2023-24)
+        "TAX_BRACKETS": {
+            "OLD_REGIME": [
+                (250000, 0),  # Up to 2.5L: 0%
+                (500000, 0.05),  # 2.5L to 5L: 5%
+                (750000, 0.10),  # 5L to 7.5L: 10%
+                (1000000, 0.15),  # 7.5L to 10L: 15%
+                (1250000, 0.20),  # 10L to 12.5L: 20%
+                (1500000, 0.25),  # 12.5L to 15L: 25%
+                (float("inf"), 0.30),  # Above 15L: 30%
+            ],
+            "NEW_REGIME": [
+                (300000, 0),  # Up to 3L: 0%
+                (600000, 0.05),  # 3L to 6L: 5%
+                (900000, 0.10),  # 6L to 9L: 10%
+                (1200000, 0.15),  # 9L to 12L: 15%
+                (1500000, 0.20),  # 12L to 15L: 20%
+                (float("inf"), 0.30),  # Above 15L: 30%
+            ],
         },
-    },
-    "handlers": {
-        "file": {
-            "level": "INFO",
-            "class": "logging.FileHandler",
-            "filename": os.path.join(BASE_DIR, "data", "finance_tracker.log"),
-            "formatter": "verbose",
+
+        # UPI Settings
+        "UPI_SETTINGS": {
+            "ENABLED": True,
+            "PROVIDERS": ["Google Pay", "PhonePe", "Paytm", "BHIM", "Amazon Pay"],
         },
-        "console": {
-            "level": "INFO",
-            "class": "logging.StreamHandler",
-            "formatter": "simple",
+
+        # Category color schemes
+        "CATEGORY_COLORS": {
+            "income": "#28a745",  # Green
+            "expense": "#dc3545",  # Red
+            "transfer": "#17a2b8",  # Blue
+            "investment": "#ffc107",  # Yellow
+            "tax": "#6c757d",  # Grey
         },
-    },
-    "loggers": {
-        "finance_tracker": {
-            "handlers": ["file", "console"],
-            "level": "INFO",
-            "propagate": True,
+
+        # Budget notification thresholds (percentage of budget)
+        "BUDGET_WARNING_THRESHOLD": 80,
+        "BUDGET_DANGER_THRESHOLD": 95,
+
+        # Bill reminder settings
+        "REMINDER_SETTINGS": {
+            "ENABLED": True,
+            "DAYS_BEFORE": 3,
+            "NOTIFICATION_METHODS": ["app", "email"],
+            "RECURRING_BILLS": [
+                "Electricity",
+                "Water",
+                "Internet",
+                "Phone",
+                "DTH",
+                "Gas",
+                "Rent",
+                "Insurance",
+            ],
+        },
+
+        # Receipt scanning settings
+        "RECEIPT_SCAN_SETTINGS": {
+            "ENABLED": True,
+            "OCR_ENGINE": "tesseract",
+            "SUPPORTED_FORMATS": ["jpg", "jpeg", "png", "pdf"],
+            "AUTO_CATEGORIZE": True,
+        },
+
+        # Expense splitting settings
+        "SPLIT_SETTINGS": {
+            "ENABLED": True,
+            "METHODS": ["EQUAL", "PERCENTAGE", "EXACT", "SHARES"],
+            "SETTLEMENT_METHODS": ["UPI", "CASH", "BANK_TRANSFER"],
+        },
+
+        # Budget templates
+        "BUDGET_TEMPLATES": {
+            "CONSERVATIVE": {
+                "Housing": 30,  # Rent/EMI
+                "Transportation": 10,  # Fuel, maintenance
+                "Utilities": 10,  # Electricity, water, internet
+                "Groceries": 15,  # Food, household items
+                "Healthcare": 10,  # Medical expenses
+                "Entertainment": 5,  # Movies, dining out
+                "Savings": 20,  # Investments, emergency fund
+            },
+            "AGGRESSIVE_SAVING": {
+                "Housing": 25,
+                "Transportation": 8,
+                "Utilities": 8,
+                "Groceries": 12,
+                "Healthcare": 7,
+                "Entertainment": 5,
+                "Savings": 35,
+            },
+        },
+
+        # Logging settings
+        "LOGGING": {
+            "version": 1,
+            "disable_existing_loggers": False,
+            "formatters": {
+                "verbose": {
+                    "format": "{levelname} {asctime} {module} {message}",
+                    "style": "{",
+                },
+                "simple": {
+                    "format": "{levelname} {message}",
+                    "style": "{",
+                },
+            },
+            "handlers": {
+                "file": {
+                    "level": "INFO",
+                    "class": "logging.FileHandler",
+                    "filename": str(DATA_DIR / "finance_tracker.log"),
+                    "formatter": "verbose",
+                },
+                "console": {
+                    "level": "INFO",
+                    "class": "logging.StreamHandler",
+                    "formatter": "simple",
+                },
+            },
+            "loggers": {
+                "finance_tracker": {
+                    "handlers": ["file", "console"],
+                    "level": "INFO",
+                    "propagate": True,
+                },
+            },
+        },
+
+        # Report generation settings
+        "REPORT_SETTINGS": {
+            "page_size": "A4",
+            "charts_per_page": 2,
+            "default_chart_type": "bar",
+            "chart_colors": [
+                "#FF6B6B",  # Red
+                "#4ECDC4",  # Turquoise
+                "#45B7D1",  # Blue
+                "#96CEB4",  # Green
+                "#FFEEAD",  # Yellow
+                "#D4A5A5",  # Pink
+                "#9FA8DA",  # Purple
+                "#FFE0B2",  # Orange
+            ],
+        },
+
+        # Cache settings
+        "CACHE_SETTINGS": {
+            "BACKEND": "simple",
+            "TIMEOUT": 300,
+            "OPTIONS": {
+                "MAX_ENTRIES": 1000,
+            },
+        },
+
+        # Security settings
+        "SECURITY": {
+            "PASSWORD_HASH_ALGORITHM": "bcrypt",
+            "SALT_ROUNDS": 12,
+            "SESSION_TIMEOUT": 3600,
+            "MAX_LOGIN_ATTEMPTS": 3,
+            "LOCKOUT_DURATION": 300,
+        },
+
+        # Feature flags
+        "FEATURES": {
+            "ENABLE_CATEGORIES": True,
+            "ENABLE_BUDGETS": True,
+            "ENABLE_REPORTS": True,
+            "ENABLE_RECEIPTS": True,
+            "ENABLE_EXPORT": True,
+            "ENABLE_IMPORT": True,
+            "ENABLE_RECURRING": True,
+            "ENABLE_NOTIFICATIONS": True,
+            "ENABLE_UPI": True,
+            "ENABLE_TAX_CALCULATION": True,
+            "ENABLE_BILL_REMINDERS": True,
+            "ENABLE_RECEIPT_SCANNING": True,
+            "ENABLE_EXPENSE_SPLITTING": True,
+            "ENABLE_BUDGET_TEMPLATES": True,
         },
-    },
-}
-
-# Report generation settings
-REPORT_SETTINGS = {
-    "page_size": "A4",
-    "charts_per_page": 2,
-    "default_chart_type": "bar",
-    "chart_colors": [
-        "#FF6B6B",  # Red
-        "#4ECDC4",  # Turquoise
-        "#45B7D1",  # Blue
-        "#96CEB4",  # Green
-        "#FFEEAD",  # Yellow
-        "#D4A5A5",  # Pink
-        "#9FA8DA",  # Purple
-        "#FFE0B2",  # Orange
-    ],
-}
-
-# Cache settings
-CACHE_SETTINGS = {
-    "BACKEND": "simple",
-    "TIMEOUT": 300,
-    "OPTIONS": {
-        "MAX_ENTRIES": 1000,
-    },
-}
-
-# Security settings
-SECURITY = {
-    "PASSWORD_HASH_ALGORITHM": "bcrypt",
-    "SALT_ROUNDS": 12,
-    "SESSION_TIMEOUT": 3600,
-    "MAX_LOGIN_ATTEMPTS": 3,
-    "LOCKOUT_DURATION": 300,
-}
-
-# Feature flags
-FEATURES = {
-    "ENABLE_CATEGORIES": True,
-    "ENABLE_BUDGETS": True,
-    "ENABLE_REPORTS": True,
-    "ENABLE_RECEIPTS": True,
-    "ENABLE_EXPORT": True,
-    "ENABLE_IMPORT": True,
-    "ENABLE_RECURRING": True,
-    "ENABLE_NOTIFICATIONS": True,
-    "ENABLE_UPI": True,
-    "ENABLE_TAX_CALCULATION": True,
-    "ENABLE_BILL_REMINDERS": True,
-    "ENABLE_RECEIPT_SCANNING": True,
-    "ENABLE_EXPENSE_SPLITTING": True,
-    "ENABLE_BUDGET_TEMPLATES": True,
-}
+    }
+    settings.update(regions.get(REGION, regions["IN"]))
+    return settings
+
+
+def _load():
+    """Load the settings from the marshal cache, rebuilding it if stale.
+
+    Cache files are named ``default_config.<source>.<region>.marshal``.
+    Building one removes only those made from other versions of this file,
+    so processes using different regions keep each other's caches.
+    """
+    source_hash = hashlib.blake2b(
+        Path(__file__).read_bytes() + str(BASE_DIR).encode()
+    ).hexdigest()[:16]
+    region_hash = hashlib.blake2b(REGION.encode()).hexdigest()[:8]
+    current = f"default_config.{source_hash}."
+    cache_path = CACHE_DIR / f"{current}{region_hash}.marshal"
+
+    try:
+        with open(cache_path, "rb") as f:
+            return marshal.load(f)
+    except (OSError, EOFError, ValueError, TypeError):
+        pass
+
+    settings = _build()
+    try:
+        CACHE_DIR.mkdir(exist_ok=True)
+        for stale in CACHE_DIR.glob("default_config.*.marshal"):
+            if not stale.name.startswith(current):
+                try:
+                    stale.unlink()
+                except OSError:
+                    pass
+        # Written under a temporary name and renamed, so a concurrent
+        # reader never sees a partly written file
+        tmp_path = cache_path.with_suffix(f".{os.getpid()}.tmp")
+        with open(tmp_path, "wb") as f:
+            marshal.dump(settings, f)
+        os.replace(tmp_path, cache_path)
+    except OSError:
+        # A read-only install still works, it just skips the cache
+        pass
+    return settings
+
+
+def _freeze(value):
+    """Return a read-only copy of a settings value.
+
+    Dicts become MappingProxyType views and lists become tuples.
+    """
+    if isinstance(value, dict):
+        return MappingProxyType({k: _freeze(v) for k, v in value.items()})
+    if isinstance(value, list):
+        return tuple(_freeze(v) for v in value)
+    return value
+
+
+# LOGGING stays a plain dict since logging.config.dictConfig requires one
+globals().update(
+    (name, value if name == "LOGGING" else _freeze(value))
+    for name, value in _load().items()
+)
+
+# File storage settings
+RECEIPT_STORAGE_PATH = DATA_DIR / "receipts"
+EXPORT_PATH = DATA_DIR / "exports"
+
+
+def _hex_to_rgb(colors):
+    """Pack "#RRGGBB" strings into a read-only (N, 3) uint8 array."""
+    import numpy as np
+
+    packed = b"".join(bytes.fromhex(color.lstrip("#")) for color in colors)
+    return np.frombuffer(packed, dtype=np.uint8).reshape(-1, 3)
+
+
+def __getattr__(name):
+    """Build the packed RGB color tables on first access.
+
+    CHART_RGB follows REPORT_SETTINGS["chart_colors"] and CATEGORY_RGB
+    follows the key order of CATEGORY_COLORS. They are created lazily so
+    importing the settings does not import numpy.
+    """
+    if name == "CHART_RGB":
+        value = _hex_to_rgb(REPORT_SETTINGS["chart_colors"])
+    elif name == "CATEGORY_RGB":
+        value = _hex_to_rgb(CATEGORY_COLORS.values())
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    globals()[name] = value
+    return value
+
+
+@functools.lru_cache(maxsize=None)
+def _tax_tables(regime):
+    """Precompute the bracket arrays used by :func:`compute_tax`.
+
+    Returns the bracket upper thresholds, their rates, the lower bound of
+    each bracket and the cumulative tax owed below each bracket.
+    """
+    import numpy as np
+
+    thresholds = np.array([b[0] for b in TAX_BRACKETS[regime]], dtype=float)
+    rates = np.array([b[1] for b in TAX_BRACKETS[regime]], dtype=float)
+    lower_bounds = np.r_[0.0, thresholds[:-1]]
+    base_tax = np.r_[
+        0.0, np.cumsum((thresholds - lower_bounds)[:-1] * rates[:-1])
+    ]
+    return thresholds, rates, lower_bounds, base_tax
+
+
+def compute_tax(incomes, regime="NEW_REGIME"):
+    """Compute income tax for one or more incomes.
+
+    Args:
+        incomes: A single income or an array-like of incomes.
+        regime: Key into TAX_BRACKETS. Defaults to "NEW_REGIME".
+
+    Returns:
+        The tax as a float for a single income, otherwise a numpy array.
+    """
+    import numpy as np
+
+    thresholds, rates, lower_bounds, base_tax = _tax_tables(regime)
+    incomes = np.clip(np.asarray(incomes, dtype=float), 0, None)
+    idx = np.searchsorted(thresholds, incomes)
+    tax = base_tax[idx] + (incomes - lower_bounds[idx]) * rates[idx]
+    return float(tax) if tax.ndim == 0 else tax
@@ -1,4 +1,17 @@
+import compileall
+
 from setuptools import setup, find_packages
+from setuptools.command.build_py import build_py
+
+
+class CompileAllBuildPy(build_py):
+    """Byte-compile the built package so installs ship ready-made .pyc files."""
+
+    def run(self):
+        super().run()
+        for optimize in (0, 2):
+            compileall.compile_dir(self.build_lib, quiet=1, optimize=optimize)
+
 
 with open("README.md", "r", encoding="utf-8") as fh:
     long_description = fh.read()
@@ -11,6 +24,7 @@ setup(
     long_description=long_description,
     long_description_content_type="text/markdown",
     packages=find_packages(),
+    cmdclass={"build_py": CompileAllBuildPy},
     classifiers=[
         "Programming Language :: Python :: 3",
         "License :: OSI Approved :: MIT License",
@@ -20,13 +34,18 @@ setup(
     install_requires=[
         "SQLAlchemy>=2.0.0",
         "alembic>=1.12.0",
-        "pandas>=2.0.0",
-        "numpy>=1.24.0",
-        "matplotlib>=3.7.0",
-        "plotly>=5.17.0",
-        "Pillow>=10.0.0",
         "python-dotenv>=1.0.0",
     ],
+    extras_require={
+        # Charts, Excel import/export and the vectorized tax helpers
+        "reports": [
+            "pandas>=2.0.0",
+            "numpy>=1.24.0",
+            "matplotlib>=3.7.0",
+            "plotly>=5.17.0",
+            "Pillow>=10.0.0",
+        ],
+    },
     entry_points={
         "console_scripts": [
             "finance-tracker=src.main:main",
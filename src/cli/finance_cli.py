@@ -1,47 +1,274 @@
 import argparse
+import csv
 from datetime import datetime
-from decimal import Decimal
+from decimal import Decimal, InvalidOperation
+import functools
+import hashlib
+import io
+import itertools
+import os
+from pathlib import Path
+import pickle
 import sys
 
-from ..core.finance_manager import FinanceManager
-from ..models.models import TransactionType, AccountType, Account, Category
-from ..models.base import SessionLocal
+from ..models import enums
+from ..models.enums import TransactionType, AccountType
 from ..utils.logger import FinanceLogger
-from src.models.models import TransactionType, AccountType, Account, Category
-from src.models.base import SessionLocal
-from src.utils.logger import FinanceLogger
 
-# Initialize logger
-logger = FinanceLogger(name="finance_cli", log_file="logs/cli.log")
+# Initialize logger; file writes happen on a background thread
+logger = FinanceLogger(
+    name="finance_cli", log_file="logs/cli.log", queued=True
+)
+
+# Argument choices, computed once per process
+_ACCOUNT_TYPES = tuple(t.value for t in AccountType)
+_TRANSACTION_TYPES = tuple(t.value for t in TransactionType)
+_ACCOUNT_TYPES_BY_VALUE = {t.value: t for t in AccountType}
+_TRANSACTION_TYPES_BY_VALUE = {t.value: t for t in TransactionType}
+
+# Top-level commands: help text and the FinanceCLI method adding subcommands
+_COMMANDS = {
+    "account": ("Account management", "_add_account_commands"),
+    "category": ("Category management", "_add_category_commands"),
+    "transaction": ("Transaction management", "_add_transaction_commands"),
+    "summary": ("Financial summaries", "_add_summary_commands"),
+}
+
+
+@functools.lru_cache(maxsize=64)
+def _parse_iso_date(value: str) -> datetime:
+    """Parse a YYYY-MM-DD date string.
+
+    Splitting on "-" is much cheaper than strptime; anything that does not
+    fit that shape falls back to strptime for the usual error message.
+    """
+    try:
+        year, month, day = value.split("-")
+        return datetime(int(year), int(month), int(day))
+    except ValueError:
+        return datetime.strptime(value, "%Y-%m-%d")
+
+
+def _parse_decimal(value: str) -> Decimal:
+    """Argparse type converting an amount string straight to Decimal."""
+    try:
+        amount = Decimal(value)
+    except InvalidOperation:
+        raise argparse.ArgumentTypeError(f"invalid amount: {value!r}")
+    if not amount.is_finite():
+        raise argparse.ArgumentTypeError(f"invalid amount: {value!r}")
+    return amount
+
+
+# On-disk parser cache. File names are "parser-<source>-<variant>.pkl":
+# <source> hashes everything the parsers are built from, <variant> the
+# program name and command.
+_PARSER_CACHE_DIR = Path.home() / ".cache" / "finance-tracker"
+# Files whose contents the parsers depend on; the enums give the choices
+_PARSER_SOURCES = (__file__, enums.__file__)
+
+
+def _identity(value):
+    """Stand-in for argparse's default type function, which cannot be pickled."""
+    return value
+
+
+class _ParserPickler(pickle.Pickler):
+    """Pickler that stores argparse sentinels by reference.
+
+    argparse compares SUPPRESS by identity, so it must come back as the very
+    same object, and its default type function is a local closure.
+    """
+
+    def persistent_id(self, obj):
+        if obj is argparse.SUPPRESS:
+            return "SUPPRESS"
+        if getattr(obj, "__qualname__", None) == (
+            "ArgumentParser.__init__.<locals>.identity"
+        ):
+            return "identity"
+        return None
+
+
+class _ParserUnpickler(pickle.Unpickler):
+    """Unpickler resolving the references written by _ParserPickler."""
+
+    def persistent_load(self, pid):
+        if pid == "SUPPRESS":
+            return argparse.SUPPRESS
+        if pid == "identity":
+            return _identity
+        raise pickle.UnpicklingError(f"unsupported persistent id: {pid!r}")
+
+
+@functools.lru_cache(maxsize=None)
+def _parser_source_key():
+    """Hash the parser sources and the Python version, or None if unreadable.
+
+    argparse ships with Python, so sys.version also covers its version.
+    """
+    digest = hashlib.blake2b(sys.version.encode(), digest_size=16)
+    try:
+        for source in _PARSER_SOURCES:
+            digest.update(Path(source).read_bytes())
+    except OSError:
+        return None
+    return digest.hexdigest()
+
+
+def _parser_cache_path(command):
+    """Return the cache file for a command's parser, or None if unavailable."""
+    source_key = _parser_source_key()
+    if source_key is None:
+        return None
+    prog = os.path.basename(sys.argv[0]) or "finance-tracker"
+    variant = hashlib.blake2b(
+        f"{prog}\0{command or ''}".encode(), digest_size=8
+    ).hexdigest()
+    return _PARSER_CACHE_DIR / f"parser-{source_key}-{variant}.pkl"
+
+
+def _load_cached_parser(command):
+    """Load a previously pickled parser, returning None on a cache miss.
+
+    A file that cannot be loaded as a parser is deleted, so a corrupt
+    cache costs one rebuild instead of breaking every run.
+    """
+    cache_path = _parser_cache_path(command)
+    if cache_path is None:
+        return None
+    try:
+        with open(cache_path, "rb") as f:
+            parser = _ParserUnpickler(f).load()
+        if isinstance(parser, argparse.ArgumentParser):
+            return parser
+    except FileNotFoundError:
+        return None
+    except Exception:
+        pass
+    try:
+        cache_path.unlink()
+    except OSError:
+        pass
+    return None
+
+
+def _prune_cached_parsers(source_key):
+    """Remove cached parsers built from other versions of the sources."""
+    current = f"parser-{source_key}-"
+    for path in _PARSER_CACHE_DIR.glob("parser-*.pkl"):
+        if not path.name.startswith(current):
+            try:
+                path.unlink()
+            except OSError:
+                pass
+
+
+def _store_cached_parser(command, parser):
+    """Pickle a parser for later runs; failures only skip the cache."""
+    cache_path = _parser_cache_path(command)
+    if cache_path is None:
+        return
+    try:
+        _PARSER_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        tmp_path = cache_path.with_suffix(f".{os.getpid()}.tmp")
+        with open(tmp_path, "wb") as f:
+            _ParserPickler(f, pickle.HIGHEST_PROTOCOL).dump(parser)
+        os.replace(tmp_path, cache_path)
+    except (OSError, pickle.PicklingError, TypeError, AttributeError):
+        return
+    _prune_cached_parsers(_parser_source_key())
+
+
+def _write_table(title, header, rows, rule_width=50, batch_size=1000):
+    """Write a titled, pipe-delimited table to stdout.
+
+    Rows are formatted by csv.writer into an in-memory buffer, so values
+    containing "|" are quoted instead of breaking the columns. The buffer
+    is written out once per ``batch_size`` rows, which lets ``rows`` be a
+    stream without holding the whole table in memory.
+    """
+    buffer = io.StringIO()
+    buffer.write(f"\n{title}:\n")
+    writer = csv.writer(buffer, delimiter="|", lineterminator="\n")
+    writer.writerow(header)
+    buffer.write("-" * rule_width + "\n")
+
+    rows = iter(rows)
+    while True:
+        batch = list(itertools.islice(rows, batch_size))
+        writer.writerows(batch)
+        sys.stdout.write(buffer.getvalue())
+        if len(batch) < batch_size:
+            break
+        buffer.seek(0)
+        buffer.truncate()
 
 
 class FinanceCLI:
     """Command Line Interface for Finance Tracker"""
 
+    __slots__ = ("_db", "_finance_manager", "_account_currency")
+
+    # Parsers shared by all instances, keyed by command and built on first use
+    _parsers = {}
+
     def __init__(self):
-        self.db = SessionLocal()
-        self.finance_manager = FinanceManager(self.db)
+        # The database layer is imported and opened on first use so that
+        # parsing arguments (and --help) does not pay for SQLAlchemy.
+        self._db = None
+        self._finance_manager = None
+        # Per-instance cache so batch adds against the same account skip
+        # the query; cleared whenever accounts are written.
+        self._account_currency = functools.lru_cache(maxsize=256)(
+            self._lookup_account_currency
+        )
 
-    def setup_parser(self) -> argparse.ArgumentParser:
-        """Set up command line argument parser."""
-        parser = argparse.ArgumentParser(description="Personal Finance Tracker CLI")
-        parser.add_argument(
-            "--init", action="store_true", help="Initialize the database"
+    @property
+    def db(self):
+        """Database session, opened on first access."""
+        if self._db is None:
+            from ..models.base import SessionLocal, init_db
+
+            init_db()
+            self._db = SessionLocal()
+        return self._db
+
+    @property
+    def finance_manager(self):
+        """Finance manager bound to the CLI's database session."""
+        if self._finance_manager is None:
+            from ..core.finance_manager import FinanceManager
+
+            self._finance_manager = FinanceManager(self.db)
+        return self._finance_manager
+
+    def _lookup_account_currency(self, account_id):
+        """Return the currency of an account, or None if it does not exist."""
+        from ..models.models import Account
+
+        return (
+            self.db.query(Account.currency)
+            .filter(Account.id == account_id)
+            .scalar()
         )
-        subparsers = parser.add_subparsers(dest="command", help="Available commands")
 
-        # Account commands
-        account_parser = subparsers.add_parser("account", help="Account management")
+    @staticmethod
+    def _add_account_commands(account_parser):
+        """Add the account subcommands."""
         account_subparsers = account_parser.add_subparsers(dest="account_command")
 
         # Add account
         add_account = account_subparsers.add_parser("add", help="Add new account")
         add_account.add_argument("name", help="Account name")
         add_account.add_argument(
-            "type", choices=[t.value for t in AccountType], help="Account type"
+            "type", choices=_ACCOUNT_TYPES, help="Account type"
         )
         add_account.add_argument(
-            "--balance", type=float, default=0.0, help="Initial balance"
+            "--balance",
+            type=_parse_decimal,
+            default=Decimal("0"),
+            help="Initial balance",
         )
         add_account.add_argument("--currency", default="USD", help="Account currency")
         add_account.add_argument("--description", help="Account description")
@@ -49,17 +276,17 @@ class FinanceCLI:
         # List accounts
         account_subparsers.add_parser("list", help="List all accounts")
 
-        # Category commands
-        category_parser = subparsers.add_parser("category", help="Category management")
+    @staticmethod
+    def _add_category_commands(category_parser):
+        """Add the category subcommands."""
         category_subparsers = category_parser.add_subparsers(dest="category_command")
 
         # List categories
         category_subparsers.add_parser("list", help="List all categories")
 
-        # Transaction commands
-        transaction_parser = subparsers.add_parser(
-            "transaction", help="Transaction management"
-        )
+    @staticmethod
+    def _add_transaction_commands(transaction_parser):
+        """Add the transaction subcommands."""
         transaction_subparsers = transaction_parser.add_subparsers(
             dest="transaction_command"
         )
@@ -69,9 +296,11 @@ class FinanceCLI:
             "add", help="Add new transaction"
         )
         add_transaction.add_argument(
-            "type", choices=[t.value for t in TransactionType], help="Transaction type"
+            "type", choices=_TRANSACTION_TYPES, help="Transaction type"
+        )
+        add_transaction.add_argument(
+            "amount", type=_parse_decimal, help="Transaction amount"
         )
-        add_transaction.add_argument("amount", type=float, help="Transaction amount")
         add_transaction.add_argument("from_account", type=int, help="Source account ID")
         add_transaction.add_argument("category", type=int, help="Category ID")
         add_transaction.add_argument(
@@ -95,12 +324,13 @@ class FinanceCLI:
         )
         list_transactions.add_argument(
             "--type",
-            choices=[t.value for t in TransactionType],
+            choices=_TRANSACTION_TYPES,
             help="Filter by transaction type",
         )
 
-        # Summary commands
-        summary_parser = subparsers.add_parser("summary", help="Financial summaries")
+    @staticmethod
+    def _add_summary_commands(summary_parser):
+        """Add the summary subcommands."""
         summary_subparsers = summary_parser.add_subparsers(dest="summary_command")
 
         # Monthly summary
@@ -110,6 +340,55 @@ class FinanceCLI:
         monthly_summary.add_argument("year", type=int, help="Year")
         monthly_summary.add_argument("month", type=int, help="Month")
 
+    @staticmethod
+    def _command_from_argv(argv):
+        """Return the top-level command named in argv, if any."""
+        for arg in argv:
+            if not arg.startswith("-"):
+                return arg if arg in _COMMANDS else None
+        return None
+
+    @classmethod
+    def setup_parser(cls, command=None) -> argparse.ArgumentParser:
+        """Set up command line argument parser.
+
+        Every command is registered so that help lists them all, but only
+        the subcommands of ``command`` are built. Parsers are cached per
+        command, in memory and pickled under ~/.cache/finance-tracker, and
+        need no instance, so help can be printed without creating a
+        FinanceCLI.
+
+        Args:
+            command: Top-level command to build subcommands for, or None.
+
+        Returns:
+            The argument parser.
+        """
+        parser = cls._parsers.get(command)
+        if parser is not None:
+            return parser
+
+        parser = _load_cached_parser(command)
+        if parser is None:
+            parser = cls._build_parser(command)
+            _store_cached_parser(command, parser)
+
+        cls._parsers[command] = parser
+        return parser
+
+    @classmethod
+    def _build_parser(cls, command):
+        """Build the argument parser for ``command`` from scratch."""
+        parser = argparse.ArgumentParser(description="Personal Finance Tracker CLI")
+        parser.add_argument(
+            "--init", action="store_true", help="Initialize the database"
+        )
+        subparsers = parser.add_subparsers(dest="command", help="Available commands")
+        for name, (help_text, builder) in _COMMANDS.items():
+            command_parser = subparsers.add_parser(name, help=help_text)
+            if name == command:
+                getattr(cls, builder)(command_parser)
+
         return parser
 
     def handle_account_command(self, args):
@@ -117,64 +396,70 @@ class FinanceCLI:
         if args.account_command == "add":
             account = self.finance_manager.create_account(
                 name=args.name,
-                account_type=AccountType(args.type),
-                initial_balance=Decimal(str(args.balance)),
+                account_type=_ACCOUNT_TYPES_BY_VALUE[args.type],
+                initial_balance=args.balance,
                 currency=args.currency,
                 description=args.description,
             )
+            self._account_currency.cache_clear()
             print(f"Account created successfully. ID: {account.id}")
             logger.info(f"Created account '{args.name}' with ID {account.id}")
 
         elif args.account_command == "list":
+            from ..models.models import Account
+
             accounts = self.db.query(Account).all()
             if not accounts:
                 print("\nNo accounts found.")
                 return
 
-            print("\nAccounts:")
-            print("ID | Name | Type | Balance | Currency")
-            print("-" * 50)
-            for account in accounts:
-                print(
-                    f"{account.id} | {account.name} | {account.type.value} | {account.balance:.2f} | {account.currency}"
-                )
+            _write_table(
+                "Accounts",
+                ("ID", "Name", "Type", "Balance", "Currency"),
+                (
+                    (a.id, a.name, a.type.value, f"{a.balance:.2f}", a.currency)
+                    for a in accounts
+                ),
+            )
 
     def handle_category_command(self, args):
         """Handle category-related commands."""
         if args.category_command == "list":
-            categories = self.db.query(Category).all()
+            from sqlalchemy.orm import joinedload
+
+            from ..models.models import Category
+
+            categories = (
+                self.db.query(Category).options(joinedload(Category.parent)).all()
+            )
             if not categories:
                 print("\nNo categories found.")
                 return
 
-            print("\nCategories:")
-            print("ID | Name | Type | Parent")
-            print("-" * 50)
-            for category in categories:
-                parent_name = category.parent.name if category.parent else "None"
-                print(
-                    f"{category.id} | {category.name} | {category.type} | {parent_name}"
-                )
+            _write_table(
+                "Categories",
+                ("ID", "Name", "Type", "Parent"),
+                (
+                    (c.id, c.name, c.type, c.parent.name if c.parent else "None")
+                    for c in categories
+                ),
+            )
 
     def handle_transaction_command(self, args):
         """Handle transaction-related commands."""
         if args.transaction_command == "add":
             try:
-                date = datetime.strptime(args.date, "%Y-%m-%d") if args.date else None
+                date = _parse_iso_date(args.date) if args.date else None
                 tags = args.tags.split(",") if args.tags else None
 
                 # Get account currency
-                account = (
-                    self.db.query(Account)
-                    .filter(Account.id == args.from_account)
-                    .first()
-                )
-                if not account:
+                currency = self._account_currency(args.from_account)
+                if currency is None:
                     raise ValueError(f"Account with ID {args.from_account} not found")
 
                 transaction = self.finance_manager.create_transaction(
-                    type=TransactionType(args.type),
-                    amount=Decimal(str(args.amount)),
+                    type=_TRANSACTION_TYPES_BY_VALUE[args.type],
+                    amount=args.amount,
                     from_account_id=args.from_account,
                     category_id=args.category,
                     to_account_id=args.to_account,
@@ -184,7 +469,7 @@ class FinanceCLI:
                 )
                 print(f"Transaction created successfully. ID: {transaction.id}")
                 logger.info(
-                    f"Created {args.type} transaction for {args.amount} {account.currency}. ID: {transaction.id}"
+                    f"Created {args.type} transaction for {args.amount} {currency}. ID: {transaction.id}"
                 )
 
             except Exception as e:
@@ -192,17 +477,13 @@ class FinanceCLI:
                 logger.error(f"Error creating transaction: {str(e)}")
 
         elif args.transaction_command == "list":
-            start_date = (
-                datetime.strptime(args.start_date, "%Y-%m-%d")
-                if args.start_date
-                else None
+            start_date = _parse_iso_date(args.start_date) if args.start_date else None
+            end_date = _parse_iso_date(args.end_date) if args.end_date else None
+            transaction_type = (
+                _TRANSACTION_TYPES_BY_VALUE[args.type] if args.type else None
             )
-            end_date = (
-                datetime.strptime(args.end_date, "%Y-%m-%d") if args.end_date else None
-            )
-            transaction_type = TransactionType(args.type) if args.type else None
 
-            transactions = self.finance_manager.search_transactions(
+            transactions = self.finance_manager.iter_transactions(
                 start_date=start_date,
                 end_date=end_date,
                 category_id=args.category,
@@ -210,21 +491,40 @@ class FinanceCLI:
                 transaction_type=transaction_type,
             )
 
-            if not transactions:
+            first = next(transactions, None)
+            if first is None:
                 print("\nNo transactions found.")
                 return
 
-            print("\nTransactions:")
-            print(
-                "ID | Date | Type | Amount | From Account | To Account | Category | Description"
+            # Rows stream from the cursor with related rows eager-loaded,
+            # and are written out in batches as they arrive.
+            _write_table(
+                "Transactions",
+                (
+                    "ID",
+                    "Date",
+                    "Type",
+                    "Amount",
+                    "From Account",
+                    "To Account",
+                    "Category",
+                    "Description",
+                ),
+                (
+                    (
+                        t.id,
+                        t.date.date(),
+                        t.type.value,
+                        f"{t.amount:.2f}",
+                        t.from_account.name,
+                        t.to_account.name if t.to_account else "N/A",
+                        t.category.name,
+                        t.description or "N/A",
+                    )
+                    for t in itertools.chain((first,), transactions)
+                ),
+                rule_width=80,
             )
-            print("-" * 80)
-            for t in transactions:
-                print(
-                    f"{t.id} | {t.date.date()} | {t.type.value} | {t.amount:.2f} | "
-                    f"{t.from_account.name} | {t.to_account.name if t.to_account else 'N/A'} | "
-                    f"{t.category.name} | {t.description or 'N/A'}"
-                )
 
     def handle_summary_command(self, args):
         """Handle summary-related commands."""
@@ -247,7 +547,7 @@ class FinanceCLI:
 
     def run(self):
         """Run the CLI application."""
-        parser = self.setup_parser()
+        parser = self.setup_parser(self._command_from_argv(sys.argv[1:]))
         args = parser.parse_args()
 
         try:
@@ -265,11 +565,18 @@ class FinanceCLI:
             print(f"Error: {str(e)}", file=sys.stderr)
             logger.error(f"Error in CLI: {str(e)}")
         finally:
-            self.db.close()
+            if self._db is not None:
+                self._db.close()
 
 
 def main():
     """Entry point for the CLI application."""
+    if any(arg in ("-h", "--help") for arg in sys.argv[1:]):
+        # Help exits inside parse_args; no CLI instance is needed for it
+        command = FinanceCLI._command_from_argv(sys.argv[1:])
+        FinanceCLI.setup_parser(command).parse_args()
+        return
+
     cli = FinanceCLI()
     cli.run()
 
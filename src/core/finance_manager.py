@@ -1,31 +1,316 @@
 """Core module for managing financial data and operations."""
 
+import calendar
+import itertools
+import time
+from contextlib import contextmanager
 from datetime import datetime, timedelta
 from decimal import Decimal
-from typing import Any, Dict, List, Optional, Tuple, Union
-
-from sqlalchemy import and_, case, desc, extract, func, or_
-from sqlalchemy.orm import Session, joinedload
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple, Union
+
+from sqlalchemy import (
+    bindparam,
+    case,
+    desc,
+    event,
+    func,
+    insert,
+    inspect,
+    or_,
+    select,
+    update,
+)
+from sqlalchemy.engine import Row
+from sqlalchemy.orm import Session, aliased, joinedload
+from sqlalchemy.orm.attributes import set_committed_value
+from sqlalchemy.orm.util import identity_key
 
 from src.models.models import (
     Account,
     AccountType,
     Category,
+    MonthlyCategoryTotal,
+    MonthlyTotalDeltas,
     Transaction,
     TransactionType,
+    add_monthly_total_delta,
+    apply_monthly_total_deltas,
+    rebuild_monthly_totals,
+)
+
+# "Jan" .. "Dec", indexed by month - 1
+_MONTH_ABBR = tuple(calendar.month_abbr)[1:]
+
+# Anything accepted where a monetary amount is expected
+Amount = Union[Decimal, int, str, float]
+
+
+def _to_decimal(value: Amount) -> Decimal:
+    """Convert an amount to Decimal.
+
+    Decimals pass through untouched and ints/strings are parsed directly;
+    only floats go through str() so that 0.1 becomes Decimal("0.1").
+    """
+    if isinstance(value, Decimal):
+        return value
+    if isinstance(value, float):
+        return Decimal(str(value))
+    return Decimal(value)
+
+
+def _balance_deltas(rows: Iterable[Dict[str, Any]]) -> Dict[int, Decimal]:
+    """Net balance change per account for a set of new transactions.
+
+    Income is credited to the source account, expenses are debited from it,
+    and transfers move the amount from the source to the destination.
+
+    Args:
+        rows (Iterable[Dict[str, Any]]): Transaction column values with
+            Decimal amounts.
+
+    Returns:
+        Dict[int, Decimal]: Change to apply, keyed by account ID.
+    """
+    deltas: Dict[int, Decimal] = {}
+    for row in rows:
+        amount = row["amount"]
+        from_account_id = row["from_account_id"]
+        if row["type"] == TransactionType.INCOME:
+            deltas[from_account_id] = deltas.get(from_account_id, 0) + amount
+        else:
+            deltas[from_account_id] = deltas.get(from_account_id, 0) - amount
+            to_account_id = row.get("to_account_id")
+            if row["type"] == TransactionType.TRANSFER and to_account_id:
+                deltas[to_account_id] = deltas.get(to_account_id, 0) + amount
+    return deltas
+
+
+def _changed_balance_deltas(
+    old_rows: Iterable[Dict[str, Any]], new_rows: Iterable[Dict[str, Any]]
+) -> Dict[int, Decimal]:
+    """Net balance change per account for rewritten transactions.
+
+    The old rows' effect on balances is reversed and the new rows' effect
+    applied; accounts whose balance ends up unchanged are left out.
+
+    Args:
+        old_rows (Iterable[Dict[str, Any]]): Column values before the change.
+        new_rows (Iterable[Dict[str, Any]]): Column values after the change.
+
+    Returns:
+        Dict[int, Decimal]: Change to apply, keyed by account ID.
+    """
+    deltas = _balance_deltas(new_rows)
+    for account_id, delta in _balance_deltas(old_rows).items():
+        deltas[account_id] = deltas.get(account_id, 0) - delta
+    return {key: delta for key, delta in deltas.items() if delta}
+
+
+# Transaction columns that determine its effect on balances
+_BALANCE_COLUMNS = ("type", "amount", "from_account_id", "to_account_id")
+
+
+def _balance_row(transaction: Transaction) -> Dict[str, Any]:
+    """Column values of a transaction as read by _balance_deltas."""
+    row = {name: getattr(transaction, name) for name in _BALANCE_COLUMNS}
+    row["amount"] = _to_decimal(row["amount"])
+    return row
+
+
+# Transaction amount signed by its effect on balances: income adds,
+# expenses subtract and transfers net to zero
+_SIGNED_AMOUNT = case(
+    (Transaction.type == TransactionType.INCOME, Transaction.amount),
+    (Transaction.type == TransactionType.EXPENSE, -Transaction.amount),
+    else_=0,
 )
 
 
+# Effect of a transaction on its source account: income credits it,
+# expenses and outgoing transfers debit it
+_SOURCE_ACCOUNT_AMOUNT = case(
+    (Transaction.type == TransactionType.INCOME, Transaction.amount),
+    else_=-Transaction.amount,
+)
+
+# Label for transactions whose category is missing in summaries
+UNCATEGORIZED = "Uncategorized"
+
+# Core INSERT for single transactions, built once; SQLAlchemy's compiled
+# cache keys on the statement, so repeated executions skip compilation
+_INSERT_TRANSACTION = insert(Transaction.__table__)
+
+
 class FinanceManager:
     """Main class for managing financial operations and data."""
 
-    def __init__(self, db: Session) -> None:
+    # Seconds a summary of the current (or a future) month stays cached;
+    # summaries of past months are kept until a write invalidates them.
+    MONTHLY_SUMMARY_TTL = 60
+
+    def __init__(self, db: Session, auto_commit: bool = True) -> None:
         """Initialize the finance manager.
 
         Args:
             db (Session): SQLAlchemy database session.
+            auto_commit (bool, optional): Commit after every write. When
+                False, writes are only flushed and the caller commits.
+                Defaults to True.
         """
         self.db = db
+        self.auto_commit = auto_commit
+        self._in_atomic = False
+        # Lookups by ID, kept until the session commits or rolls back
+        self._account_cache: Dict[int, Account] = {}
+        self._category_cache: Dict[int, Category] = {}
+        event.listen(db, "after_commit", self._on_session_end)
+        event.listen(db, "after_rollback", self._on_rollback)
+        # (year, month) -> (expiry from time.monotonic() or None, summary)
+        self._monthly_cache: Dict[
+            Tuple[int, int], Tuple[Optional[float], Dict[str, Any]]
+        ] = {}
+        # months -> (expiry from time.monotonic(), trend data)
+        self._trends_cache: Dict[int, Tuple[float, List[Tuple]]] = {}
+        # Invalidate for every flushed Transaction change, including ones
+        # made on ORM objects directly rather than through this manager
+        event.listen(db, "after_flush", self._on_flush)
+
+    def _invalidate_monthly_summaries(self, *dates: Optional[datetime]) -> None:
+        """Drop cached monthly summaries for the months of the given dates.
+
+        A None date means the affected month is unknown (for example a
+        transaction using the column default), so the whole cache is cleared.
+        Cached trends span several months and are always dropped.
+        """
+        if not dates:
+            return
+        self._trends_cache.clear()
+        for date in dates:
+            if date is None:
+                self._monthly_cache.clear()
+                return
+            self._monthly_cache.pop((date.year, date.month), None)
+
+    def _on_flush(self, session: Session, flush_context: Any) -> None:
+        """Session event hook that invalidates months of flushed transactions."""
+        dates: List[Optional[datetime]] = []
+        for obj in itertools.chain(session.new, session.dirty, session.deleted):
+            if not isinstance(obj, Transaction):
+                continue
+            state = inspect(obj)
+            # Read loaded values only; an unloaded date is treated as
+            # unknown, which clears the whole cache
+            dates.append(state.dict.get("date"))
+            dates.extend(state.attrs.date.history.deleted)
+        self._invalidate_monthly_summaries(*dates)
+
+    def clear_caches(self) -> None:
+        """Forget memoized account and category lookups.
+
+        Called automatically when the session commits or rolls back; the
+        GUI can also call it between top-level user actions.
+        """
+        self._account_cache.clear()
+        self._category_cache.clear()
+
+    def _apply_balance_deltas(self, deltas: Dict[int, Decimal]) -> None:
+        """Add per-account changes to balances with one executemany UPDATE.
+
+        Args:
+            deltas (Dict[int, Decimal]): Change to apply, keyed by account ID.
+        """
+        if not deltas:
+            return
+        accounts = Account.__table__
+        self.db.execute(
+            update(accounts)
+            .where(accounts.c.id == bindparam("account_id"))
+            .values(balance=accounts.c.balance + bindparam("delta")),
+            [
+                {"account_id": account_id, "delta": delta}
+                for account_id, delta in deltas.items()
+            ],
+        )
+        # The UPDATE bypasses loaded Account instances; reload their
+        # balance on next access
+        for account_id in deltas:
+            account = self.db.identity_map.get(identity_key(Account, account_id))
+            if account is not None:
+                self.db.expire(account, ["balance"])
+
+    def _on_session_end(self, session: Session) -> None:
+        """Session event hook that drops the lookup caches."""
+        self.clear_caches()
+
+    def _on_rollback(self, session: Session) -> None:
+        """Session event hook that also drops summaries of discarded writes."""
+        self.clear_caches()
+        self._monthly_cache.clear()
+        self._trends_cache.clear()
+
+    def _commit(self, *inserted: Any) -> None:
+        """Commit the session, or only flush it when auto_commit is off.
+
+        Committing expires every object as usual. Objects passed as
+        ``inserted`` were just created, and their flushed column values
+        (with the IDs from the INSERT) are exactly what was written, so
+        those values are restored as committed state; otherwise the
+        caller's first attribute access would re-SELECT the row.
+        """
+        if not self.auto_commit:
+            self.db.flush()
+            return
+        if not inserted or not self.db.expire_on_commit:
+            self.db.commit()
+            return
+
+        self.db.flush()
+        written = []
+        for obj in inserted:
+            state = inspect(obj)
+            written.append(
+                (
+                    obj,
+                    {
+                        attr.key: state.dict[attr.key]
+                        for attr in state.mapper.column_attrs
+                        if attr.key in state.dict
+                    },
+                )
+            )
+        self.db.commit()
+        for obj, values in written:
+            for key, value in values.items():
+                set_committed_value(obj, key, value)
+
+    @contextmanager
+    def atomic(self) -> Iterator["FinanceManager"]:
+        """Group several writes into a single database transaction.
+
+        Writes inside the block are flushed rather than committed; the block
+        commits once on success and rolls back if it raises. Nested blocks
+        join the outermost one.
+
+        Yields:
+            FinanceManager: This finance manager.
+        """
+        if self._in_atomic:
+            yield self
+            return
+
+        auto_commit = self.auto_commit
+        self.auto_commit = False
+        self._in_atomic = True
+        try:
+            yield self
+            self.db.commit()
+        except BaseException:
+            # The rollback hook also drops summaries computed in the block
+            self.db.rollback()
+            raise
+        finally:
+            self.auto_commit = auto_commit
+            self._in_atomic = False
 
     # Account Management Methods
     def get_accounts(self) -> List[Account]:
@@ -34,7 +319,7 @@ class FinanceManager:
         Returns:
             List[Account]: List of all accounts.
         """
-        return self.db.query(Account).all()
+        return self.db.execute(select(Account)).scalars().all()
 
     def get_account(self, account_id: int) -> Optional[Account]:
         """Get an account by its ID.
@@ -45,46 +330,93 @@ class FinanceManager:
         Returns:
             Optional[Account]: The account if found, None otherwise.
         """
-        return self.db.get(Account, account_id)
+        account = self._account_cache.get(account_id)
+        if account is None:
+            account = self.db.get(Account, account_id)
+            if account is not None:
+                self._account_cache[account_id] = account
+        return account
 
     def add_account(
-        self, name: str, account_type: AccountType, balance: float = 0.0
+        self, name: str, account_type: AccountType, balance: Amount = 0
     ) -> Account:
         """Add a new account.
 
         Args:
             name (str): Account name.
             account_type (AccountType): Type of account.
-            balance (float, optional): Initial balance. Defaults to 0.0.
+            balance (Amount, optional): Initial balance. Defaults to 0.
 
         Returns:
             Account: The created account.
         """
         account = Account(
-            name=name, type=account_type, balance=Decimal(str(balance))
+            name=name, type=account_type, balance=_to_decimal(balance)
         )
         self.db.add(account)
-        self.db.commit()
+        self._commit(account)
         return account
 
     def update_account_balance(
-        self, account_id: int, new_balance: float
+        self, account_id: int, new_balance: Amount
     ) -> Optional[Account]:
         """Update an account's balance.
 
         Args:
             account_id (int): The account ID to update.
-            new_balance (float): The new balance amount.
+            new_balance (Amount): The new balance amount.
 
         Returns:
             Optional[Account]: The updated account if found, None otherwise.
         """
         account = self.get_account(account_id)
         if account:
-            account.balance = Decimal(str(new_balance))
-            self.db.commit()
+            account.balance = _to_decimal(new_balance)
+            self._commit()
         return account
 
+    def get_total_balance(self) -> Decimal:
+        """Get the combined balance of all accounts.
+
+        Returns:
+            Decimal: Sum of all account balances, summed in SQL.
+        """
+        return self.db.query(
+            func.coalesce(func.sum(Account.balance), 0)
+        ).scalar() or Decimal("0")
+
+    def recompute_balances(self) -> None:
+        """Recompute every account balance from its transactions.
+
+        A repair tool for balances that drifted from the transaction
+        history, run as a single UPDATE with correlated subqueries. It
+        treats the transactions as the complete history: a balance that was
+        entered when creating an account, without a matching income
+        transaction, is lost.
+        """
+        account_id = Account.__table__.c.id
+        source_total = (
+            select(func.coalesce(func.sum(_SOURCE_ACCOUNT_AMOUNT), 0))
+            .where(Transaction.from_account_id == account_id)
+            .scalar_subquery()
+        )
+        transfers_in = (
+            select(func.coalesce(func.sum(Transaction.amount), 0))
+            .where(
+                Transaction.to_account_id == account_id,
+                Transaction.type == TransactionType.TRANSFER,
+            )
+            .scalar_subquery()
+        )
+        self.db.execute(
+            update(Account.__table__).values(balance=source_total + transfers_in)
+        )
+        # The UPDATE bypasses loaded Account instances
+        for obj in list(self.db.identity_map.values()):
+            if isinstance(obj, Account):
+                self.db.expire(obj, ["balance"])
+        self._commit()
+
     # Category Management Methods
     def get_categories(self) -> List[Category]:
         """Get all categories.
@@ -92,7 +424,7 @@ class FinanceManager:
         Returns:
             List[Category]: List of all categories.
         """
-        return self.db.query(Category).all()
+        return self.db.execute(select(Category)).scalars().all()
 
     def get_category(self, category_id: int) -> Optional[Category]:
         """Get a category by its ID.
@@ -103,7 +435,12 @@ class FinanceManager:
         Returns:
             Optional[Category]: The category if found, None otherwise.
         """
-        return self.db.get(Category, category_id)
+        category = self._category_cache.get(category_id)
+        if category is None:
+            category = self.db.get(Category, category_id)
+            if category is not None:
+                self._category_cache[category_id] = category
+        return category
 
     def add_category(
         self,
@@ -123,7 +460,7 @@ class FinanceManager:
         """
         category = Category(name=name, type=type, color_code=color_code)
         self.db.add(category)
-        self.db.commit()
+        self._commit(category)
         return category
 
     def update_category(
@@ -152,7 +489,7 @@ class FinanceManager:
                 category.type = type
             if color_code is not None:
                 category.color_code = color_code
-            self.db.commit()
+            self._commit()
         return category
 
     def delete_category(self, category_id: int) -> bool:
@@ -167,7 +504,8 @@ class FinanceManager:
         category = self.get_category(category_id)
         if category:
             self.db.delete(category)
-            self.db.commit()
+            self._category_cache.pop(category_id, None)
+            self._commit()
             return True
         return False
 
@@ -181,32 +519,38 @@ class FinanceManager:
         Returns:
             Optional[Transaction]: The transaction if found, None otherwise.
         """
-        return (
-            self.db.query(Transaction)
+        # For a single row one joined query beats the mapper's default of
+        # a follow-up IN query per relationship
+        stmt = (
+            select(Transaction)
             .options(
                 joinedload(Transaction.from_account),
                 joinedload(Transaction.to_account),
                 joinedload(Transaction.category),
             )
-            .filter(Transaction.id == transaction_id)
-            .first()
+            .where(Transaction.id == transaction_id)
         )
+        return self.db.execute(stmt).scalar_one_or_none()
 
     def get_transactions(
         self, limit: Optional[int] = None
     ) -> List[Transaction]:
         """Get all transactions, optionally limited.
 
+        Ordering and the limit are applied in SQL. Without a limit every
+        transaction is loaded into memory; use iter_transactions() to scan
+        the full history in batches instead.
+
         Args:
             limit (Optional[int], optional): Max number to return. Defaults to None.
 
         Returns:
             List[Transaction]: List of transactions.
         """
-        query = self.db.query(Transaction).order_by(desc(Transaction.date))
+        stmt = select(Transaction).order_by(desc(Transaction.date))
         if limit:
-            query = query.limit(limit)
-        return query.all()
+            stmt = stmt.limit(limit)
+        return self.db.execute(stmt).scalars().all()
 
     def get_recent_transactions(self, limit: int = 5) -> List[Transaction]:
         """Get recent transactions.
@@ -217,42 +561,69 @@ class FinanceManager:
         Returns:
             List[Transaction]: List of recent transactions.
         """
-        return (
-            self.db.query(Transaction)
-            .options(
-                joinedload(Transaction.from_account),
-                joinedload(Transaction.to_account),
-                joinedload(Transaction.category),
+        stmt = select(Transaction).order_by(desc(Transaction.date)).limit(limit)
+        return self.db.execute(stmt).scalars().all()
+
+    def get_recent_transactions_rows(self, limit: int = 5) -> List[Row]:
+        """Get recent transactions for display, returning plain rows.
+
+        A read-only counterpart to get_recent_transactions: one joined query
+        selecting only the displayed columns, without building ORM objects.
+
+        Args:
+            limit (int, optional): Max number to return. Defaults to 5.
+
+        Returns:
+            List[Row]: Rows with id, date, type, amount, description,
+            account_name, category_name and category_color, newest first.
+        """
+        stmt = (
+            select(
+                Transaction.id,
+                Transaction.date,
+                Transaction.type,
+                Transaction.amount,
+                Transaction.description,
+                Account.name.label("account_name"),
+                Category.name.label("category_name"),
+                Category.color_code.label("category_color"),
             )
+            .join(Account, Account.id == Transaction.from_account_id)
+            .outerjoin(Category, Category.id == Transaction.category_id)
             .order_by(desc(Transaction.date))
             .limit(limit)
-            .all()
         )
+        return self.db.execute(stmt).all()
 
-    def search_transactions(
+    def _transaction_search_query(
         self,
         start_date: Optional[datetime] = None,
         end_date: Optional[datetime] = None,
         transaction_type: Optional[str] = None,
         account_id: Optional[int] = None,
-    ) -> List[Transaction]:
-        """Search transactions with filters.
-
-        Args:
-            start_date (Optional[datetime], optional): Start date. Defaults to None.
-            end_date (Optional[datetime], optional): End date. Defaults to None.
-            transaction_type (Optional[str], optional): Type filter. Defaults to None.
-            account_id (Optional[int], optional): Account filter. Defaults to None.
+        category_id: Optional[int] = None,
+    ):
+        """Build the filtered, newest-first query behind transaction searches.
 
-        Returns:
-            List[Transaction]: List of matching transactions.
+        Related rows come from the mapper's selectin loading: one IN query
+        per relationship, which keeps result rows narrow for long lists and
+        works per batch when the query is streamed.
         """
-        query = self.db.query(Transaction).options(
-            joinedload(Transaction.from_account),
-            joinedload(Transaction.to_account),
-            joinedload(Transaction.category),
+        query = self.db.query(Transaction)
+        return self._filter_transactions(
+            query, start_date, end_date, transaction_type, account_id, category_id
         )
 
+    @staticmethod
+    def _filter_transactions(
+        query,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+        transaction_type: Optional[str] = None,
+        account_id: Optional[int] = None,
+        category_id: Optional[int] = None,
+    ):
+        """Apply the transaction search filters and newest-first ordering."""
         if start_date:
             query = query.filter(Transaction.date >= start_date)
         if end_date:
@@ -266,11 +637,124 @@ class FinanceManager:
                     Transaction.to_account_id == account_id,
                 )
             )
+        if category_id:
+            query = query.filter(Transaction.category_id == category_id)
+
+        return query.order_by(desc(Transaction.date))
+
+    def search_transactions(
+        self,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+        transaction_type: Optional[str] = None,
+        account_id: Optional[int] = None,
+        category_id: Optional[int] = None,
+    ) -> List[Transaction]:
+        """Search transactions with filters.
+
+        Args:
+            start_date (Optional[datetime], optional): Start date. Defaults to None.
+            end_date (Optional[datetime], optional): End date. Defaults to None.
+            transaction_type (Optional[str], optional): Type filter. Defaults to None.
+            account_id (Optional[int], optional): Account filter. Defaults to None.
+            category_id (Optional[int], optional): Category filter. Defaults to None.
+
+        Returns:
+            List[Transaction]: List of matching transactions.
+        """
+        return self._transaction_search_query(
+            start_date, end_date, transaction_type, account_id, category_id
+        ).all()
+
+    def search_transactions_rows(
+        self,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+        transaction_type: Optional[str] = None,
+        account_id: Optional[int] = None,
+        category_id: Optional[int] = None,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None,
+    ) -> List[Row]:
+        """Search transactions for display, returning plain rows.
 
-        return query.order_by(desc(Transaction.date)).all()
+        A read-only counterpart to search_transactions that selects just the
+        columns a transaction list shows, with account and category names
+        joined in, so no ORM objects are built. Use search_transactions when
+        the results will be modified.
+
+        Args:
+            start_date (Optional[datetime], optional): Start date. Defaults to None.
+            end_date (Optional[datetime], optional): End date. Defaults to None.
+            transaction_type (Optional[str], optional): Type filter. Defaults to None.
+            account_id (Optional[int], optional): Account filter. Defaults to None.
+            category_id (Optional[int], optional): Category filter. Defaults to None.
+            limit (Optional[int], optional): Maximum rows. Defaults to None.
+            offset (Optional[int], optional): Rows to skip. Defaults to None.
+
+        Returns:
+            List[Row]: Rows with id, date, type, amount, description,
+            from_account_name, to_account_name and category_name, newest first.
+        """
+        from_account = aliased(Account)
+        to_account = aliased(Account)
+        query = (
+            self.db.query(
+                Transaction.id,
+                Transaction.date,
+                Transaction.type,
+                Transaction.amount,
+                Transaction.description,
+                from_account.name.label("from_account_name"),
+                to_account.name.label("to_account_name"),
+                Category.name.label("category_name"),
+            )
+            .outerjoin(from_account, from_account.id == Transaction.from_account_id)
+            .outerjoin(to_account, to_account.id == Transaction.to_account_id)
+            .outerjoin(Category, Category.id == Transaction.category_id)
+        )
+        query = self._filter_transactions(
+            query, start_date, end_date, transaction_type, account_id, category_id
+        )
+        return query.offset(offset).limit(limit).all()
+
+    def iter_transactions(
+        self,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+        transaction_type: Optional[str] = None,
+        account_id: Optional[int] = None,
+        category_id: Optional[int] = None,
+        batch_size: int = 1000,
+    ) -> Iterator[Transaction]:
+        """Stream transactions matching the search filters.
+
+        Unlike search_transactions, rows are fetched from the cursor in
+        batches as they are consumed, so memory does not grow with the
+        number of matches.
+
+        Args:
+            start_date (Optional[datetime], optional): Start date. Defaults to None.
+            end_date (Optional[datetime], optional): End date. Defaults to None.
+            transaction_type (Optional[str], optional): Type filter. Defaults to None.
+            account_id (Optional[int], optional): Account filter. Defaults to None.
+            category_id (Optional[int], optional): Category filter. Defaults to None.
+            batch_size (int, optional): Rows fetched per batch. Defaults to 1000.
+
+        Returns:
+            Iterator[Transaction]: Matching transactions, newest first.
+        """
+        return iter(
+            self._transaction_search_query(
+                start_date, end_date, transaction_type, account_id, category_id
+            ).yield_per(batch_size)
+        )
 
     def create_transaction(self, **data: Any) -> Transaction:
-        """Create a new transaction.
+        """Create a new transaction and update the affected balances.
+
+        Balances change the same way as in add_transactions, which is the
+        entry point for creating many transactions at once.
 
         Args:
             **data: Transaction data fields.
@@ -279,16 +763,48 @@ class FinanceManager:
             Transaction: The created transaction.
         """
         if "amount" in data:
-            data["amount"] = Decimal(str(data["amount"]))
+            data["amount"] = _to_decimal(data["amount"])
         transaction = Transaction(**data)
         self.db.add(transaction)
-        self.db.commit()
+        self._apply_balance_deltas(_balance_deltas([data]))
+        self._commit(transaction)
         return transaction
 
+    def insert_transaction_core(self, **data: Any) -> int:
+        """Insert a transaction row without building an ORM object.
+
+        A faster path than create_transaction for high-volume ingestion.
+        Account balances are adjusted as in create_transaction. ORM events
+        do not fire for it, so the monthly totals are updated here.
+
+        Args:
+            **data: Transaction column values.
+
+        Returns:
+            int: The ID of the inserted transaction.
+        """
+        if "amount" in data:
+            data["amount"] = _to_decimal(data["amount"])
+        data.setdefault("date", datetime.utcnow())
+        result = self.db.execute(_INSERT_TRANSACTION, data)
+        deltas: MonthlyTotalDeltas = {}
+        add_monthly_total_delta(
+            deltas, data["date"], data["category_id"], data["type"], data["amount"]
+        )
+        apply_monthly_total_deltas(self.db, deltas)
+        self._apply_balance_deltas(_balance_deltas([data]))
+        self._commit()
+        self._invalidate_monthly_summaries(data.get("date"))
+        return result.inserted_primary_key[0]
+
     def update_transaction(
         self, transaction_id: int, **data: Any
     ) -> Optional[Transaction]:
-        """Update an existing transaction.
+        """Update an existing transaction and the affected balances.
+
+        The old values' effect on balances is reversed and the new values'
+        effect applied, so changing the amount, type or accounts keeps the
+        balances in step.
 
         Args:
             transaction_id (int): The transaction ID to update.
@@ -300,14 +816,18 @@ class FinanceManager:
         transaction = self.get_transaction(transaction_id)
         if transaction:
             if "amount" in data:
-                data["amount"] = Decimal(str(data["amount"]))
+                data["amount"] = _to_decimal(data["amount"])
+            old_row = _balance_row(transaction)
             for key, value in data.items():
                 setattr(transaction, key, value)
-            self.db.commit()
+            self._apply_balance_deltas(
+                _changed_balance_deltas([old_row], [_balance_row(transaction)])
+            )
+            self._commit()
         return transaction
 
     def delete_transaction(self, transaction_id: int) -> bool:
-        """Delete a transaction.
+        """Delete a transaction and reverse its effect on balances.
 
         Args:
             transaction_id (int): The transaction ID to delete.
@@ -317,14 +837,18 @@ class FinanceManager:
         """
         transaction = self.get_transaction(transaction_id)
         if transaction:
+            deltas = _balance_deltas([_balance_row(transaction)])
+            self._apply_balance_deltas(
+                {account_id: -delta for account_id, delta in deltas.items()}
+            )
             self.db.delete(transaction)
-            self.db.commit()
+            self._commit()
             return True
         return False
 
     def add_transaction(
         self,
-        amount: float,
+        amount: Amount,
         transaction_type: TransactionType,
         account_id: int,
         category_id: int,
@@ -334,7 +858,7 @@ class FinanceManager:
         """Add a new transaction.
 
         Args:
-            amount (float): Transaction amount.
+            amount (Amount): Transaction amount.
             transaction_type (TransactionType): Type of transaction.
             account_id (int): Account ID.
             category_id (int): Category ID.
@@ -347,7 +871,7 @@ class FinanceManager:
         if date is None:
             date = datetime.now()
 
-        amount_decimal = Decimal(str(amount))
+        amount_decimal = _to_decimal(amount)
         transaction = Transaction(
             amount=amount_decimal,
             type=transaction_type,
@@ -357,18 +881,130 @@ class FinanceManager:
             date=date,
         )
 
-        # Update account balance
-        account = self.get_account(account_id)
-        if account:
-            if transaction_type == TransactionType.INCOME:
-                account.balance += amount_decimal
-            else:
-                account.balance -= amount_decimal
+        # Update account balance in SQL rather than loading the account;
+        # both statements are committed together below
+        self._apply_balance_deltas(
+            _balance_deltas(
+                [
+                    {
+                        "amount": amount_decimal,
+                        "type": transaction_type,
+                        "from_account_id": account_id,
+                    }
+                ]
+            )
+        )
 
         self.db.add(transaction)
-        self.db.commit()
+        self._commit(transaction)
         return transaction
 
+    def add_transactions(
+        self, rows: List[Dict[str, Any]], batch_size: int = 10_000
+    ) -> None:
+        """Insert many transactions and update account balances in bulk.
+
+        Rows are dicts of Transaction column values, such as those returned
+        by the DataManager import methods. Income is credited to the source
+        account, expenses are debited from it, and transfers move the amount
+        from the source to the destination account. Everything is committed
+        in a single transaction.
+
+        Args:
+            rows (List[Dict[str, Any]]): Transaction column values.
+            batch_size (int, optional): Rows per INSERT batch. Defaults to 10_000.
+        """
+        now = datetime.utcnow()
+        rows = [
+            dict(row, amount=_to_decimal(row["amount"]), date=row.get("date") or now)
+            for row in rows
+        ]
+        if not rows:
+            return
+
+        monthly_deltas: MonthlyTotalDeltas = {}
+        for row in rows:
+            add_monthly_total_delta(
+                monthly_deltas,
+                row["date"],
+                row["category_id"],
+                row["type"],
+                row["amount"],
+            )
+
+        try:
+            for start in range(0, len(rows), batch_size):
+                self.db.execute(insert(Transaction), rows[start : start + batch_size])
+
+            self._apply_balance_deltas(_balance_deltas(rows))
+            # Bulk inserts bypass the ORM events that maintain the rollup
+            apply_monthly_total_deltas(self.db, monthly_deltas)
+            self._commit()
+        except Exception:
+            # Inside atomic() or with auto_commit off the caller owns the
+            # transaction, and rolling back would discard its other writes
+            if self.auto_commit and not self._in_atomic:
+                self.db.rollback()
+            raise
+
+        self._invalidate_monthly_summaries(*(row.get("date") for row in rows))
+
+    def bulk_update_transactions(self, mappings: List[Dict[str, Any]]) -> None:
+        """Update many transactions by primary key in one executemany.
+
+        Each mapping must contain the transaction "id" plus the columns to
+        change. Account balances are adjusted by the difference between the
+        old and new values, read with one SELECT before the update. The
+        monthly totals are rebuilt from scratch.
+
+        Args:
+            mappings (List[Dict[str, Any]]): Column values keyed by name.
+        """
+        mappings = [
+            dict(m, amount=_to_decimal(m["amount"])) if "amount" in m else m
+            for m in mappings
+        ]
+        if not mappings:
+            return
+
+        try:
+            old_rows = {
+                row.id: row._asdict()
+                for row in self.db.execute(
+                    select(
+                        Transaction.id,
+                        *(getattr(Transaction, c) for c in _BALANCE_COLUMNS),
+                    ).where(Transaction.id.in_([m["id"] for m in mappings]))
+                )
+            }
+            # Later mappings for the same ID apply on top of earlier ones
+            new_rows: Dict[int, Dict[str, Any]] = {}
+            for mapping in mappings:
+                old_row = old_rows.get(mapping["id"])
+                if old_row is None:
+                    continue
+                row = dict(new_rows.get(mapping["id"], old_row))
+                row.update(
+                    (c, mapping[c]) for c in _BALANCE_COLUMNS if c in mapping
+                )
+                new_rows[mapping["id"]] = row
+
+            self.db.execute(update(Transaction), mappings)
+            self._apply_balance_deltas(
+                _changed_balance_deltas(old_rows.values(), new_rows.values())
+            )
+            rebuild_monthly_totals(self.db)
+            self._commit()
+        except Exception:
+            # Inside atomic() or with auto_commit off the caller owns the
+            # transaction, and rolling back would discard its other writes
+            if self.auto_commit and not self._in_atomic:
+                self.db.rollback()
+            raise
+
+        # The previous dates of the updated rows are unknown here
+        self._invalidate_monthly_summaries(None)
+
     def get_daily_balances(
         self, start_date: datetime, end_date: datetime
     ) -> Dict[datetime, Decimal]:
@@ -382,57 +1018,49 @@ class FinanceManager:
             Dict[datetime, Decimal]: Daily balances.
         """
         daily_balances = {}
-        current_date = start_date
 
-        # Get initial balance before start date
-        initial_balance = sum(
-            account.balance for account in self.get_accounts()
+        # Balance as of end_date: current account totals minus everything
+        # booked after it, computed in one round trip
+        total_balance = (
+            self.db.query(func.coalesce(func.sum(Account.balance), 0))
+            .scalar_subquery()
         )
-        previous_transactions_sum = self.db.query(
-            func.sum(
-                case(
-                    (
-                        Transaction.type == TransactionType.INCOME,
-                        Transaction.amount,
-                    ),
-                    (
-                        Transaction.type == TransactionType.EXPENSE,
-                        -Transaction.amount,
-                    ),
-                    else_=0,
-                )
-            )
-        ).filter(Transaction.date > end_date).scalar() or Decimal("0")
-
-        running_balance = initial_balance - previous_transactions_sum
-
-        while current_date <= end_date:
-            # Get transactions for current date
-            daily_transactions = self.db.query(
-                func.sum(
-                    case(
-                        (
-                            Transaction.type == TransactionType.INCOME,
-                            Transaction.amount,
-                        ),
-                        (
-                            Transaction.type == TransactionType.EXPENSE,
-                            -Transaction.amount,
-                        ),
-                        else_=0,
-                    )
-                )
-            ).filter(
-                and_(
-                    func.date(Transaction.date) == current_date.date(),
-                )
-            ).scalar() or Decimal(
-                "0"
+        later_transactions_sum = (
+            self.db.query(func.coalesce(func.sum(_SIGNED_AMOUNT), 0))
+            .filter(Transaction.date > end_date)
+            .scalar_subquery()
+        )
+        running_balance = self.db.query(
+            total_balance - later_transactions_sum
+        ).scalar() or Decimal("0")
+
+        # Net change per day for the whole range in a single grouped query,
+        # filtered on whole-day bounds of the raw column so the date index
+        # can be used
+        first_day = datetime.combine(start_date.date(), datetime.min.time())
+        after_last_day = datetime.combine(
+            end_date.date() + timedelta(days=1), datetime.min.time()
+        )
+        day = func.date(Transaction.date)
+        daily_totals = {
+            str(row_day): total or Decimal("0")
+            for row_day, total in self.db.query(day, func.sum(_SIGNED_AMOUNT))
+            .filter(
+                Transaction.date >= first_day,
+                Transaction.date < after_last_day,
             )
+            .group_by(day)
+        }
 
-            running_balance += daily_transactions
+        days = [
+            start_date + timedelta(days=offset)
+            for offset in range((end_date - start_date).days + 1)
+        ]
+        for current_date in days:
+            running_balance += daily_totals.get(
+                current_date.date().isoformat(), Decimal("0")
+            )
             daily_balances[current_date] = running_balance
-            current_date += timedelta(days=1)
 
         return daily_balances
 
@@ -447,15 +1075,16 @@ class FinanceManager:
         Returns:
             List[Tuple[str, Decimal, Decimal]]: Monthly income/expense pairs.
         """
+        totals = self._monthly_totals(datetime(year, 1, 1), datetime(year + 1, 1, 1))
+
         months = []
         for month in range(1, 13):
-            summary = self.get_monthly_summary(year, month)
-            month_name = datetime(year, month, 1).strftime("%b")
+            month_totals = totals.get((year, month), {})
             months.append(
                 (
-                    month_name,
-                    summary["total_income"],
-                    summary["total_expenses"],
+                    _MONTH_ABBR[month - 1],
+                    month_totals.get(TransactionType.INCOME, Decimal("0")),
+                    month_totals.get(TransactionType.EXPENSE, Decimal("0")),
                 )
             )
         return months
@@ -463,54 +1092,137 @@ class FinanceManager:
     def get_trends(
         self, months: int = 12
     ) -> List[Tuple[datetime, Decimal, Decimal, float]]:
-        """Get trend data for the last N months.
+        """Get trend data for the last N calendar months.
+
+        Results are cached for MONTHLY_SUMMARY_TTL seconds, since they
+        include the current month, and dropped on any transaction write.
+
+        Args:
+            months (int, optional): Number of months, including the current
+                one. Defaults to 12.
+
+        Returns:
+            List[Tuple[datetime, Decimal, Decimal, float]]: Monthly trend
+            data, oldest first, keyed by the first day of each month.
+        """
+        cached = self._trends_cache.get(months)
+        if cached is not None and time.monotonic() < cached[0]:
+            return list(cached[1])
+
+        trend_data = self._query_trends(months)
+        self._trends_cache[months] = (
+            time.monotonic() + self.MONTHLY_SUMMARY_TTL,
+            trend_data,
+        )
+        return list(trend_data)
+
+    def _query_trends(
+        self, months: int
+    ) -> List[Tuple[datetime, Decimal, Decimal, float]]:
+        """Compute the trend data behind get_trends.
 
         Args:
-            months (int, optional): Number of months. Defaults to 12.
+            months (int): Number of months, including the current one.
 
         Returns:
             List[Tuple[datetime, Decimal, Decimal, float]]: Monthly trend data.
         """
-        end_date = datetime.now()
-        start_date = end_date - timedelta(days=months * 30)  # Approximate
+        # The first day of each of the last N calendar months, ending with
+        # the current one, from a flat month index (year * 12 + month - 1)
+        now = datetime.now()
+        last_month = now.year * 12 + now.month - 1
+        month_starts = [
+            datetime(index // 12, index % 12 + 1, 1)
+            for index in range(last_month - months + 1, last_month + 2)
+        ]
+        if len(month_starts) < 2:
+            return []
+
+        # Totals for the whole span in one query; the extra month start
+        # above is the exclusive end of the range
+        totals = self._monthly_totals(month_starts[0], month_starts[-1])
+        month_starts.pop()
 
         trend_data = []
-        current_date = start_date
-
-        while current_date <= end_date:
+        for current_date in month_starts:
             year = current_date.year
             month = current_date.month
-            summary = self.get_monthly_summary(year, month)
+            month_totals = totals.get((year, month), {})
+            total_income = month_totals.get(TransactionType.INCOME, Decimal("0"))
+            total_expenses = month_totals.get(
+                TransactionType.EXPENSE, Decimal("0")
+            )
 
             # Calculate savings rate
             savings_rate = 0.0
-            if summary["total_income"] > 0:
+            if total_income > 0:
                 savings_rate = float(
-                    summary["net_savings"] / summary["total_income"] * 100
+                    (total_income - total_expenses) / total_income * 100
                 )
 
             trend_data.append(
                 (
                     current_date,
-                    summary["total_income"],
-                    summary["total_expenses"],
+                    total_income,
+                    total_expenses,
                     savings_rate,
                 )
             )
 
-            # Move to next month
-            if month == 12:
-                current_date = datetime(year + 1, 1, 1)
-            else:
-                current_date = datetime(year, month + 1, 1)
-
         return trend_data
 
+    def _monthly_totals(
+        self, start_date: datetime, end_date: datetime
+    ) -> Dict[Tuple[int, int], Dict[TransactionType, Decimal]]:
+        """Sum income and expenses per calendar month from the rollup table.
+
+        Args:
+            start_date (datetime): First day of the first month, inclusive.
+            end_date (datetime): First day of the month after the range.
+
+        Returns:
+            Dict[Tuple[int, int], Dict[TransactionType, Decimal]]: Totals by
+            transaction type, keyed by (year, month). Months without
+            transactions are absent.
+        """
+        # Flat month index (year * 12 + month - 1) bounds the range in one
+        # comparison instead of a (year, month) tuple comparison
+        month_index = MonthlyCategoryTotal.year * 12 + MonthlyCategoryTotal.month - 1
+        rows = (
+            self.db.query(
+                MonthlyCategoryTotal.year,
+                MonthlyCategoryTotal.month,
+                MonthlyCategoryTotal.type,
+                func.sum(MonthlyCategoryTotal.total),
+            )
+            .filter(
+                month_index >= start_date.year * 12 + start_date.month - 1,
+                month_index < end_date.year * 12 + end_date.month - 1,
+                MonthlyCategoryTotal.type.in_(
+                    (TransactionType.INCOME, TransactionType.EXPENSE)
+                ),
+            )
+            .group_by(
+                MonthlyCategoryTotal.year,
+                MonthlyCategoryTotal.month,
+                MonthlyCategoryTotal.type,
+            )
+        )
+
+        totals = {}
+        for row_year, row_month, transaction_type, total in rows:
+            totals.setdefault((row_year, row_month), {})[transaction_type] = total
+        return totals
+
     def get_monthly_summary(
         self, year: int, month: int
     ) -> Dict[str, Union[Decimal, int, Dict[str, Decimal]]]:
         """Get summary of transactions for a specific month.
 
+        Results are cached per month. Past months are kept until a
+        transaction in that month is flushed by the session; the
+        current month expires after MONTHLY_SUMMARY_TTL seconds.
+
         Args:
             year (int): Year to get data for.
             month (int): Month to get data for.
@@ -518,44 +1230,75 @@ class FinanceManager:
         Returns:
             Dict[str, Union[Decimal, int, Dict[str, Decimal]]]: Monthly summary.
         """
-        # Query for income
-        total_income = self.db.query(func.sum(Transaction.amount)).filter(
-            extract("year", Transaction.date) == year,
-            extract("month", Transaction.date) == month,
-            Transaction.type == TransactionType.INCOME,
-        ).scalar() or Decimal("0")
-
-        # Query for expenses
-        total_expenses = self.db.query(func.sum(Transaction.amount)).filter(
-            extract("year", Transaction.date) == year,
-            extract("month", Transaction.date) == month,
-            Transaction.type == TransactionType.EXPENSE,
-        ).scalar() or Decimal("0")
+        key = (year, month)
+        cached = self._monthly_cache.get(key)
+        if cached is not None:
+            expiry, summary = cached
+            if expiry is None or time.monotonic() < expiry:
+                return self._copy_summary(summary)
+
+        summary = self._query_monthly_summary(year, month)
+        now = datetime.now()
+        if key < (now.year, now.month):
+            expiry = None
+        else:
+            expiry = time.monotonic() + self.MONTHLY_SUMMARY_TTL
+        self._monthly_cache[key] = (expiry, summary)
+        return self._copy_summary(summary)
+
+    @staticmethod
+    def _copy_summary(summary: Dict[str, Any]) -> Dict[str, Any]:
+        """Copy a cached summary so callers cannot modify the cache."""
+        return dict(
+            summary, expense_by_category=dict(summary["expense_by_category"])
+        )
 
-        # Calculate net income (income - expenses)
-        net_income = total_income - total_expenses
+    def _query_monthly_summary(
+        self, year: int, month: int
+    ) -> Dict[str, Union[Decimal, int, Dict[str, Decimal]]]:
+        """Build a monthly summary from the monthly_category_totals rollup.
 
-        # For this implementation, net savings is the same as net income
-        net_savings = net_income
+        Args:
+            year (int): Year to get data for.
+            month (int): Month to get data for.
 
-        # Get expenses by category
-        expenses_by_category = (
+        Returns:
+            Dict[str, Union[Decimal, int, Dict[str, Decimal]]]: Monthly summary.
+        """
+        # Point read on the rollup maintained alongside the transactions,
+        # merged by category name in SQL; rows whose category no longer
+        # exists are grouped under UNCATEGORIZED instead of being dropped
+        category_name = func.coalesce(Category.name, UNCATEGORIZED)
+        rows = (
             self.db.query(
-                Category.name, func.sum(Transaction.amount).label("total")
+                MonthlyCategoryTotal.type,
+                category_name,
+                func.sum(MonthlyCategoryTotal.total),
             )
-            .join(Transaction, Transaction.category_id == Category.id)
+            .outerjoin(Category, Category.id == MonthlyCategoryTotal.category_id)
             .filter(
-                extract("year", Transaction.date) == year,
-                extract("month", Transaction.date) == month,
-                Transaction.type == TransactionType.EXPENSE,
+                MonthlyCategoryTotal.year == year,
+                MonthlyCategoryTotal.month == month,
             )
-            .group_by(Category.name)
+            .group_by(MonthlyCategoryTotal.type, category_name)
             .all()
         )
 
-        expense_by_category = {}
-        for category_name, total in expenses_by_category:
-            expense_by_category[category_name] = total
+        total_income = Decimal("0")
+        total_expenses = Decimal("0")
+        expense_by_category: Dict[str, Decimal] = {}
+        for transaction_type, name, total in rows:
+            if transaction_type == TransactionType.INCOME:
+                total_income += total
+            elif transaction_type == TransactionType.EXPENSE:
+                total_expenses += total
+                expense_by_category[name] = total
+
+        # Calculate net income (income - expenses)
+        net_income = total_income - total_expenses
+
+        # For this implementation, net savings is the same as net income
+        net_savings = net_income
 
         return {
             "total_income": total_income,
@@ -1,6 +1,6 @@
 """GUI package for the Finance Tracker application."""
 
-from .main_window import MainWindow
+from .main_window import MainWindow, apply_theme
 from .widgets.dashboard import DashboardWidget
 from .widgets.accounts import AccountsWidget
 from .widgets.transactions import TransactionsWidget
@@ -9,6 +9,7 @@ from .widgets.reports import ReportsWidget
 
 __all__ = [
     "MainWindow",
+    "apply_theme",
     "DashboardWidget",
     "AccountsWidget",
     "TransactionsWidget",
@@ -9,7 +9,7 @@ from PyQt6.QtWidgets import (
     QSizePolicy,
     QSpacerItem,
 )
-from PyQt6.QtCore import Qt
+from PyQt6.QtCore import Qt, QTimer
 import qdarktheme
 
 from ..core.finance_manager import FinanceManager
@@ -20,17 +20,34 @@ from .widgets.transactions import TransactionsWidget
 from .widgets.categories import CategoriesWidget
 from .widgets.reports import ReportsWidget
 from .dialogs.settings_dialog import SettingsDialog
-from .style import (
-    SIDEBAR_STYLE,
-    CONTENT_STYLE,
-    BUTTON_STYLE,
-    ACTIVE_BUTTON_STYLE,
-    TITLE_STYLE,
-)
+from .style import APP_STYLESHEET
 
 # Initialize logger
 logger = FinanceLogger(name="finance_gui", log_file="logs/gui.log")
 
+# Sidebar button labels
+_NAV_LABELS = {
+    "dashboard": "📊 Dashboard",
+    "accounts": "💰 Accounts",
+    "transactions": "💸 Transactions",
+    "categories": "🏷️ Categories",
+    "reports": "📈 Reports",
+    "settings": "⚙️ Settings",
+}
+
+
+def apply_theme(app):
+    """Apply the dark theme and the app's styles to the application.
+
+    The theme and APP_STYLESHEET go in as one stylesheet, set once before
+    any window is created, so Qt parses the styles a single time.
+
+    Args:
+        app (QApplication): The application instance.
+    """
+    app.setPalette(qdarktheme.load_palette("dark"))
+    app.setStyleSheet(qdarktheme.load_stylesheet("dark") + APP_STYLESHEET)
+
 
 class MainWindow(QMainWindow):
     """Main window of the Finance Tracker application."""
@@ -38,6 +55,15 @@ class MainWindow(QMainWindow):
     def __init__(self, finance_manager: FinanceManager):
         super().__init__()
         self.finance_manager = finance_manager
+
+        # Page refreshes are delayed briefly so that a burst of navigation
+        # clicks only refreshes the page the user ends up on
+        self._pending_refresh = None
+        self._refresh_timer = QTimer(self)
+        self._refresh_timer.setSingleShot(True)
+        self._refresh_timer.setInterval(50)
+        self._refresh_timer.timeout.connect(self._do_pending_refresh)
+
         self.init_ui()
 
     def init_ui(self):
@@ -58,26 +84,21 @@ class MainWindow(QMainWindow):
 
         # Create stacked widget for main content
         self.stacked_widget = QStackedWidget()
-        self.stacked_widget.setStyleSheet(CONTENT_STYLE)
-
-        # Create and add pages
-        self.dashboard = DashboardWidget(self.finance_manager)
-        self.accounts = AccountsWidget(self.finance_manager)
-        self.transactions = TransactionsWidget(self.finance_manager)
-        self.categories = CategoriesWidget(self.finance_manager)
-        self.reports = ReportsWidget(self.finance_manager)
-
-        self.stacked_widget.addWidget(self.dashboard)
-        self.stacked_widget.addWidget(self.accounts)
-        self.stacked_widget.addWidget(self.transactions)
-        self.stacked_widget.addWidget(self.categories)
-        self.stacked_widget.addWidget(self.reports)
+        self.stacked_widget.setObjectName("content")
+
+        # Pages are created the first time they are shown, so startup only
+        # pays for the dashboard
+        self._pages = {}
+        self._page_factories = {
+            "dashboard": DashboardWidget,
+            "accounts": AccountsWidget,
+            "transactions": TransactionsWidget,
+            "categories": CategoriesWidget,
+            "reports": ReportsWidget,
+        }
 
         main_layout.addWidget(self.stacked_widget)
 
-        # Set dark theme
-        self.set_theme()
-
         # Show dashboard by default
         self.show_dashboard()
 
@@ -85,7 +106,7 @@ class MainWindow(QMainWindow):
         """Create the sidebar with navigation buttons."""
         sidebar = QWidget()
         sidebar.setFixedWidth(200)
-        sidebar.setStyleSheet(SIDEBAR_STYLE)
+        sidebar.setObjectName("sidebar")
 
         layout = QVBoxLayout(sidebar)
         layout.setContentsMargins(0, 0, 0, 0)
@@ -93,20 +114,24 @@ class MainWindow(QMainWindow):
 
         # Add logo/title
         title = QLabel("Finance\nTracker")
-        title.setStyleSheet(TITLE_STYLE)
+        title.setObjectName("sidebarTitle")
         title.setAlignment(Qt.AlignmentFlag.AlignCenter)
         layout.addWidget(title)
 
         # Add navigation buttons
         self.nav_buttons = []
 
-        dashboard_btn = self.create_nav_button("Dashboard", "📊", self.show_dashboard)
-        accounts_btn = self.create_nav_button("Accounts", "💰", self.show_accounts)
+        dashboard_btn = self.create_nav_button(
+            "dashboard", self.show_dashboard
+        )
+        accounts_btn = self.create_nav_button("accounts", self.show_accounts)
         transactions_btn = self.create_nav_button(
-            "Transactions", "💸", self.show_transactions
+            "transactions", self.show_transactions
         )
-        categories_btn = self.create_nav_button("Categories", "🏷️", self.show_categories)
-        reports_btn = self.create_nav_button("Reports", "📈", self.show_reports)
+        categories_btn = self.create_nav_button(
+            "categories", self.show_categories
+        )
+        reports_btn = self.create_nav_button("reports", self.show_reports)
 
         layout.addWidget(dashboard_btn)
         layout.addWidget(accounts_btn)
@@ -122,15 +147,15 @@ class MainWindow(QMainWindow):
         )
 
         # Add settings button at bottom
-        settings_btn = self.create_nav_button("Settings", "⚙️", self.show_settings)
+        settings_btn = self.create_nav_button("settings", self.show_settings)
         layout.addWidget(settings_btn)
 
         return sidebar
 
-    def create_nav_button(self, text, icon, callback):
-        """Create a navigation button with icon and text."""
-        button = QPushButton(f"{icon} {text}")
-        button.setStyleSheet(BUTTON_STYLE)
+    def create_nav_button(self, key, callback):
+        """Create a navigation button labelled from _NAV_LABELS[key]."""
+        button = QPushButton(_NAV_LABELS[key])
+        button.setObjectName("navButton")
         button.setFixedHeight(50)
         button.clicked.connect(callback)
         self.nav_buttons.append(button)
@@ -139,42 +164,68 @@ class MainWindow(QMainWindow):
     def update_nav_buttons(self, active_button):
         """Update navigation button styles."""
         for button in self.nav_buttons:
-            if button == active_button:
-                button.setStyleSheet(ACTIVE_BUTTON_STYLE)
-            else:
-                button.setStyleSheet(BUTTON_STYLE)
-
-    def show_dashboard(self):
+            active = button is active_button
+            if button.property("active") == active:
+                continue
+            button.setProperty("active", active)
+            # Re-evaluate the [active="true"] rule of the app stylesheet
+            button.style().unpolish(button)
+            button.style().polish(button)
+
+    def get_page(self, key):
+        """Return the page for key, creating it on first use.
+
+        Pages do not load data when they are built; _show refreshes them.
+        """
+        page = self._pages.get(key)
+        if page is None:
+            page = self._page_factories[key](self.finance_manager)
+            self._pages[key] = page
+            self.stacked_widget.addWidget(page)
+        return page
+
+    def _show(self, key, index):
+        """Switch to the page for key and schedule a refresh of its data."""
+        page = self.get_page(key)
+        button = self.nav_buttons[index]
+        # Clicking the tab that is already showing does nothing
+        if (
+            self.stacked_widget.currentWidget() is page
+            and button.property("active")
+        ):
+            return
+        self.stacked_widget.setCurrentWidget(page)
+        self.update_nav_buttons(button)
+        self._pending_refresh = page
+        self._refresh_timer.start()
+
+    def _do_pending_refresh(self):
+        """Refresh the page shown last, once navigation has settled."""
+        page, self._pending_refresh = self._pending_refresh, None
+        if page is not None:
+            page.refresh_data()
+
+    def show_dashboard(self, *_):
         """Show the dashboard page."""
-        self.stacked_widget.setCurrentWidget(self.dashboard)
-        self.update_nav_buttons(self.nav_buttons[0])
-        self.dashboard.refresh_data()
+        self._show("dashboard", 0)
 
-    def show_accounts(self):
+    def show_accounts(self, *_):
         """Show the accounts page."""
-        self.stacked_widget.setCurrentWidget(self.accounts)
-        self.update_nav_buttons(self.nav_buttons[1])
-        self.accounts.refresh_data()
+        self._show("accounts", 1)
 
-    def show_transactions(self):
+    def show_transactions(self, *_):
         """Show the transactions page."""
-        self.stacked_widget.setCurrentWidget(self.transactions)
-        self.update_nav_buttons(self.nav_buttons[2])
-        self.transactions.refresh_data()
+        self._show("transactions", 2)
 
-    def show_categories(self):
+    def show_categories(self, *_):
         """Show the categories page."""
-        self.stacked_widget.setCurrentWidget(self.categories)
-        self.update_nav_buttons(self.nav_buttons[3])
-        self.categories.refresh_data()
+        self._show("categories", 3)
 
-    def show_reports(self):
+    def show_reports(self, *_):
         """Show the reports page."""
-        self.stacked_widget.setCurrentWidget(self.reports)
-        self.update_nav_buttons(self.nav_buttons[4])
-        self.reports.refresh_data()
+        self._show("reports", 4)
 
-    def show_settings(self):
+    def show_settings(self, *_):
         """Show the settings dialog."""
         dialog = SettingsDialog(self)
         if dialog.exec():
@@ -183,10 +234,6 @@ class MainWindow(QMainWindow):
         else:
             logger.info("Settings cancelled")
 
-    def set_theme(self):
-        """Set the application theme."""
-        qdarktheme.setup_theme("dark")
-
     def closeEvent(self, event):
         """Handle application close event."""
         event.accept()
@@ -1,4 +1,10 @@
-"""Style definitions for the Finance Tracker GUI."""
+"""Style definitions for the Finance Tracker GUI.
+
+Most styles are combined into APP_STYLESHEET, which is applied once to the
+application so Qt parses it a single time. Widgets pick up the scoped rules
+through their object name (e.g. ``setObjectName("actionButton")``) or a
+dynamic property instead of setting a stylesheet of their own.
+"""
 
 # Main application style
 MAIN_STYLE = """
@@ -9,7 +15,7 @@ QMainWindow {
 
 # Sidebar style
 SIDEBAR_STYLE = """
-QWidget {
+QWidget#sidebar {
     background-color: #252526;
     border-right: 1px solid #333333;
 }
@@ -17,14 +23,14 @@ QWidget {
 
 # Content area style
 CONTENT_STYLE = """
-QWidget {
+QStackedWidget#content {
     background-color: #1e1e1e;
 }
 """
 
 # Navigation button style
 BUTTON_STYLE = """
-QPushButton {
+QPushButton#navButton {
     background-color: transparent;
     border: none;
     border-radius: 5px;
@@ -34,15 +40,15 @@ QPushButton {
     padding: 10px 15px;
 }
 
-QPushButton:hover {
+QPushButton#navButton:hover {
     background-color: #2d2d2d;
     color: #ffffff;
 }
 """
 
-# Active navigation button style
+# Active navigation button style, toggled with the "active" property
 ACTIVE_BUTTON_STYLE = """
-QPushButton {
+QPushButton#navButton[active="true"] {
     background-color: #37373d;
     border: none;
     border-radius: 5px;
@@ -55,7 +61,7 @@ QPushButton {
 
 # Title style
 TITLE_STYLE = """
-QLabel {
+QLabel#sidebarTitle {
     color: #ffffff;
     font-size: 24px;
     font-weight: bold;
@@ -65,13 +71,13 @@ QLabel {
 
 # Card widget style
 CARD_STYLE = """
-QFrame {
+QFrame#card, QFrame#card QFrame {
     background-color: #2d2d2d;
     border-radius: 10px;
     padding: 15px;
 }
 
-QFrame > QLabel {
+QFrame#card > QLabel {
     background: none;
     border: none;
 }
@@ -79,7 +85,7 @@ QFrame > QLabel {
 
 # Card title style
 CARD_TITLE_STYLE = """
-QLabel {
+QLabel#cardTitle {
     color: #ffffff;
     font-size: 16px;
     font-weight: bold;
@@ -90,7 +96,7 @@ QLabel {
 
 # Card content style
 CARD_CONTENT_STYLE = """
-QLabel {
+QLabel#cardContent {
     color: #cccccc;
     font-size: 14px;
     line-height: 1.4;
@@ -101,24 +107,24 @@ QLabel {
 
 # Table style
 TABLE_STYLE = """
-QTableWidget {
+QTableView {
     background-color: #1e1e1e;
     border: 1px solid #333333;
     border-radius: 5px;
     gridline-color: #333333;
 }
 
-QTableWidget::item {
+QTableView::item {
     padding: 5px;
     color: #cccccc;
 }
 
-QTableWidget::item:selected {
+QTableView::item:selected {
     background-color: #37373d;
     color: #ffffff;
 }
 
-QHeaderView::section {
+QTableView QHeaderView::section {
     background-color: #252526;
     color: #ffffff;
     padding: 5px;
@@ -174,7 +180,7 @@ QSpinBox::down-arrow, QDoubleSpinBox::down-arrow {
 
 # Action button style
 ACTION_BUTTON_STYLE = """
-QPushButton {
+QPushButton#actionButton {
     background-color: #007acc;
     border: none;
     border-radius: 5px;
@@ -184,15 +190,15 @@ QPushButton {
     min-width: 100px;
 }
 
-QPushButton:hover {
+QPushButton#actionButton:hover {
     background-color: #1c97ea;
 }
 
-QPushButton:pressed {
+QPushButton#actionButton:pressed {
     background-color: #0062a3;
 }
 
-QPushButton:disabled {
+QPushButton#actionButton:disabled {
     background-color: #4d4d4d;
     color: #999999;
 }
@@ -200,7 +206,7 @@ QPushButton:disabled {
 
 # Delete button style
 DELETE_BUTTON_STYLE = """
-QPushButton {
+QPushButton#deleteButton {
     background-color: #c42b1c;
     border: none;
     border-radius: 5px;
@@ -210,11 +216,11 @@ QPushButton {
     min-width: 100px;
 }
 
-QPushButton:hover {
+QPushButton#deleteButton:hover {
     background-color: #e81123;
 }
 
-QPushButton:pressed {
+QPushButton#deleteButton:pressed {
     background-color: #a01616;
 }
 """
@@ -326,3 +332,41 @@ QProgressBar::chunk {
     border-radius: 5px;
 }
 """
+
+# Secondary (cancel) button style
+SECONDARY_BUTTON_STYLE = """
+QPushButton#secondaryButton {
+    background-color: #4d4d4d;
+    border: none;
+    border-radius: 5px;
+    color: #ffffff;
+    font-size: 14px;
+    padding: 8px 16px;
+    min-width: 100px;
+}
+
+QPushButton#secondaryButton:hover {
+    background-color: #5d5d5d;
+}
+"""
+
+# Application-wide stylesheet
+APP_STYLESHEET = "".join(
+    (
+        SIDEBAR_STYLE,
+        CONTENT_STYLE,
+        TITLE_STYLE,
+        BUTTON_STYLE,
+        ACTIVE_BUTTON_STYLE,
+        CARD_STYLE,
+        CARD_TITLE_STYLE,
+        CARD_CONTENT_STYLE,
+        TABLE_STYLE,
+        INPUT_STYLE,
+        ACTION_BUTTON_STYLE,
+        DELETE_BUTTON_STYLE,
+        SECONDARY_BUTTON_STYLE,
+        DIALOG_STYLE,
+        TAB_STYLE,
+    )
+)
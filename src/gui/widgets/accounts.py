@@ -1,9 +1,20 @@
 """Account management widget for the Finance Tracker application."""
 
 import logging
+from contextlib import ExitStack
 from decimal import Decimal
 
-from PyQt6.QtCore import Qt
+from PyQt6.QtCore import (
+    QAbstractTableModel,
+    QModelIndex,
+    QObject,
+    QRunnable,
+    QSignalBlocker,
+    QThreadPool,
+    Qt,
+    pyqtSignal,
+)
+from PyQt6.QtGui import QFontMetrics
 from PyQt6.QtWidgets import (
     QComboBox,
     QDialog,
@@ -14,27 +25,229 @@ from PyQt6.QtWidgets import (
     QLineEdit,
     QMessageBox,
     QPushButton,
-    QTableWidget,
-    QTableWidgetItem,
+    QStyledItemDelegate,
+    QStyleOptionViewItem,
+    QTableView,
     QVBoxLayout,
     QWidget,
 )
 
+from sqlalchemy.orm import Session
+
 from src.utils.config_manager import get_config
 from src.utils.formatting import format_currency
 
 from ...core.finance_manager import FinanceManager
 from ...models.models import AccountType
-from ..style import (
-    ACTION_BUTTON_STYLE,
-    DELETE_BUTTON_STYLE,
-    DIALOG_STYLE,
-    INPUT_STYLE,
-    TABLE_STYLE,
-)
 
 logger = logging.getLogger(__name__)
 
+# Rows measured to size the table columns, and the space added to each
+_COLUMN_SAMPLE_ROWS = 50
+_COLUMN_PADDING = 24
+
+# Entries of the account type combo box
+_ACCOUNT_TYPE_VALUES = [account_type.value for account_type in AccountType]
+# Combo box index of each account type value
+_ACCOUNT_TYPE_INDEX = {
+    value: index for index, value in enumerate(_ACCOUNT_TYPE_VALUES)
+}
+
+
+def account_rows(accounts, config) -> tuple:
+    """Build the accounts table rows: the account ID, then the cell texts."""
+    fmt = format_currency
+    return tuple(
+        (
+            account.id,
+            account.name,
+            account.type.value,
+            fmt(account.balance, config),
+            account.currency,
+            account.description or "",
+        )
+        for account in accounts
+    )
+
+
+class AccountsTableModel(QAbstractTableModel):
+    """Table model serving the account rows built by account_rows.
+
+    The cell texts are stored column by column, one list per column, and
+    handed to the view on demand instead of as one item object per cell.
+    """
+
+    HEADERS = ("Name", "Type", "Balance", "Currency", "Description")
+    BALANCE_COLUMN = 2
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._ids = []
+        self._columns = [[] for _ in self.HEADERS]
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._ids)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.HEADERS)
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        if role == Qt.ItemDataRole.DisplayRole:
+            return self._columns[index.column()][index.row()]
+        if role == Qt.ItemDataRole.UserRole:
+            return self._ids[index.row()]
+        return None
+
+    def headerData(
+        self, section, orientation, role=Qt.ItemDataRole.DisplayRole
+    ):
+        if (
+            orientation == Qt.Orientation.Horizontal
+            and role == Qt.ItemDataRole.DisplayRole
+        ):
+            return self.HEADERS[section]
+        return None
+
+    def account_id(self, row: int) -> int:
+        """Return the ID of the account shown in row."""
+        return self._ids[row]
+
+    def update_row(self, row_data: tuple) -> bool:
+        """Replace the cells of one account in place.
+
+        Args:
+            row_data (tuple): The account's row as built by account_rows.
+
+        Returns:
+            bool: False if the account is not in the table.
+        """
+        try:
+            row = self._ids.index(row_data[0])
+        except ValueError:
+            return False
+        for column, text in zip(self._columns, row_data[1:]):
+            column[row] = text
+        self.dataChanged.emit(
+            self.index(row, 0), self.index(row, len(self.HEADERS) - 1)
+        )
+        return True
+
+    def remove_account(self, account_id: int) -> bool:
+        """Remove the row of one account.
+
+        Args:
+            account_id (int): ID of the account to remove.
+
+        Returns:
+            bool: False if the account is not in the table.
+        """
+        try:
+            row = self._ids.index(account_id)
+        except ValueError:
+            return False
+        self.beginRemoveRows(QModelIndex(), row, row)
+        del self._ids[row]
+        for column in self._columns:
+            del column[row]
+        self.endRemoveRows()
+        return True
+
+    def set_rows(self, rows: tuple):
+        """Replace the table contents.
+
+        When the same accounts are listed in the same order only
+        dataChanged is emitted, so the view keeps its selection; otherwise
+        the model is reset.
+
+        Args:
+            rows (tuple): Rows as built by account_rows.
+        """
+        ids = [row[0] for row in rows]
+        columns = [list(column) for column in zip(*(row[1:] for row in rows))]
+        if not columns:
+            columns = [[] for _ in self.HEADERS]
+
+        if ids == self._ids:
+            self._columns = columns
+            if ids:
+                self.dataChanged.emit(
+                    self.index(0, 0),
+                    self.index(len(ids) - 1, len(self.HEADERS) - 1),
+                )
+            return
+
+        self.beginResetModel()
+        self._ids = ids
+        self._columns = columns
+        self.endResetModel()
+
+
+class AccountsItemDelegate(QStyledItemDelegate):
+    """Item delegate that styles account cells from their text alone.
+
+    The base initStyleOption asks the model for every item role (font,
+    alignment, colours, check state, decoration, ...) of every painted
+    cell, each a separate Python data() call. AccountsTableModel only
+    provides display text, so just that is read; balances are
+    right-aligned here.
+    """
+
+    def initStyleOption(self, option, index):
+        option.index = index
+        text = index.data(Qt.ItemDataRole.DisplayRole)
+        if text is not None:
+            option.features |= QStyleOptionViewItem.ViewItemFeature.HasDisplay
+            option.text = text
+        if index.column() == AccountsTableModel.BALANCE_COLUMN:
+            option.displayAlignment = (
+                Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter
+            )
+
+
+class AccountsLoaderSignals(QObject):
+    """Signals emitted by AccountsLoader, tagged with its generation."""
+
+    loaded = pyqtSignal(int, object)
+    failed = pyqtSignal(int, str)
+
+
+class AccountsLoader(QRunnable):
+    """Load the accounts table rows on a thread pool thread.
+
+    A session must not be shared between threads, so the loader queries
+    through its own session on the finance manager's engine.
+    """
+
+    def __init__(self, bind, config, generation: int):
+        """Initialize the loader.
+
+        Args:
+            bind: Engine to open the loader's session on
+            config: Configuration used to format balances
+            generation: Refresh number echoed back with the result
+        """
+        super().__init__()
+        self.bind = bind
+        self.config = config
+        self.generation = generation
+        self.signals = AccountsLoaderSignals()
+
+    def run(self):
+        """Query the accounts and emit their table rows."""
+        session = Session(bind=self.bind)
+        try:
+            accounts = FinanceManager(session).get_accounts()
+            rows = account_rows(accounts, self.config)
+        except Exception as e:
+            logger.error(f"Error loading accounts: {e}", exc_info=True)
+            self.signals.failed.emit(self.generation, str(e))
+        else:
+            self.signals.loaded.emit(self.generation, rows)
+        finally:
+            session.close()
+
 
 class AccountDialog(QDialog):
     """Dialog for adding/editing accounts."""
@@ -50,13 +263,10 @@ class AccountDialog(QDialog):
         self.account = account
         self.config = get_config()
         self.init_ui()
+        self.load(account)
 
     def init_ui(self):
         """Initialize the user interface."""
-        self.setWindowTitle(
-            "Add Account" if not self.account else "Edit Account"
-        )
-        self.setStyleSheet(DIALOG_STYLE)
         self.setMinimumWidth(400)
 
         layout = QFormLayout(self)
@@ -65,53 +275,34 @@ class AccountDialog(QDialog):
 
         # Name field
         self.name_input = QLineEdit()
-        self.name_input.setStyleSheet(INPUT_STYLE)
-        if self.account:
-            self.name_input.setText(self.account.name)
         layout.addRow("Name:", self.name_input)
 
         # Type field
         self.type_combo = QComboBox()
-        self.type_combo.setStyleSheet(INPUT_STYLE)
-        for account_type in AccountType:
-            self.type_combo.addItem(account_type.value)
-        if self.account:
-            self.type_combo.setCurrentText(self.account.type.value)
+        self.type_combo.addItems(_ACCOUNT_TYPE_VALUES)
         layout.addRow("Type:", self.type_combo)
 
         # Balance field
         self.balance_input = QLineEdit()
-        self.balance_input.setStyleSheet(INPUT_STYLE)
-        if self.account:
-            self.balance_input.setText(str(self.account.balance))
         layout.addRow("Balance:", self.balance_input)
 
         # Currency field
         self.currency_input = QLineEdit()
-        self.currency_input.setStyleSheet(INPUT_STYLE)
-        self.currency_input.setText(
-            self.account.currency
-            if self.account
-            else self.config["DEFAULT_CURRENCY"]
-        )
         layout.addRow("Currency:", self.currency_input)
 
         # Description field
         self.description_input = QLineEdit()
-        self.description_input.setStyleSheet(INPUT_STYLE)
-        if self.account:
-            self.description_input.setText(self.account.description or "")
         layout.addRow("Description:", self.description_input)
 
         # Buttons
         button_layout = QHBoxLayout()
 
         save_button = QPushButton("Save")
-        save_button.setStyleSheet(ACTION_BUTTON_STYLE)
+        save_button.setObjectName("actionButton")
         save_button.clicked.connect(self.accept)
 
         cancel_button = QPushButton("Cancel")
-        cancel_button.setStyleSheet(DELETE_BUTTON_STYLE)
+        cancel_button.setObjectName("deleteButton")
         cancel_button.clicked.connect(self.reject)
 
         button_layout.addWidget(save_button)
@@ -119,6 +310,42 @@ class AccountDialog(QDialog):
 
         layout.addRow("", button_layout)
 
+    def load(self, account=None):
+        """Fill the form from an account, or reset it for a new one.
+
+        Lets one dialog be reused instead of rebuilding its widgets.
+
+        Args:
+            account: Optional account to edit
+        """
+        self.account = account
+        self.setWindowTitle("Edit Account" if account else "Add Account")
+        inputs = (
+            self.name_input,
+            self.type_combo,
+            self.balance_input,
+            self.currency_input,
+            self.description_input,
+        )
+        # Filling the form is not an edit, so no change signals are sent
+        with ExitStack() as stack:
+            for widget in inputs:
+                stack.enter_context(QSignalBlocker(widget))
+            if account:
+                self.name_input.setText(account.name)
+                self.type_combo.setCurrentIndex(
+                    _ACCOUNT_TYPE_INDEX[account.type.value]
+                )
+                self.balance_input.setText(str(account.balance))
+                self.currency_input.setText(account.currency)
+                self.description_input.setText(account.description or "")
+            else:
+                self.name_input.clear()
+                self.type_combo.setCurrentIndex(0)
+                self.balance_input.clear()
+                self.currency_input.setText(self.config["DEFAULT_CURRENCY"])
+                self.description_input.clear()
+
     def get_data(self):
         """Get the account data from the form.
 
@@ -151,6 +378,15 @@ class AccountsWidget(QWidget):
         super().__init__()
         self.finance_manager = finance_manager
         self.config = get_config()
+        # Rows currently shown in the table
+        self._last_accounts_signature = None
+        # Created on first use and reused for every add/edit
+        self._account_dialog = None
+        # Set once the column widths have been fitted to loaded rows
+        self._columns_sized = False
+        # Incremented per refresh; results of older loads are dropped
+        self._refresh_generation = 0
+        self.pool = QThreadPool.globalInstance()
         logger.debug("Calling init_ui")
         self.init_ui()
         logger.debug("AccountsWidget initialization complete")
@@ -172,7 +408,7 @@ class AccountsWidget(QWidget):
         header_layout.addWidget(title)
 
         add_button = QPushButton("+ Add Account")
-        add_button.setStyleSheet(ACTION_BUTTON_STYLE)
+        add_button.setObjectName("actionButton")
         add_button.clicked.connect(self.add_account)
         header_layout.addWidget(
             add_button, alignment=Qt.AlignmentFlag.AlignRight
@@ -181,21 +417,18 @@ class AccountsWidget(QWidget):
         layout.addLayout(header_layout)
 
         # Accounts table
-        self.accounts_table = QTableWidget()
-        self.accounts_table.setStyleSheet(TABLE_STYLE)
-        self.accounts_table.setColumnCount(6)
-        self.accounts_table.setHorizontalHeaderLabels(
-            ["ID", "Name", "Type", "Balance", "Currency", "Description"]
-        )
-        self.accounts_table.horizontalHeader().setSectionResizeMode(
-            QHeaderView.ResizeMode.ResizeToContents
-        )
-        self.accounts_table.horizontalHeader().setSectionResizeMode(
-            1, QHeaderView.ResizeMode.Stretch
-        )
-        self.accounts_table.horizontalHeader().setSectionResizeMode(
-            5, QHeaderView.ResizeMode.Stretch
+        self.accounts_model = AccountsTableModel(self)
+        self.accounts_table = QTableView()
+        self.accounts_table.setModel(self.accounts_model)
+        self.accounts_table.setItemDelegate(
+            AccountsItemDelegate(self.accounts_table)
         )
+        # Columns are sized once from a sample of rows (see _size_columns)
+        # rather than by measuring every cell on every change
+        header = self.accounts_table.horizontalHeader()
+        header.setSectionResizeMode(QHeaderView.ResizeMode.Interactive)
+        header.setSectionResizeMode(0, QHeaderView.ResizeMode.Stretch)
+        header.setSectionResizeMode(4, QHeaderView.ResizeMode.Stretch)
 
         layout.addWidget(self.accounts_table)
 
@@ -203,11 +436,11 @@ class AccountsWidget(QWidget):
         button_layout = QHBoxLayout()
 
         edit_button = QPushButton("Edit")
-        edit_button.setStyleSheet(ACTION_BUTTON_STYLE)
+        edit_button.setObjectName("actionButton")
         edit_button.clicked.connect(self.edit_account)
 
         delete_button = QPushButton("Delete")
-        delete_button.setStyleSheet(DELETE_BUTTON_STYLE)
+        delete_button.setObjectName("deleteButton")
         delete_button.clicked.connect(self.delete_account)
 
         button_layout.addWidget(edit_button)
@@ -218,40 +451,84 @@ class AccountsWidget(QWidget):
 
         logger.debug("AccountsWidget UI setup complete")
 
-        # Initial data load
-        self.refresh_data()
-
     def refresh_data(self):
-        """Refresh the accounts table."""
+        """Refresh the accounts table.
+
+        The accounts are loaded on the global thread pool and the table is
+        filled when they arrive, so the event loop is not blocked.
+        """
         logger.debug("Refreshing accounts data")
-        accounts = self.finance_manager.get_accounts()
+        self._refresh_generation += 1
+        loader = AccountsLoader(
+            self.finance_manager.db.get_bind(),
+            self.config,
+            self._refresh_generation,
+        )
+        loader.signals.loaded.connect(self._populate)
+        loader.signals.failed.connect(self._show_load_error)
+        self.pool.start(loader)
 
-        self.accounts_table.setRowCount(len(accounts))
-        for i, account in enumerate(accounts):
-            self.accounts_table.setItem(
-                i, 0, QTableWidgetItem(str(account.id))
-            )
-            self.accounts_table.setItem(i, 1, QTableWidgetItem(account.name))
-            self.accounts_table.setItem(
-                i, 2, QTableWidgetItem(account.type.value)
-            )
-            self.accounts_table.setItem(
-                i,
-                3,
-                QTableWidgetItem(
-                    format_currency(account.balance, self.config)
-                ),
+    def _populate(self, generation: int, rows: tuple):
+        """Show loaded account rows unless a newer refresh was started."""
+        if generation != self._refresh_generation:
+            return
+        if rows == self._last_accounts_signature:
+            return
+
+        self.accounts_model.set_rows(rows)
+        self._last_accounts_signature = rows
+        if rows and not self._columns_sized:
+            self._size_columns(rows)
+
+    def _size_columns(self, rows: tuple):
+        """Fit the interactive columns to the first rows of the table."""
+        metrics = QFontMetrics(self.accounts_table.font())
+        header = self.accounts_table.horizontalHeader()
+        interactive = QHeaderView.ResizeMode.Interactive
+        sample = rows[:_COLUMN_SAMPLE_ROWS]
+        for column, title in enumerate(AccountsTableModel.HEADERS):
+            if header.sectionResizeMode(column) != interactive:
+                continue
+            width = max(
+                metrics.horizontalAdvance(text)
+                for text in (title, *(row[column + 1] for row in sample))
             )
-            self.accounts_table.setItem(
-                i, 4, QTableWidgetItem(account.currency)
+            self.accounts_table.setColumnWidth(
+                column, width + _COLUMN_PADDING
             )
-            self.accounts_table.setItem(
-                i, 5, QTableWidgetItem(account.description or "")
+        self._columns_sized = True
+
+    def _patch_rows(self, patched: bool):
+        """Finish an in-place table change, reloading if it missed."""
+        # The table no longer matches the last loaded rows
+        self._last_accounts_signature = None
+        if not patched:
+            self.refresh_data()
+
+    def _show_load_error(self, generation: int, message: str):
+        """Report a failed load unless a newer refresh was started."""
+        if generation == self._refresh_generation:
+            QMessageBox.warning(
+                self, "Error", f"Could not load accounts: {message}"
             )
 
-    def add_account(self):
+    def _selected_account_id(self):
+        """Return the ID of the selected account, or None."""
+        selected = self.accounts_table.selectionModel().selectedIndexes()
+        if not selected:
+            return None
+        return self.accounts_model.account_id(selected[0].row())
+
+    def _get_dialog(self, account=None):
+        """Return the shared account dialog, filled for account."""
+        if self._account_dialog is None:
+            self._account_dialog = AccountDialog(self)
+        self._account_dialog.load(account)
+        return self._account_dialog
+
+    def add_account(self, *_):
         """Show dialog to add a new account."""
-        dialog = AccountDialog(self)
+        dialog = self._get_dialog()
         if dialog.exec() == QDialog.DialogCode.Accepted:
             data = dialog.get_data()
             if data:
@@ -261,43 +538,40 @@ class AccountsWidget(QWidget):
                 except Exception as e:
                     QMessageBox.warning(self, "Error", str(e))
 
-    def edit_account(self):
+    def edit_account(self, *_):
         """Show dialog to edit the selected account."""
-        selected_items = self.accounts_table.selectedItems()
-        if not selected_items:
+        account_id = self._selected_account_id()
+        if account_id is None:
             QMessageBox.warning(
                 self, "No Selection", "Please select an account to edit."
             )
             return
 
-        account_id = int(
-            self.accounts_table.item(selected_items[0].row(), 0).text()
-        )
         account = self.finance_manager.get_account(account_id)
 
-        dialog = AccountDialog(self, account)
+        dialog = self._get_dialog(account)
         if dialog.exec() == QDialog.DialogCode.Accepted:
             data = dialog.get_data()
             if data:
                 try:
                     self.finance_manager.update_account(account_id, **data)
-                    self.refresh_data()
+                    self._patch_rows(
+                        self.accounts_model.update_row(
+                            account_rows([account], self.config)[0]
+                        )
+                    )
                 except Exception as e:
                     QMessageBox.warning(self, "Error", str(e))
 
-    def delete_account(self):
+    def delete_account(self, *_):
         """Delete the selected account."""
-        selected_items = self.accounts_table.selectedItems()
-        if not selected_items:
+        account_id = self._selected_account_id()
+        if account_id is None:
             QMessageBox.warning(
                 self, "No Selection", "Please select an account to delete."
             )
             return
 
-        account_id = int(
-            self.accounts_table.item(selected_items[0].row(), 0).text()
-        )
-
         reply = QMessageBox.question(
             self,
             "Confirm Deletion",
@@ -312,6 +586,8 @@ class AccountsWidget(QWidget):
         if reply == QMessageBox.StandardButton.Yes:
             try:
                 self.finance_manager.delete_account(account_id)
-                self.refresh_data()
+                self._patch_rows(
+                    self.accounts_model.remove_account(account_id)
+                )
             except Exception as e:
                 QMessageBox.warning(self, "Error", str(e))
@@ -12,17 +12,55 @@ from PyQt6.QtWidgets import (
     QFormLayout,
     QMessageBox,
     QColorDialog,
+    QStyledItemDelegate,
 )
-from PyQt6.QtCore import Qt
+from PyQt6.QtCore import QRect, QSignalBlocker, Qt
+from PyQt6.QtGui import QBrush, QColor
 
 from ...core.finance_manager import FinanceManager
 from ...models.models import Category
-from ..style import (
-    INPUT_STYLE,
-    ACTION_BUTTON_STYLE,
-    DELETE_BUTTON_STYLE,
-    DIALOG_STYLE,
-)
+
+# Holds a category whose child items have not been created yet
+_PENDING_CHILDREN_ROLE = Qt.ItemDataRole.UserRole.value + 1
+
+# Entries of the category type combo box
+_CATEGORY_TYPES = ["income", "expense"]
+
+# Side of a colour swatch and the colour of its border
+_SWATCH_SIZE = 20
+_SWATCH_BORDER = QColor("#555555")
+
+
+class ColorSwatchDelegate(QStyledItemDelegate):
+    """Paint a category's colour as a swatch.
+
+    The colour is read from the item's BackgroundRole, so the tree needs
+    no QLabel, and no stylesheet, per coloured category.
+    """
+
+    def initStyleOption(self, option, index):
+        super().initStyleOption(option, index)
+        # The colour is drawn as a swatch, not as the cell background
+        option.backgroundBrush = QBrush()
+
+    def paint(self, painter, option, index):
+        super().paint(painter, option, index)
+        color = index.data(Qt.ItemDataRole.BackgroundRole)
+        if color is None:
+            return
+        rect = option.rect
+        size = min(_SWATCH_SIZE, rect.height() - 4)
+        swatch = QRect(
+            rect.left() + 2,
+            rect.top() + (rect.height() - size) // 2,
+            size,
+            size,
+        )
+        painter.save()
+        painter.fillRect(swatch, color)
+        painter.setPen(_SWATCH_BORDER)
+        painter.drawRect(swatch.adjusted(0, 0, -1, -1))
+        painter.restore()
 
 
 class CategoryDialog(QDialog):
@@ -34,17 +72,28 @@ class CategoryDialog(QDialog):
         parent=None,
         category=None,
         parent_category=None,
+        top_level=None,
     ):
+        """Initialize the category dialog.
+
+        Args:
+            finance_manager: The finance manager instance
+            parent: Parent widget
+            category: Optional category to edit
+            parent_category: Optional parent for a new subcategory
+            top_level: Top-level categories offered as parents; queried
+                from the finance manager when not given
+        """
         super().__init__(parent)
         self.finance_manager = finance_manager
         self.category = category
         self.parent_category = parent_category
+        self.top_level = top_level
         self.init_ui()
 
     def init_ui(self):
         """Initialize the user interface."""
         self.setWindowTitle("Add Category" if not self.category else "Edit Category")
-        self.setStyleSheet(DIALOG_STYLE)
         self.setMinimumWidth(400)
 
         layout = QFormLayout(self)
@@ -53,33 +102,34 @@ class CategoryDialog(QDialog):
 
         # Name field
         self.name_input = QLineEdit()
-        self.name_input.setStyleSheet(INPUT_STYLE)
         if self.category:
             self.name_input.setText(self.category.name)
         layout.addRow("Name:", self.name_input)
 
         # Type field
         self.type_combo = QComboBox()
-        self.type_combo.setStyleSheet(INPUT_STYLE)
-        self.type_combo.addItems(["income", "expense"])
-        if self.category:
-            self.type_combo.setCurrentText(self.category.type)
-        elif self.parent_category:
-            self.type_combo.setCurrentText(self.parent_category.type)
-            self.type_combo.setEnabled(False)
+        with QSignalBlocker(self.type_combo):
+            self.type_combo.addItems(_CATEGORY_TYPES)
+            if self.category:
+                self.type_combo.setCurrentText(self.category.type)
+            elif self.parent_category:
+                self.type_combo.setCurrentText(self.parent_category.type)
+                self.type_combo.setEnabled(False)
         layout.addRow("Type:", self.type_combo)
 
         # Parent category field
         self.parent_combo = QComboBox()
-        self.parent_combo.setStyleSheet(INPUT_STYLE)
-        self.parent_combo.addItem("None", None)
-
-        categories = self.finance_manager.get_categories()
-        for cat in categories:
-            if not cat.parent_id:  # Only show top-level categories
-                if (
-                    self.category and cat.id != self.category.id
-                ):  # Don't allow setting self as parent
+        top_level = self.top_level
+        if top_level is None:
+            top_level = [
+                c for c in self.finance_manager.get_categories()
+                if not c.parent_id
+            ]
+        with QSignalBlocker(self.parent_combo):
+            self.parent_combo.addItem("None", None)
+            for cat in top_level:
+                # Don't allow setting self as parent
+                if not (self.category and cat.id == self.category.id):
                     self.parent_combo.addItem(cat.name, cat.id)
 
         if self.category and self.category.parent_id:
@@ -95,16 +145,15 @@ class CategoryDialog(QDialog):
         color_layout = QHBoxLayout()
 
         self.color_input = QLineEdit()
-        self.color_input.setStyleSheet(INPUT_STYLE)
         self.color_input.setReadOnly(True)
         if self.category and self.category.color_code:
             self.color_input.setText(self.category.color_code)
             self.color_input.setStyleSheet(
-                f"{INPUT_STYLE} background-color: {self.category.color_code};"
+                f"background-color: {self.category.color_code};"
             )
 
         color_button = QPushButton("Choose Color")
-        color_button.setStyleSheet(ACTION_BUTTON_STYLE)
+        color_button.setObjectName("actionButton")
         color_button.clicked.connect(self.choose_color)
 
         color_layout.addWidget(self.color_input)
@@ -116,11 +165,11 @@ class CategoryDialog(QDialog):
         button_layout = QHBoxLayout()
 
         save_button = QPushButton("Save")
-        save_button.setStyleSheet(ACTION_BUTTON_STYLE)
+        save_button.setObjectName("actionButton")
         save_button.clicked.connect(self.accept)
 
         cancel_button = QPushButton("Cancel")
-        cancel_button.setStyleSheet(DELETE_BUTTON_STYLE)
+        cancel_button.setObjectName("deleteButton")
         cancel_button.clicked.connect(self.reject)
 
         button_layout.addWidget(save_button)
@@ -128,13 +177,13 @@ class CategoryDialog(QDialog):
 
         layout.addRow("", button_layout)
 
-    def choose_color(self):
+    def choose_color(self, *_):
         """Show color picker dialog."""
         color = QColorDialog.getColor()
         if color.isValid():
             self.color_input.setText(color.name())
             self.color_input.setStyleSheet(
-                f"{INPUT_STYLE} background-color: {color.name()};"
+                f"background-color: {color.name()};"
             )
 
     def get_data(self):
@@ -157,6 +206,9 @@ class CategoriesWidget(QWidget):
     def __init__(self, finance_manager: FinanceManager):
         super().__init__()
         self.finance_manager = finance_manager
+        # Categories shown in the tree, by ID, and the top-level ones
+        self._category_index = {}
+        self._top_level_categories = []
         self.init_ui()
 
     def init_ui(self):
@@ -173,7 +225,7 @@ class CategoriesWidget(QWidget):
         header_layout.addWidget(title)
 
         add_button = QPushButton("+ Add Category")
-        add_button.setStyleSheet(ACTION_BUTTON_STYLE)
+        add_button.setObjectName("actionButton")
         add_button.clicked.connect(lambda: self.add_category())
         header_layout.addWidget(add_button, alignment=Qt.AlignmentFlag.AlignRight)
 
@@ -200,6 +252,8 @@ class CategoriesWidget(QWidget):
         self.tree.setHeaderLabels(["Name", "Type", "Color"])
         self.tree.setColumnWidth(0, 300)
         self.tree.setColumnWidth(1, 100)
+        self.tree.setItemDelegateForColumn(2, ColorSwatchDelegate(self.tree))
+        self.tree.itemExpanded.connect(self._on_item_expanded)
 
         layout.addWidget(self.tree)
 
@@ -207,15 +261,15 @@ class CategoriesWidget(QWidget):
         button_layout = QHBoxLayout()
 
         add_subcategory_button = QPushButton("Add Subcategory")
-        add_subcategory_button.setStyleSheet(ACTION_BUTTON_STYLE)
+        add_subcategory_button.setObjectName("actionButton")
         add_subcategory_button.clicked.connect(self.add_subcategory)
 
         edit_button = QPushButton("Edit")
-        edit_button.setStyleSheet(ACTION_BUTTON_STYLE)
+        edit_button.setObjectName("actionButton")
         edit_button.clicked.connect(self.edit_category)
 
         delete_button = QPushButton("Delete")
-        delete_button.setStyleSheet(DELETE_BUTTON_STYLE)
+        delete_button.setObjectName("deleteButton")
         delete_button.clicked.connect(self.delete_category)
 
         button_layout.addWidget(add_subcategory_button)
@@ -225,41 +279,90 @@ class CategoriesWidget(QWidget):
 
         layout.addLayout(button_layout)
 
-        # Initial data load
-        self.refresh_data()
-
     def create_tree_item(self, category: Category) -> QTreeWidgetItem:
         """Create a tree widget item for a category."""
         item = QTreeWidgetItem([category.name, category.type])
         item.setData(0, Qt.ItemDataRole.UserRole, category.id)
 
-        if category.color_code:
-            color_label = QLabel()
-            color_label.setStyleSheet(
-                f"background-color: {category.color_code}; border: 1px solid #555555;"
-            )
-            color_label.setFixedSize(20, 20)
-            self.tree.setItemWidget(item, 2, color_label)
+        self._set_color_swatch(item, category.color_code)
 
-        # Add subcategories recursively
-        for subcategory in category.subcategories:
-            item.addChild(self.create_tree_item(subcategory))
+        # Subcategory items are created when the item is first expanded
+        if category.subcategories:
+            item.setChildIndicatorPolicy(
+                QTreeWidgetItem.ChildIndicatorPolicy.ShowIndicator
+            )
+            item.setData(0, _PENDING_CHILDREN_ROLE, category)
 
         return item
 
+    def _set_color_swatch(self, item: QTreeWidgetItem, color_code):
+        """Set the colour painted by ColorSwatchDelegate for an item.
+
+        Args:
+            item: The category's tree item
+            color_code: Hex colour code, or None for no swatch
+        """
+        item.setData(
+            2,
+            Qt.ItemDataRole.BackgroundRole,
+            QColor(color_code) if color_code else None,
+        )
+
+    def _update_tree_item(self, item: QTreeWidgetItem, category: Category):
+        """Show a category's edited values in its existing tree item."""
+        item.setText(0, category.name)
+        item.setText(1, category.type)
+        self._set_color_swatch(item, category.color_code)
+
+    def _remove_tree_item(self, item: QTreeWidgetItem):
+        """Remove a deleted category's item from the tree."""
+        parent = item.parent()
+        if parent is None:
+            self.tree.takeTopLevelItem(self.tree.indexOfTopLevelItem(item))
+            return
+        parent.removeChild(item)
+        if parent.childCount() == 0:
+            policy = QTreeWidgetItem.ChildIndicatorPolicy
+            parent.setChildIndicatorPolicy(
+                policy.DontShowIndicatorWhenChildless
+            )
+
+    def _on_item_expanded(self, item: QTreeWidgetItem):
+        """Create the subcategory items of an item expanded for the first time.
+
+        Args:
+            item: The expanded tree item
+        """
+        category = item.data(0, _PENDING_CHILDREN_ROLE)
+        if category is None:
+            return
+        item.setData(0, _PENDING_CHILDREN_ROLE, None)
+        item.addChildren(
+            [self.create_tree_item(sub) for sub in category.subcategories]
+        )
+
     def refresh_data(self):
-        """Refresh the category tree."""
-        self.tree.clear()
+        """Refresh the category tree.
 
+        The tree is repainted and signals are sent once, after all the
+        items have been replaced.
+        """
         # Get all top-level categories
         categories = self.finance_manager.get_categories()
+        self._category_index = {c.id: c for c in categories}
         top_level_categories = [c for c in categories if not c.parent_id]
+        self._top_level_categories = top_level_categories
 
-        # Add categories to tree
-        for category in top_level_categories:
-            self.tree.addTopLevelItem(self.create_tree_item(category))
-
-        self.tree.expandAll()
+        self.tree.setUpdatesEnabled(False)
+        self.tree.blockSignals(True)
+        try:
+            self.tree.clear()
+            self.tree.addTopLevelItems(
+                [self.create_tree_item(c) for c in top_level_categories]
+            )
+        finally:
+            self.tree.blockSignals(False)
+            self.tree.setUpdatesEnabled(True)
 
     def get_selected_category(self) -> tuple[Category, QTreeWidgetItem]:
         """Get the currently selected category and its tree item."""
@@ -269,14 +372,19 @@ class CategoriesWidget(QWidget):
 
         item = selected_items[0]
         category_id = item.data(0, Qt.ItemDataRole.UserRole)
-        category = self.finance_manager.get_category(category_id)
+        category = self._category_index.get(category_id)
+        if category is None:
+            category = self.finance_manager.get_category(category_id)
 
         return category, item
 
     def add_category(self, parent_category=None):
         """Show dialog to add a new category."""
         dialog = CategoryDialog(
-            self.finance_manager, self, parent_category=parent_category
+            self.finance_manager,
+            self,
+            parent_category=parent_category,
+            top_level=self._top_level_categories,
         )
         if dialog.exec() == QDialog.DialogCode.Accepted:
             data = dialog.get_data()
@@ -287,7 +395,7 @@ class CategoriesWidget(QWidget):
                 except Exception as e:
                     QMessageBox.warning(self, "Error", str(e))
 
-    def add_subcategory(self):
+    def add_subcategory(self, *_):
         """Show dialog to add a subcategory to the selected category."""
         category, _ = self.get_selected_category()
         if not category:
@@ -298,28 +406,38 @@ class CategoriesWidget(QWidget):
 
         self.add_category(parent_category=category)
 
-    def edit_category(self):
+    def edit_category(self, *_):
         """Show dialog to edit the selected category."""
-        category, _ = self.get_selected_category()
+        category, item = self.get_selected_category()
         if not category:
             QMessageBox.warning(
                 self, "No Selection", "Please select a category to edit."
             )
             return
 
-        dialog = CategoryDialog(self.finance_manager, self, category=category)
+        dialog = CategoryDialog(
+            self.finance_manager,
+            self,
+            category=category,
+            top_level=self._top_level_categories,
+        )
         if dialog.exec() == QDialog.DialogCode.Accepted:
             data = dialog.get_data()
             if data:
                 try:
+                    moved = data["parent_id"] != category.parent_id
                     self.finance_manager.update_category(category.id, **data)
-                    self.refresh_data()
+                    # Only a move to another parent needs the tree rebuilt
+                    if moved:
+                        self.refresh_data()
+                    else:
+                        self._update_tree_item(item, category)
                 except Exception as e:
                     QMessageBox.warning(self, "Error", str(e))
 
-    def delete_category(self):
+    def delete_category(self, *_):
         """Delete the selected category."""
-        category, _ = self.get_selected_category()
+        category, item = self.get_selected_category()
         if not category:
             QMessageBox.warning(
                 self, "No Selection", "Please select a category to delete."
@@ -345,6 +463,9 @@ class CategoriesWidget(QWidget):
         if reply == QMessageBox.StandardButton.Yes:
             try:
                 self.finance_manager.delete_category(category.id)
-                self.refresh_data()
+                self._category_index.pop(category.id, None)
+                if category in self._top_level_categories:
+                    self._top_level_categories.remove(category)
+                self._remove_tree_item(item)
             except Exception as e:
                 QMessageBox.warning(self, "Error", str(e))
@@ -22,7 +22,7 @@ from PyQt6.QtWidgets import (
 
 from ...core.finance_manager import FinanceManager
 from ...utils.config_manager import get_config
-from ..style import CARD_CONTENT_STYLE, CARD_STYLE, CARD_TITLE_STYLE
+from ...utils.formatting import format_indian_currency
 from .summary_card import SummaryCard
 
 
@@ -89,12 +89,12 @@ class DashboardWidget(QWidget):
 
         # Expense breakdown chart
         expense_chart_container = QFrame()
-        expense_chart_container.setStyleSheet(CARD_STYLE)
+        expense_chart_container.setObjectName("card")
         expense_chart_layout = QVBoxLayout(expense_chart_container)
         expense_chart_layout.setContentsMargins(15, 15, 15, 15)
 
         expense_chart_title = QLabel("Expense Breakdown")
-        expense_chart_title.setStyleSheet(CARD_TITLE_STYLE)
+        expense_chart_title.setObjectName("cardTitle")
         expense_chart_layout.addWidget(expense_chart_title)
 
         self.expense_chart = self.create_expense_chart()
@@ -102,12 +102,12 @@ class DashboardWidget(QWidget):
 
         # Balance trend chart
         trend_chart_container = QFrame()
-        trend_chart_container.setStyleSheet(CARD_STYLE)
+        trend_chart_container.setObjectName("card")
         trend_chart_layout = QVBoxLayout(trend_chart_container)
         trend_chart_layout.setContentsMargins(15, 15, 15, 15)
 
         trend_chart_title = QLabel("Balance Trend")
-        trend_chart_title.setStyleSheet(CARD_TITLE_STYLE)
+        trend_chart_title.setObjectName("cardTitle")
         trend_chart_layout.addWidget(trend_chart_title)
 
         self.trend_chart = self.create_trend_chart()
@@ -120,16 +120,16 @@ class DashboardWidget(QWidget):
 
         # Add recent transactions
         transactions_container = QFrame()
-        transactions_container.setStyleSheet(CARD_STYLE)
+        transactions_container.setObjectName("card")
         transactions_layout = QVBoxLayout(transactions_container)
         transactions_layout.setContentsMargins(15, 15, 15, 15)
 
         transactions_title = QLabel("Recent Transactions")
-        transactions_title.setStyleSheet(CARD_TITLE_STYLE)
+        transactions_title.setObjectName("cardTitle")
         transactions_layout.addWidget(transactions_title)
 
         self.transactions_content = QLabel("No recent transactions")
-        self.transactions_content.setStyleSheet(CARD_CONTENT_STYLE)
+        self.transactions_content.setObjectName("cardContent")
         transactions_layout.addWidget(self.transactions_content)
 
         content_layout.addWidget(transactions_container)
@@ -138,9 +138,6 @@ class DashboardWidget(QWidget):
         scroll.setWidget(content)
         main_layout.addWidget(scroll)
 
-        # Initial data refresh
-        self.refresh_data()
-
     def create_expense_chart(self) -> QChartView:
         """Create the expense breakdown pie chart."""
         series = QPieSeries()
@@ -204,25 +201,7 @@ class DashboardWidget(QWidget):
     def format_currency(self, amount: Decimal) -> str:
         """Format decimal amount as currency string."""
         if self.config["DEFAULT_CURRENCY"] == "INR":
-            # Format with Indian number system (lakhs and crores)
-            def format_indian(num):
-                num = float(num)
-                if num >= 10000000:  # Crore
-                    return f"₹{num/10000000:.2f}Cr"
-                elif num >= 100000:  # Lakh
-                    return f"₹{num/100000:.2f}L"
-                else:
-                    s = str(int(num))
-                    result = s[-3:]
-                    s = s[:-3]
-                    while s:
-                        result = (
-                            s[-2:] + "," + result if len(s) > 2 else s + "," + result
-                        )
-                        s = s[:-2]
-                    return f"₹{result}"
-
-            return format_indian(amount)
+            return format_indian_currency(amount)
         else:
             return f"${amount:,.2f}"
 
@@ -234,9 +213,7 @@ class DashboardWidget(QWidget):
         month = now.month
 
         monthly_summary = self.finance_manager.get_monthly_summary(year, month)
-        total_balance = sum(
-            account.balance for account in self.finance_manager.get_accounts()
-        )
+        total_balance = self.finance_manager.get_total_balance()
 
         # Update card values
         self.balance_card.set_value(self.format_currency(total_balance))
@@ -324,7 +301,7 @@ class DashboardWidget(QWidget):
 
     def update_recent_transactions(self):
         """Update the recent transactions list."""
-        transactions = self.finance_manager.get_recent_transactions(limit=5)
+        transactions = self.finance_manager.get_recent_transactions_rows(limit=5)
 
         if not transactions:
             self.transactions_content.setText("No recent transactions")
@@ -32,13 +32,6 @@ from PyQt6.QtWidgets import (
 )
 
 from src.core.finance_manager import FinanceManager
-from src.gui.style import (
-    ACTION_BUTTON_STYLE,
-    CARD_STYLE,
-    CARD_TITLE_STYLE,
-    INPUT_STYLE,
-    TAB_STYLE,
-)
 from src.gui.widgets.summary_card import SummaryCard
 from src.utils.config_manager import get_config
 from src.utils.formatting import format_currency
@@ -84,12 +77,10 @@ class ReportsWidget(QWidget):
         period_layout = QHBoxLayout()
 
         self.year_spin = QSpinBox()
-        self.year_spin.setStyleSheet(INPUT_STYLE)
         self.year_spin.setRange(2000, 2100)
         self.year_spin.setValue(datetime.now().year)
 
         self.month_combo = QComboBox()
-        self.month_combo.setStyleSheet(INPUT_STYLE)
         months = [
             "January",
             "February",
@@ -108,8 +99,8 @@ class ReportsWidget(QWidget):
         self.month_combo.setCurrentIndex(datetime.now().month - 1)
 
         refresh_button = QPushButton("Refresh")
-        refresh_button.setStyleSheet(ACTION_BUTTON_STYLE)
-        refresh_button.clicked.connect(self.refresh_data)
+        refresh_button.setObjectName("actionButton")
+        refresh_button.clicked.connect(lambda: self.refresh_data())
 
         period_layout.addWidget(QLabel("Year:"))
         period_layout.addWidget(self.year_spin)
@@ -122,7 +113,6 @@ class ReportsWidget(QWidget):
 
         # Tab widget for different reports
         tabs = QTabWidget()
-        tabs.setStyleSheet(TAB_STYLE)
 
         # Monthly Overview Tab
         overview_tab = QScrollArea()
@@ -159,12 +149,12 @@ class ReportsWidget(QWidget):
 
         # Expense by Category Chart
         expense_chart_container = QFrame()
-        expense_chart_container.setStyleSheet(CARD_STYLE)
+        expense_chart_container.setObjectName("card")
         expense_chart_layout = QVBoxLayout(expense_chart_container)
         expense_chart_layout.setContentsMargins(15, 15, 15, 15)
 
         expense_chart_title = QLabel("Expenses by Category")
-        expense_chart_title.setStyleSheet(CARD_TITLE_STYLE)
+        expense_chart_title.setObjectName("cardTitle")
         expense_chart_layout.addWidget(expense_chart_title)
 
         self.expense_chart = self.create_pie_chart()
@@ -174,12 +164,12 @@ class ReportsWidget(QWidget):
 
         # Daily Balance Chart
         balance_chart_container = QFrame()
-        balance_chart_container.setStyleSheet(CARD_STYLE)
+        balance_chart_container.setObjectName("card")
         balance_chart_layout = QVBoxLayout(balance_chart_container)
         balance_chart_layout.setContentsMargins(15, 15, 15, 15)
 
         balance_chart_title = QLabel("Daily Balance")
-        balance_chart_title.setStyleSheet(CARD_TITLE_STYLE)
+        balance_chart_title.setObjectName("cardTitle")
         balance_chart_layout.addWidget(balance_chart_title)
 
         self.balance_chart = self.create_line_chart("Balance")
@@ -191,12 +181,12 @@ class ReportsWidget(QWidget):
 
         # Income vs Expenses Bar Chart
         comparison_chart_container = QFrame()
-        comparison_chart_container.setStyleSheet(CARD_STYLE)
+        comparison_chart_container.setObjectName("card")
         comparison_chart_layout = QVBoxLayout(comparison_chart_container)
         comparison_chart_layout.setContentsMargins(15, 15, 15, 15)
 
         comparison_chart_title = QLabel("Income vs Expenses")
-        comparison_chart_title.setStyleSheet(CARD_TITLE_STYLE)
+        comparison_chart_title.setObjectName("cardTitle")
         comparison_chart_layout.addWidget(comparison_chart_title)
 
         self.comparison_chart = self.create_bar_chart()
@@ -216,12 +206,12 @@ class ReportsWidget(QWidget):
 
         # Income Trend Chart
         income_trend_container = QFrame()
-        income_trend_container.setStyleSheet(CARD_STYLE)
+        income_trend_container.setObjectName("card")
         income_trend_layout = QVBoxLayout(income_trend_container)
         income_trend_layout.setContentsMargins(15, 15, 15, 15)
 
         income_trend_title = QLabel("Income Trend")
-        income_trend_title.setStyleSheet(CARD_TITLE_STYLE)
+        income_trend_title.setObjectName("cardTitle")
         income_trend_layout.addWidget(income_trend_title)
 
         self.income_trend_chart = self.create_line_chart("Income")
@@ -231,12 +221,12 @@ class ReportsWidget(QWidget):
 
         # Expense Trend Chart
         expense_trend_container = QFrame()
-        expense_trend_container.setStyleSheet(CARD_STYLE)
+        expense_trend_container.setObjectName("card")
         expense_trend_layout = QVBoxLayout(expense_trend_container)
         expense_trend_layout.setContentsMargins(15, 15, 15, 15)
 
         expense_trend_title = QLabel("Expense Trend")
-        expense_trend_title.setStyleSheet(CARD_TITLE_STYLE)
+        expense_trend_title.setObjectName("cardTitle")
         expense_trend_layout.addWidget(expense_trend_title)
 
         self.expense_trend_chart = self.create_line_chart("Expenses")
@@ -246,12 +236,12 @@ class ReportsWidget(QWidget):
 
         # Savings Rate Trend Chart
         savings_trend_container = QFrame()
-        savings_trend_container.setStyleSheet(CARD_STYLE)
+        savings_trend_container.setObjectName("card")
         savings_trend_layout = QVBoxLayout(savings_trend_container)
         savings_trend_layout.setContentsMargins(15, 15, 15, 15)
 
         savings_trend_title = QLabel("Savings Rate Trend")
-        savings_trend_title.setStyleSheet(CARD_TITLE_STYLE)
+        savings_trend_title.setObjectName("cardTitle")
         savings_trend_layout.addWidget(savings_trend_title)
 
         self.savings_trend_chart = self.create_line_chart("Savings Rate (%)")
@@ -264,9 +254,6 @@ class ReportsWidget(QWidget):
 
         layout.addWidget(tabs)
 
-        # Initial data load
-        self.refresh_data()
-
         logger.debug("ReportsWidget UI setup complete")
 
     def create_pie_chart(self) -> QChartView:
@@ -23,13 +23,6 @@ from PyQt6.QtWidgets import (
 )
 
 from src.core.finance_manager import FinanceManager
-from src.gui.style import (
-    ACTION_BUTTON_STYLE,
-    DELETE_BUTTON_STYLE,
-    DIALOG_STYLE,
-    INPUT_STYLE,
-    TABLE_STYLE,
-)
 from src.models.models import TransactionType
 from src.utils.config_manager import get_config
 from src.utils.formatting import format_currency
@@ -66,7 +59,6 @@ class TransactionDialog(QDialog):
         self.setWindowTitle(
             "Add Transaction" if not self.transaction else "Edit Transaction"
         )
-        self.setStyleSheet(DIALOG_STYLE)
         self.setMinimumWidth(500)
 
         layout = QFormLayout(self)
@@ -75,7 +67,6 @@ class TransactionDialog(QDialog):
 
         # Type field
         self.type_combo = QComboBox()
-        self.type_combo.setStyleSheet(INPUT_STYLE)
         for trans_type in TransactionType:
             self.type_combo.addItem(trans_type.value)
         if self.transaction:
@@ -84,7 +75,6 @@ class TransactionDialog(QDialog):
 
         # Amount field
         self.amount_input = QDoubleSpinBox()
-        self.amount_input.setStyleSheet(INPUT_STYLE)
         self.amount_input.setRange(0, 1000000000)
         self.amount_input.setDecimals(2)
         self.amount_input.setPrefix(self.currency_symbol)
@@ -94,7 +84,6 @@ class TransactionDialog(QDialog):
 
         # Date field
         self.date_input = QDateEdit()
-        self.date_input.setStyleSheet(INPUT_STYLE)
         self.date_input.setCalendarPopup(True)
         self.date_input.setDisplayFormat("dd-MM-yyyy")  # Indian date format
         if self.transaction:
@@ -111,7 +100,6 @@ class TransactionDialog(QDialog):
 
         # From Account field
         self.from_account_combo = QComboBox()
-        self.from_account_combo.setStyleSheet(INPUT_STYLE)
         accounts = self.finance_manager.get_accounts()
         for account in accounts:
             self.from_account_combo.addItem(
@@ -126,7 +114,6 @@ class TransactionDialog(QDialog):
 
         # To Account field (for transfers)
         self.to_account_combo = QComboBox()
-        self.to_account_combo.setStyleSheet(INPUT_STYLE)
         self.to_account_combo.addItem("N/A", None)
         for account in accounts:
             self.to_account_combo.addItem(
@@ -141,7 +128,6 @@ class TransactionDialog(QDialog):
 
         # Category field
         self.category_combo = QComboBox()
-        self.category_combo.setStyleSheet(INPUT_STYLE)
         categories = self.finance_manager.get_categories()
         for category in categories:
             self.category_combo.addItem(category.name, category.id)
@@ -152,14 +138,12 @@ class TransactionDialog(QDialog):
 
         # Description field
         self.description_input = QLineEdit()
-        self.description_input.setStyleSheet(INPUT_STYLE)
         if self.transaction:
             self.description_input.setText(self.transaction.description or "")
         layout.addRow("Description:", self.description_input)
 
         # Tags field
         self.tags_input = QLineEdit()
-        self.tags_input.setStyleSheet(INPUT_STYLE)
         if self.transaction and self.transaction.tags:
             self.tags_input.setText(self.transaction.tags)
         layout.addRow("Tags:", self.tags_input)
@@ -168,11 +152,11 @@ class TransactionDialog(QDialog):
         button_layout = QHBoxLayout()
 
         save_button = QPushButton("Save")
-        save_button.setStyleSheet(ACTION_BUTTON_STYLE)
+        save_button.setObjectName("actionButton")
         save_button.clicked.connect(self.accept)
 
         cancel_button = QPushButton("Cancel")
-        cancel_button.setStyleSheet(DELETE_BUTTON_STYLE)
+        cancel_button.setObjectName("deleteButton")
         cancel_button.clicked.connect(self.reject)
 
         button_layout.addWidget(save_button)
@@ -247,7 +231,7 @@ class TransactionsWidget(QWidget):
         header_layout.addWidget(title)
 
         add_button = QPushButton("+ Add Transaction")
-        add_button.setStyleSheet(ACTION_BUTTON_STYLE)
+        add_button.setObjectName("actionButton")
         add_button.clicked.connect(self.add_transaction)
         header_layout.addWidget(
             add_button, alignment=Qt.AlignmentFlag.AlignRight
@@ -260,13 +244,11 @@ class TransactionsWidget(QWidget):
 
         # Date range filter
         self.start_date = QDateEdit()
-        self.start_date.setStyleSheet(INPUT_STYLE)
         self.start_date.setCalendarPopup(True)
         self.start_date.setDisplayFormat("dd-MM-yyyy")  # Indian date format
         self.start_date.setDate(QDate.currentDate().addMonths(-1))
 
         self.end_date = QDateEdit()
-        self.end_date.setStyleSheet(INPUT_STYLE)
         self.end_date.setCalendarPopup(True)
         self.end_date.setDisplayFormat("dd-MM-yyyy")  # Indian date format
         self.end_date.setDate(QDate.currentDate())
@@ -278,7 +260,6 @@ class TransactionsWidget(QWidget):
 
         # Type filter
         self.type_filter = QComboBox()
-        self.type_filter.setStyleSheet(INPUT_STYLE)
         self.type_filter.addItem("All Types", None)
         for trans_type in TransactionType:
             self.type_filter.addItem(trans_type.value, trans_type)
@@ -288,7 +269,6 @@ class TransactionsWidget(QWidget):
 
         # Account filter
         self.account_filter = QComboBox()
-        self.account_filter.setStyleSheet(INPUT_STYLE)
         self.account_filter.addItem("All Accounts", None)
         accounts = self.finance_manager.get_accounts()
         for account in accounts:
@@ -299,15 +279,14 @@ class TransactionsWidget(QWidget):
 
         # Apply filters button
         apply_button = QPushButton("Apply Filters")
-        apply_button.setStyleSheet(ACTION_BUTTON_STYLE)
-        apply_button.clicked.connect(self.refresh_data)
+        apply_button.setObjectName("actionButton")
+        apply_button.clicked.connect(lambda: self.refresh_data())
         filter_layout.addWidget(apply_button)
 
         layout.addLayout(filter_layout)
 
         # Transactions table
         self.table = QTableWidget()
-        self.table.setStyleSheet(TABLE_STYLE)
         self.table.setColumnCount(8)
         self.table.setHorizontalHeaderLabels(
             [
@@ -334,11 +313,11 @@ class TransactionsWidget(QWidget):
         button_layout = QHBoxLayout()
 
         edit_button = QPushButton("Edit")
-        edit_button.setStyleSheet(ACTION_BUTTON_STYLE)
+        edit_button.setObjectName("actionButton")
         edit_button.clicked.connect(self.edit_transaction)
 
         delete_button = QPushButton("Delete")
-        delete_button.setStyleSheet(DELETE_BUTTON_STYLE)
+        delete_button.setObjectName("deleteButton")
         delete_button.clicked.connect(self.delete_transaction)
 
         button_layout.addWidget(edit_button)
@@ -349,13 +328,10 @@ class TransactionsWidget(QWidget):
 
         # Add a "Load More" button
         self.load_more_button = QPushButton("Load More")
-        self.load_more_button.setStyleSheet(ACTION_BUTTON_STYLE)
+        self.load_more_button.setObjectName("actionButton")
         self.load_more_button.clicked.connect(self.load_more_transactions)
         layout.addWidget(self.load_more_button)
 
-        # Initial data load
-        self.refresh_data()
-
     def refresh_data(self):
         """Refresh the transactions table."""
         self.page = 0
@@ -381,8 +357,8 @@ class TransactionsWidget(QWidget):
                 )
             )
 
-            # Then fetch transactions
-            transactions = self.finance_manager.search_transactions(
+            # Then fetch the page as plain rows; the table only displays them
+            transactions = self.finance_manager.search_transactions_rows(
                 start_date=start_date,
                 end_date=end_date,
                 transaction_type=transaction_type,
@@ -426,31 +402,27 @@ class TransactionsWidget(QWidget):
                 ),
             )
             self.table.setItem(
-                row, 4, QTableWidgetItem(transaction.from_account.name)
+                row, 4, QTableWidgetItem(transaction.from_account_name)
             )
             self.table.setItem(
                 row,
                 5,
-                QTableWidgetItem(
-                    transaction.to_account.name
-                    if transaction.to_account
-                    else "N/A"
-                ),
+                QTableWidgetItem(transaction.to_account_name or "N/A"),
             )
             self.table.setItem(
-                row, 6, QTableWidgetItem(transaction.category.name)
+                row, 6, QTableWidgetItem(transaction.category_name)
             )
             self.table.setItem(
                 row, 7, QTableWidgetItem(transaction.description or "")
             )
 
-    def load_more_transactions(self):
+    def load_more_transactions(self, *_):
         """Load more transactions when the Load More button is clicked."""
         logger.debug("Loading more transactions")
         self.page += 1
         self.load_transactions()
 
-    def add_transaction(self):
+    def add_transaction(self, *_):
         """Show dialog to add a new transaction."""
         dialog = TransactionDialog(self.finance_manager, self)
         if dialog.exec() == QDialog.DialogCode.Accepted:
@@ -462,7 +434,7 @@ class TransactionsWidget(QWidget):
                 except Exception as e:
                     QMessageBox.warning(self, "Error", str(e))
 
-    def edit_transaction(self):
+    def edit_transaction(self, *_):
         """Show dialog to edit the selected transaction."""
         selected_items = self.table.selectedItems()
         if not selected_items:
@@ -488,7 +460,7 @@ class TransactionsWidget(QWidget):
                 except Exception as e:
                     QMessageBox.warning(self, "Error", str(e))
 
-    def delete_transaction(self):
+    def delete_transaction(self, *_):
         """Delete the selected transaction."""
         selected_items = self.table.selectedItems()
         if not selected_items:
@@ -2,7 +2,7 @@ import sys
 import logging
 from PyQt6.QtWidgets import QApplication
 
-from src.gui import MainWindow
+from src.gui import MainWindow, apply_theme
 from src.models.base import SessionLocal, init_db
 from src.utils.dummy_data import add_dummy_data
 from src.core.finance_manager import FinanceManager
@@ -47,6 +47,7 @@ def main():
         logger.info("Starting GUI application...")
         app = QApplication(sys.argv)
         app.setStyle("Fusion")
+        apply_theme(app)
 
         window = MainWindow(finance_manager)
         window.show()
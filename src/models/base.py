@@ -1,4 +1,5 @@
 from sqlalchemy import create_engine, event, inspect
+from sqlalchemy.engine import make_url
 from sqlalchemy.orm import declarative_base, sessionmaker
 import os
 import logging
@@ -29,10 +30,53 @@ for name in ["sqlalchemy", "sqlalchemy.engine", "sqlalchemy.engine.base.Engine"]
 # Create SQLite database URL with absolute path
 SQLALCHEMY_DATABASE_URL = "sqlite:///data/finance_tracker.db"
 
+# PRAGMAs applied to every SQLite connection: WAL journaling with
+# synchronous=NORMAL fsyncs far less per commit (the last commits may be
+# lost on power failure, but the database stays consistent)
+SQLITE_PRAGMAS = (
+    "journal_mode=WAL",
+    "synchronous=NORMAL",
+    "temp_store=MEMORY",
+    "mmap_size=268435456",  # 256 MB
+    "cache_size=-65536",  # 64 MB
+)
+
+
+def _set_sqlite_pragmas(dbapi_connection, connection_record):
+    """Apply SQLITE_PRAGMAS to a new SQLite connection."""
+    cursor = dbapi_connection.cursor()
+    try:
+        for pragma in SQLITE_PRAGMAS:
+            cursor.execute(f"PRAGMA {pragma}")
+    finally:
+        cursor.close()
+
+
+def create_default_engine(url, **kwargs):
+    """Create an engine with the application's connection settings.
+
+    SQLite engines get SQLITE_PRAGMAS on every new connection. Other
+    backends get a sized connection pool that pings connections before use.
+    The compiled statement cache is enlarged from SQLAlchemy's default of
+    500 so the report and list queries stay cached. Keyword arguments are
+    passed on to create_engine and take precedence.
+    """
+    kwargs.setdefault("query_cache_size", 1200)
+    if make_url(url).get_backend_name() == "sqlite":
+        kwargs.setdefault("connect_args", {"check_same_thread": False})
+        new_engine = create_engine(url, **kwargs)
+        event.listen(new_engine, "connect", _set_sqlite_pragmas)
+        return new_engine
+
+    kwargs.setdefault("pool_size", 10)
+    kwargs.setdefault("max_overflow", 20)
+    kwargs.setdefault("pool_pre_ping", True)
+    return create_engine(url, **kwargs)
+
+
 # Create engine with SQLite configuration
-engine = create_engine(
+engine = create_default_engine(
     SQLALCHEMY_DATABASE_URL,
-    connect_args={"check_same_thread": False},  # Needed for SQLite
     echo=False,  # Disable SQL statement logging to console
 )
 
@@ -45,9 +89,15 @@ Base = declarative_base()
 
 # Create all tables if they don't exist
 def init_db():
+    # Registers the tables on Base.metadata
+    from . import models
+
     inspector = inspect(engine)
     if not inspector.get_table_names():
         Base.metadata.create_all(bind=engine)
+    else:
+        # Databases created by an older version
+        models.upgrade_schema(engine)
 
 
 # Dependency to get DB session
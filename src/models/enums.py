@@ -0,0 +1,21 @@
+"""Enumerations shared by the models and the command line interface.
+
+Kept free of SQLAlchemy imports so that the CLI can build its argument
+parser without loading the database layer.
+"""
+
+import enum
+
+
+class TransactionType(str, enum.Enum):
+    INCOME = "income"
+    EXPENSE = "expense"
+    TRANSFER = "transfer"
+
+
+class AccountType(str, enum.Enum):
+    CHECKING = "checking"
+    SAVINGS = "savings"
+    CREDIT_CARD = "credit_card"
+    CASH = "cash"
+    INVESTMENT = "investment"
@@ -1,4 +1,6 @@
 from datetime import datetime
+from decimal import Decimal
+from typing import Any, Dict, Tuple
 from sqlalchemy import (
     Column,
     Integer,
@@ -8,25 +10,21 @@ from sqlalchemy import (
     ForeignKey,
     Boolean,
     Enum as SQLAlchemyEnum,
+    Index,
+    and_,
+    delete,
+    event,
+    extract,
+    func,
+    insert,
+    inspect,
+    select,
+    update,
 )
 from sqlalchemy.orm import relationship
-import enum
 
 from .base import Base
-
-
-class TransactionType(str, enum.Enum):
-    INCOME = "income"
-    EXPENSE = "expense"
-    TRANSFER = "transfer"
-
-
-class AccountType(str, enum.Enum):
-    CHECKING = "checking"
-    SAVINGS = "savings"
-    CREDIT_CARD = "credit_card"
-    CASH = "cash"
-    INVESTMENT = "investment"
+from .enums import AccountType, TransactionType
 
 
 class Category(Base):
@@ -82,6 +80,10 @@ class Transaction(Base):
     """Model for financial transactions."""
 
     __tablename__ = "transactions"
+    __table_args__ = (
+        # Type-filtered date ranges (searches, report rebuilds)
+        Index("ix_transactions_type_date", "type", "date"),
+    )
 
     id = Column(Integer, primary_key=True)
     type = Column(
@@ -91,7 +93,7 @@ class Transaction(Base):
         nullable=False,
     )
     amount = Column(Numeric(precision=10, scale=2), nullable=False)
-    date = Column(DateTime, nullable=False, default=datetime.utcnow)
+    date = Column(DateTime, nullable=False, default=datetime.utcnow, index=True)
     description = Column(String(255), nullable=True)
 
     # Foreign Keys
@@ -117,13 +119,22 @@ class Transaction(Base):
     created_at = Column(DateTime, default=datetime.utcnow)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
 
-    # Relationships
-    category = relationship("Category", back_populates="transactions")
+    # Relationships, loaded with one IN query per relationship for every
+    # batch of transactions rather than one query per transaction
+    category = relationship(
+        "Category", back_populates="transactions", lazy="selectin"
+    )
     from_account = relationship(
-        "Account", foreign_keys=[from_account_id], back_populates="transactions_from"
+        "Account",
+        foreign_keys=[from_account_id],
+        back_populates="transactions_from",
+        lazy="selectin",
     )
     to_account = relationship(
-        "Account", foreign_keys=[to_account_id], back_populates="transactions_to"
+        "Account",
+        foreign_keys=[to_account_id],
+        back_populates="transactions_to",
+        lazy="selectin",
     )
 
 
@@ -142,3 +153,204 @@ class Budget(Base):
 
     # Relationships
     category = relationship("Category")
+
+
+class MonthlyCategoryTotal(Base):
+    """Rollup of transaction totals per month, category and type.
+
+    Kept in step with the transactions table by the ORM event listeners
+    below and by FinanceManager's bulk write paths, so monthly summaries
+    read a handful of rows instead of scanning the month's transactions.
+    """
+
+    __tablename__ = "monthly_category_totals"
+
+    year = Column(Integer, primary_key=True)
+    month = Column(Integer, primary_key=True)
+    category_id = Column(Integer, ForeignKey("categories.id"), primary_key=True)
+    type = Column(
+        SQLAlchemyEnum(
+            TransactionType, values_callable=lambda obj: [e.value for e in obj]
+        ),
+        primary_key=True,
+    )
+    total = Column(Numeric(precision=10, scale=2), nullable=False, default=0)
+    count = Column(Integer, nullable=False, default=0)
+
+
+# (year, month, category_id, type) -> (amount, transaction count) to add
+MonthlyTotalDeltas = Dict[Tuple[int, int, int, TransactionType], Tuple[Decimal, int]]
+
+
+def add_monthly_total_delta(
+    deltas: MonthlyTotalDeltas,
+    date: datetime,
+    category_id: int,
+    transaction_type: Any,
+    amount: Any,
+    count: int = 1,
+) -> None:
+    """Accumulate one transaction's contribution to the monthly totals.
+
+    Args:
+        deltas (MonthlyTotalDeltas): Pending changes, updated in place.
+        date (datetime): Transaction date.
+        category_id (int): Transaction category.
+        transaction_type (Any): TransactionType or its value.
+        amount (Any): Transaction amount.
+        count (int, optional): 1 to add the transaction, -1 to remove it.
+            Defaults to 1.
+    """
+    if not isinstance(amount, Decimal):
+        amount = Decimal(str(amount) if isinstance(amount, float) else amount)
+    key = (date.year, date.month, category_id, TransactionType(transaction_type))
+    total, number = deltas.get(key, (Decimal("0"), 0))
+    deltas[key] = (total + count * amount, number + count)
+
+
+def apply_monthly_total_deltas(connection, deltas: MonthlyTotalDeltas) -> None:
+    """Write accumulated deltas to the monthly_category_totals table.
+
+    Args:
+        connection: Connection or Session to execute the statements on.
+        deltas (MonthlyTotalDeltas): Changes to apply.
+    """
+    totals = MonthlyCategoryTotal.__table__
+    for (year, month, category_id, transaction_type), (amount, count) in deltas.items():
+        if not count and not amount:
+            continue
+        match = and_(
+            totals.c.year == year,
+            totals.c.month == month,
+            totals.c.category_id == category_id,
+            totals.c.type == transaction_type,
+        )
+        result = connection.execute(
+            update(totals)
+            .where(match)
+            .values(total=totals.c.total + amount, count=totals.c.count + count)
+        )
+        if result.rowcount == 0:
+            connection.execute(
+                insert(totals).values(
+                    year=year,
+                    month=month,
+                    category_id=category_id,
+                    type=transaction_type,
+                    total=amount,
+                    count=count,
+                )
+            )
+        elif count < 0:
+            # Drop buckets whose last transaction went away
+            connection.execute(delete(totals).where(match, totals.c.count <= 0))
+
+
+def rebuild_monthly_totals(connection) -> None:
+    """Recompute the monthly_category_totals table from transactions.
+
+    Args:
+        connection: Connection or Session to execute the statements on.
+    """
+    totals = MonthlyCategoryTotal.__table__
+    year = extract("year", Transaction.date)
+    month = extract("month", Transaction.date)
+    connection.execute(delete(totals))
+    connection.execute(
+        insert(totals).from_select(
+            ["year", "month", "category_id", "type", "total", "count"],
+            select(
+                year,
+                month,
+                Transaction.category_id,
+                Transaction.type,
+                func.sum(Transaction.amount),
+                func.count(),
+            ).group_by(year, month, Transaction.category_id, Transaction.type),
+        )
+    )
+
+
+def create_monthly_totals_table(engine) -> None:
+    """Create and backfill monthly_category_totals if it does not exist.
+
+    Args:
+        engine (Engine): Engine of an existing database.
+    """
+    if inspect(engine).has_table(MonthlyCategoryTotal.__tablename__):
+        return
+    with engine.begin() as connection:
+        MonthlyCategoryTotal.__table__.create(connection)
+        rebuild_monthly_totals(connection)
+
+
+def upgrade_schema(engine) -> None:
+    """Bring a database created by an older version up to date.
+
+    create_all only adds missing tables, so indexes added to existing
+    tables and the monthly totals rollup are created here.
+
+    Args:
+        engine (Engine): Engine of an existing database.
+    """
+    with engine.begin() as connection:
+        for index in Transaction.__table__.indexes:
+            index.create(connection, checkfirst=True)
+    create_monthly_totals_table(engine)
+
+
+_ROLLUP_ATTRIBUTES = ("date", "category_id", "type", "amount")
+
+
+def _keep_old_value(target, value, oldvalue, initiator):
+    return value
+
+
+# Load the previous value when these attributes are set on an expired
+# instance, so the update listener can remove the old contribution
+for _name in _ROLLUP_ATTRIBUTES:
+    event.listen(
+        getattr(Transaction, _name),
+        "set",
+        _keep_old_value,
+        active_history=True,
+        retval=True,
+    )
+
+
+@event.listens_for(Transaction, "after_insert")
+def _add_to_monthly_totals(mapper, connection, target):
+    deltas: MonthlyTotalDeltas = {}
+    add_monthly_total_delta(
+        deltas, target.date, target.category_id, target.type, target.amount
+    )
+    apply_monthly_total_deltas(connection, deltas)
+
+
+@event.listens_for(Transaction, "after_update")
+def _move_in_monthly_totals(mapper, connection, target):
+    state = inspect(target)
+    old = {}
+    for name in _ROLLUP_ATTRIBUTES:
+        history = state.attrs[name].history
+        old[name] = history.deleted[0] if history.deleted else getattr(target, name)
+    if all(old[name] == getattr(target, name) for name in _ROLLUP_ATTRIBUTES):
+        return
+
+    deltas: MonthlyTotalDeltas = {}
+    add_monthly_total_delta(
+        deltas, old["date"], old["category_id"], old["type"], old["amount"], -1
+    )
+    add_monthly_total_delta(
+        deltas, target.date, target.category_id, target.type, target.amount
+    )
+    apply_monthly_total_deltas(connection, deltas)
+
+
+@event.listens_for(Transaction, "before_delete")
+def _remove_from_monthly_totals(mapper, connection, target):
+    deltas: MonthlyTotalDeltas = {}
+    add_monthly_total_delta(
+        deltas, target.date, target.category_id, target.type, target.amount, -1
+    )
+    apply_monthly_total_deltas(connection, deltas)
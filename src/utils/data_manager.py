@@ -5,21 +5,36 @@ import json
 from datetime import datetime
 from decimal import Decimal
 from pathlib import Path
-from typing import List, Dict, Any, Optional
-import pandas as pd
+from typing import Iterable, List, Dict, Any, Optional
 
 from sqlalchemy.orm import Session
 from ..models.models import Account, Category, TransactionType
 
 
+def _import_pandas():
+    """Import pandas, which is only needed for Excel import and export."""
+    try:
+        import pandas as pd
+    except ImportError as e:
+        raise ImportError(
+            "Excel import/export requires pandas. "
+            "Install it with: pip install finance-tracker[reports]"
+        ) from e
+    return pd
+
+
 class DataManager:
     """Class for handling data import and export operations."""
 
     def __init__(self, db_session: Session):
         self.db_session = db_session
 
-    def export_to_csv(self, data: List[Any], filename: str, data_type: str):
-        """Export data to CSV file."""
+    def export_to_csv(self, data: Iterable[Any], filename: str, data_type: str):
+        """Export data to CSV file.
+
+        Rows are written as ``data`` is consumed, so a streamed query such
+        as FinanceManager.iter_transactions() is never held in memory.
+        """
         if data_type == "transactions":
             fieldnames = [
                 "date",
@@ -31,7 +46,7 @@ class DataManager:
                 "description",
                 "tags",
             ]
-            rows = [
+            rows = (
                 {
                     "date": t.date.strftime("%Y-%m-%d"),
                     "type": t.type.value,
@@ -43,10 +58,10 @@ class DataManager:
                     "tags": t.tags or "",
                 }
                 for t in data
-            ]
+            )
         elif data_type == "accounts":
             fieldnames = ["name", "type", "balance", "currency", "description"]
-            rows = [
+            rows = (
                 {
                     "name": a.name,
                     "type": a.type.value,
@@ -55,7 +70,7 @@ class DataManager:
                     "description": a.description or "",
                 }
                 for a in data
-            ]
+            )
         else:
             raise ValueError(f"Unsupported data type: {data_type}")
 
@@ -199,6 +214,7 @@ class DataManager:
         if not Path(filename).exists():
             raise FileNotFoundError(f"File not found: {filename}")
 
+        pd = _import_pandas()
         df = pd.read_excel(filename)
         data = df.to_dict("records")
 
@@ -239,5 +255,6 @@ class DataManager:
         else:
             raise ValueError(f"Unsupported data type: {data_type}")
 
+        pd = _import_pandas()
         df = pd.DataFrame(df_data)
         df.to_excel(filename, index=False)
@@ -7,7 +7,7 @@ from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker, Session
 
 from ..models.base import Base
-from ..models.models import Category
+from ..models.models import Category, upgrade_schema
 from .logger import FinanceLogger
 
 # Initialize logger
@@ -42,6 +42,10 @@ def init_database():
     """Initialize the database with tables and default data."""
     engine = create_database_engine()
 
+    # Upgrade an existing database before create_all would add the rollup
+    # table empty
+    upgrade_schema(engine)
+
     # Create all tables
     Base.metadata.create_all(bind=engine)
 
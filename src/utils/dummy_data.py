@@ -115,7 +115,7 @@ def _add_daily_transactions(
     if date.day == 1:
         base_salary = 85000  # ₹85K base
         bonus = random.randint(0, 15000)  # Up to ₹15K bonus
-        salary_amount = Decimal(str(base_salary + bonus))
+        salary_amount = Decimal(base_salary + bonus)
         finance_manager.add_transaction(
             amount=salary_amount,
             transaction_type=TransactionType.INCOME,
@@ -127,7 +127,7 @@ def _add_daily_transactions(
 
     # Quarterly bonus (every 3 months)
     if date.day == 15 and date.month % 3 == 0:
-        bonus_amount = Decimal(str(random.randint(20000, 50000)))  # ₹20K-50K
+        bonus_amount = Decimal(random.randint(20000, 50000))  # ₹20K-50K
         finance_manager.add_transaction(
             amount=bonus_amount,
             transaction_type=TransactionType.INCOME,
@@ -151,7 +151,7 @@ def _add_daily_transactions(
     # Utilities (10th of month)
     if date.day == 10:
         # Electricity
-        amount = Decimal(str(random.randint(1500, 3000)))  # ₹1.5K-3K
+        amount = Decimal(random.randint(1500, 3000))  # ₹1.5K-3K
         finance_manager.add_transaction(
             amount=amount,
             transaction_type=TransactionType.EXPENSE,
@@ -192,7 +192,7 @@ def _add_daily_transactions(
 
     # Groceries (weekly)
     if date.weekday() == 5:  # Saturday
-        amount = Decimal(str(random.randint(2000, 4000)))  # ₹2K-4K
+        amount = Decimal(random.randint(2000, 4000))  # ₹2K-4K
         finance_manager.add_transaction(
             amount=amount,
             transaction_type=TransactionType.EXPENSE,
@@ -204,7 +204,7 @@ def _add_daily_transactions(
 
     # Food Delivery (2-3 times per week)
     if random.random() < 0.4:  # 40% chance each day
-        amount = Decimal(str(random.randint(200, 800)))  # ₹200-800
+        amount = Decimal(random.randint(200, 800))  # ₹200-800
         finance_manager.add_transaction(
             amount=amount,
             transaction_type=TransactionType.EXPENSE,
@@ -216,7 +216,7 @@ def _add_daily_transactions(
 
     # Transportation
     if date.weekday() < 5:  # Weekdays
-        amount = Decimal(str(random.randint(100, 300)))  # ₹100-300
+        amount = Decimal(random.randint(100, 300))  # ₹100-300
         finance_manager.add_transaction(
             amount=amount,
             transaction_type=TransactionType.EXPENSE,
@@ -264,7 +264,7 @@ def _add_daily_transactions(
 
     # Shopping (weekends)
     if date.weekday() >= 5 and random.random() < 0.4:
-        amount = Decimal(str(random.randint(1000, 5000)))  # ₹1K-5K
+        amount = Decimal(random.randint(1000, 5000))  # ₹1K-5K
         finance_manager.add_transaction(
             amount=amount,
             transaction_type=TransactionType.EXPENSE,
@@ -276,7 +276,7 @@ def _add_daily_transactions(
 
     # Healthcare (random)
     if random.random() < 0.05:  # 5% chance each day
-        amount = Decimal(str(random.randint(500, 2000)))  # ₹500-2K
+        amount = Decimal(random.randint(500, 2000))  # ₹500-2K
         finance_manager.add_transaction(
             amount=amount,
             transaction_type=TransactionType.EXPENSE,
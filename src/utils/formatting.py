@@ -1,8 +1,14 @@
 """Utility functions for formatting data in the Finance Tracker application."""
 
+import re
 from decimal import Decimal
+from functools import lru_cache
 from typing import Dict, Any
 
+# Digits followed by pairs of digits and then the last three: where the
+# Indian system puts a comma (12,34,567)
+_INR_GROUP_RE = re.compile(r"(\d)(?=(?:\d\d)*\d{3}$)")
+
 
 def format_currency(
     amount: Decimal, config: Dict[str, Any]
@@ -18,3 +24,30 @@ def format_currency(
     """
     symbol = config.get("currency", {}).get("display_symbol", "₹")
     return f"{symbol}{amount:,.2f}"
+
+
+@lru_cache(maxsize=4096)
+def format_indian_currency(amount: Decimal) -> str:
+    """Format an amount in rupees using the Indian number system.
+
+    Amounts of a lakh or more are shortened to lakhs (L) or crores (Cr);
+    smaller amounts are grouped as whole rupees. Results are cached, and
+    equal amounts such as Decimal("100") and Decimal("100.00") share an
+    entry.
+
+    Args:
+        amount: The amount to format
+
+    Returns:
+        str: The formatted currency string
+    """
+    num = float(amount)
+    if num >= 10000000:  # Crore
+        return f"₹{num/10000000:.2f}Cr"
+    elif num >= 100000:  # Lakh
+        return f"₹{num/100000:.2f}L"
+    n = int(num)
+    if abs(n) < 100000:
+        # Below a lakh the Indian and Western groupings are the same
+        return f"₹{n:,}"
+    return "₹" + _INR_GROUP_RE.sub(r"\1,", str(n))
@@ -1,11 +1,27 @@
 """Logging utilities for the Finance Tracker application."""
 
+import atexit
 import logging
+import queue
 import sys
 from datetime import datetime
 from pathlib import Path
-from typing import Optional, Union, Any
-from logging.handlers import RotatingFileHandler
+from typing import Any, Dict, Optional, Union
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
+
+# Queue handlers of queued log files, by resolved path. Each file gets one
+# QueueListener thread, shared by every logger writing to it.
+_queue_handlers: Dict[Path, QueueHandler] = {}
+_listeners = []
+
+
+def _stop_listeners():
+    """Stop the queue listeners, writing out any records still queued."""
+    while _listeners:
+        _listeners.pop().stop()
+
+
+atexit.register(_stop_listeners)
 
 
 class FinanceLogger:
@@ -19,8 +35,16 @@ class FinanceLogger:
         max_bytes: int = 5 * 1024 * 1024,  # 5 MB
         backup_count: int = 5,
         format_string: Optional[str] = None,
+        queued: bool = False,
     ):
-        """Initialize the logger."""
+        """Initialize the logger.
+
+        With ``queued`` set, records for the log file are put on a queue and
+        written by a background QueueListener, so logging calls never wait
+        on disk I/O. Loggers queuing to the same file share its listener,
+        which is stopped (and flushed) at exit; the file settings of the
+        first such logger apply.
+        """
         self.logger = logging.getLogger(name)
         self.logger.setLevel(level)
 
@@ -46,12 +70,27 @@ class FinanceLogger:
             log_dir = Path(log_file).parent
             log_dir.mkdir(parents=True, exist_ok=True)
 
-            file_handler = RotatingFileHandler(
-                log_file, maxBytes=max_bytes, backupCount=backup_count
-            )
-            file_handler.setFormatter(formatter)
-            file_handler.setLevel(logging.DEBUG)
-            self.logger.addHandler(file_handler)
+            log_path = Path(log_file).resolve()
+            if queued and log_path in _queue_handlers:
+                self.logger.addHandler(_queue_handlers[log_path])
+            else:
+                file_handler = RotatingFileHandler(
+                    log_file, maxBytes=max_bytes, backupCount=backup_count
+                )
+                file_handler.setFormatter(formatter)
+                file_handler.setLevel(logging.DEBUG)
+
+                if queued:
+                    log_queue = queue.SimpleQueue()
+                    listener = QueueListener(
+                        log_queue, file_handler, respect_handler_level=True
+                    )
+                    listener.start()
+                    _listeners.append(listener)
+                    _queue_handlers[log_path] = QueueHandler(log_queue)
+                    self.logger.addHandler(_queue_handlers[log_path])
+                else:
+                    self.logger.addHandler(file_handler)
 
     def setLevel(self, level: Union[str, int]):
         """Set the logging level."""
@@ -0,0 +1,33 @@
+"""Helpers for counting the SQL statements a block of code emits."""
+
+from contextlib import contextmanager
+from typing import Iterator, List
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+
+@contextmanager
+def count_queries(session: Session) -> Iterator[List[str]]:
+    """Record the SQL statements executed through a session's engine.
+
+    Used in tests to pin how many queries a method issues, so a change
+    that reintroduces a query per row fails loudly.
+
+    Args:
+        session (Session): Session whose engine is watched.
+
+    Yields:
+        List[str]: Statements executed so far, filled in as the block runs.
+    """
+    statements: List[str] = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    engine = session.get_bind()
+    event.listen(engine, "before_cursor_execute", record)
+    try:
+        yield statements
+    finally:
+        event.remove(engine, "before_cursor_execute", record)
@@ -1,12 +1,19 @@
 """Visualization utilities for the Finance Tracker application."""
 
 from typing import Dict, List, Any
-import matplotlib.pyplot as plt
-import plotly.graph_objects as go
-from plotly.subplots import make_subplots
-import pandas as pd
 from datetime import datetime, timedelta
 
+try:
+    import matplotlib.pyplot as plt
+    import plotly.graph_objects as go
+    from plotly.subplots import make_subplots
+    import pandas as pd
+except ImportError as e:
+    raise ImportError(
+        "Visualizations require the reporting dependencies. "
+        "Install them with: pip install finance-tracker[reports]"
+    ) from e
+
 from ..models.models import Transaction
 
 
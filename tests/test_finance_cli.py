@@ -0,0 +1,115 @@
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+
+IMPORT_CHECK = """
+import sys
+
+import src.cli.finance_cli
+from src.cli.finance_cli import FinanceCLI
+
+FinanceCLI.setup_parser("transaction")
+assert "sqlalchemy" not in sys.modules, "CLI import pulled in SQLAlchemy"
+
+import src.core.finance_manager
+
+files = [
+    getattr(module, "__file__", None)
+    for name, module in list(sys.modules.items())
+    if name.startswith("src.") or name.split(".")[0] in ("models", "utils", "core")
+]
+files = [f for f in files if f]
+duplicates = sorted({f for f in files if files.count(f) > 1})
+assert not duplicates, f"modules imported under two names: {duplicates}"
+"""
+
+
+def run_python(code, cwd):
+    """Run code in a fresh interpreter with the project on the path.
+
+    HOME points at cwd, so the parser cache is written there.
+    """
+    env = dict(os.environ, PYTHONPATH=str(PROJECT_ROOT), HOME=str(cwd))
+    return subprocess.run(
+        [sys.executable, "-c", code],
+        cwd=cwd,
+        env=env,
+        capture_output=True,
+        text=True,
+    )
+
+
+def test_cli_import_graph(tmp_path):
+    """Test the CLI imports lazily and registers each module only once."""
+    result = run_python(IMPORT_CHECK, tmp_path)
+    assert result.returncode == 0, result.stderr
+
+
+def test_cli_help_without_database(tmp_path):
+    """Test that --help works without opening the database."""
+    code = (
+        "import sys\n"
+        "from src.cli import finance_cli\n"
+        "sys.argv = ['finance-tracker', '--help']\n"
+        "try:\n"
+        "    finance_cli.main()\n"
+        "except SystemExit:\n"
+        "    pass\n"
+        "assert 'sqlalchemy' not in sys.modules\n"
+    )
+    result = run_python(code, tmp_path)
+    assert result.returncode == 0, result.stderr
+    assert "transaction" in result.stdout
+    assert not (tmp_path / "data").exists()
+
+
+def test_pickled_parser_round_trip():
+    """Test that a cached parser parses exactly like a freshly built one."""
+    import io
+
+    from src.cli.finance_cli import FinanceCLI, _ParserPickler, _ParserUnpickler
+
+    argv = ["transaction", "add", "expense", "12.50", "1", "2", "--tags", "a,b"]
+    parser = FinanceCLI._build_parser("transaction")
+
+    buffer = io.BytesIO()
+    _ParserPickler(buffer).dump(parser)
+    buffer.seek(0)
+    cached = _ParserUnpickler(buffer).load()
+
+    assert vars(cached.parse_args(argv)) == vars(parser.parse_args(argv))
+
+
+def test_parser_cache_prunes_superseded_files(tmp_path, monkeypatch):
+    """Test storing a parser removes ones cached from older sources."""
+    from src.cli import finance_cli
+
+    monkeypatch.setattr(finance_cli, "_PARSER_CACHE_DIR", tmp_path)
+    stale = tmp_path / "parser-311-1792123257201073800-19181-x-.pkl"
+    stale.write_bytes(b"stale")
+
+    parser = finance_cli.FinanceCLI._build_parser("account")
+    finance_cli._store_cached_parser("account", parser)
+
+    assert not stale.exists()
+    assert [p.name for p in tmp_path.iterdir()] == [
+        finance_cli._parser_cache_path("account").name
+    ]
+    cached = finance_cli._load_cached_parser("account")
+    argv = ["account", "list"]
+    assert vars(cached.parse_args(argv)) == vars(parser.parse_args(argv))
+
+
+def test_corrupt_parser_cache_is_discarded(tmp_path, monkeypatch):
+    """Test a cache file that does not load as a parser is removed."""
+    from src.cli import finance_cli
+
+    monkeypatch.setattr(finance_cli, "_PARSER_CACHE_DIR", tmp_path)
+    cache_path = finance_cli._parser_cache_path("account")
+    for contents in (b"\x80\x05K\x01.", b"\x80\x05}q\x00(", b"garbage"):
+        cache_path.write_bytes(contents)
+        assert finance_cli._load_cached_parser("account") is None
+        assert not cache_path.exists()
@@ -74,6 +74,14 @@ def test_create_account(finance_manager):
     assert account.description == "Test account description"
 
 
+def test_get_total_balance(finance_manager, sample_account):
+    """Test the combined balance across accounts."""
+    assert finance_manager.get_total_balance() == Decimal("1000.00")
+
+    finance_manager.add_account("Cash", AccountType.CASH, "250.50")
+    assert finance_manager.get_total_balance() == Decimal("1250.50")
+
+
 def test_create_transaction(finance_manager, sample_account, sample_category):
     """Test creating a new transaction."""
     initial_balance = sample_account.balance
@@ -98,6 +106,126 @@ def test_create_transaction(finance_manager, sample_account, sample_category):
     assert sample_account.balance == initial_balance - transaction_amount
 
 
+def test_add_transaction_updates_balance(
+    finance_manager, sample_account, sample_category
+):
+    """Test add_transaction adjusts the account balance in the database."""
+    finance_manager.add_transaction(
+        amount=Decimal("250.00"),
+        transaction_type=TransactionType.INCOME,
+        account_id=sample_account.id,
+        category_id=sample_category.id,
+    )
+    finance_manager.add_transaction(
+        amount="100.50",
+        transaction_type=TransactionType.EXPENSE,
+        account_id=sample_account.id,
+        category_id=sample_category.id,
+    )
+
+    assert finance_manager.get_account(sample_account.id).balance == Decimal(
+        "1149.50"
+    )
+
+
+def test_update_and_delete_transaction_balances(
+    finance_manager, sample_account, sample_category
+):
+    """Test editing and deleting a transaction keep balances in step."""
+    savings = finance_manager.add_account("Savings", AccountType.SAVINGS)
+    transaction = finance_manager.create_transaction(
+        type=TransactionType.EXPENSE,
+        amount=Decimal("30.00"),
+        from_account_id=sample_account.id,
+        category_id=sample_category.id,
+    )
+    assert sample_account.balance == Decimal("970.00")
+
+    finance_manager.update_transaction(transaction.id, amount="50.00")
+    assert sample_account.balance == Decimal("950.00")
+
+    finance_manager.update_transaction(
+        transaction.id, type=TransactionType.TRANSFER, to_account_id=savings.id
+    )
+    assert sample_account.balance == Decimal("950.00")
+    assert savings.balance == Decimal("50.00")
+
+    finance_manager.update_transaction(
+        transaction.id, type=TransactionType.INCOME, to_account_id=None
+    )
+    assert sample_account.balance == Decimal("1050.00")
+    assert savings.balance == Decimal("0.00")
+
+    assert finance_manager.delete_transaction(transaction.id)
+    assert sample_account.balance == Decimal("1000.00")
+    assert savings.balance == Decimal("0.00")
+
+
+def test_add_transactions(finance_manager, sample_account, sample_category):
+    """Test bulk inserting transactions and applying balance changes."""
+    savings = Account(
+        name="Savings",
+        type=AccountType.SAVINGS,
+        balance=Decimal("0.00"),
+        currency="USD",
+    )
+    finance_manager.db.add(savings)
+    finance_manager.db.commit()
+
+    rows = [
+        {
+            "type": TransactionType.INCOME,
+            "amount": "500.00",
+            "from_account_id": sample_account.id,
+            "category_id": sample_category.id,
+            "date": datetime(2023, 11, 1),
+        },
+        {
+            "type": TransactionType.EXPENSE,
+            "amount": Decimal("120.25"),
+            "from_account_id": sample_account.id,
+            "category_id": sample_category.id,
+            "date": datetime(2023, 11, 2),
+            "description": "Groceries",
+        },
+        {
+            "type": TransactionType.TRANSFER,
+            "amount": Decimal("300.00"),
+            "from_account_id": sample_account.id,
+            "to_account_id": savings.id,
+            "category_id": sample_category.id,
+            "date": datetime(2023, 11, 3),
+        },
+    ]
+    finance_manager.add_transactions(rows, batch_size=2)
+
+    assert len(finance_manager.get_transactions()) == 3
+    assert finance_manager.get_account(sample_account.id).balance == Decimal(
+        "1079.75"
+    )
+    assert finance_manager.get_account(savings.id).balance == Decimal("300.00")
+
+    expense = finance_manager.search_transactions(
+        transaction_type=TransactionType.EXPENSE
+    )[0]
+    finance_manager.bulk_update_transactions(
+        [{"id": expense.id, "amount": "99.99", "description": "Updated"}]
+    )
+    updated = finance_manager.get_transaction(expense.id)
+    assert updated.amount == Decimal("99.99")
+    assert updated.description == "Updated"
+    assert finance_manager.get_account(sample_account.id).balance == Decimal(
+        "1100.01"
+    )
+
+    finance_manager.bulk_update_transactions(
+        [{"id": expense.id, "type": TransactionType.INCOME}]
+    )
+    assert finance_manager.get_account(sample_account.id).balance == Decimal(
+        "1299.99"
+    )
+
+
 def test_get_monthly_summary(finance_manager, sample_account, sample_category):
     """Test getting monthly financial summary."""
     # Create test transactions
@@ -126,6 +254,100 @@ def test_get_monthly_summary(finance_manager, sample_account, sample_category):
     assert summary["expense_by_category"][sample_category.name] == Decimal("500.00")
 
 
+def test_get_daily_balances(finance_manager, sample_account, sample_category):
+    """Test daily balances walk back from the current account balance."""
+    for day, kind, amount in [
+        (1, TransactionType.INCOME, "200.00"),
+        (3, TransactionType.EXPENSE, "50.00"),
+        (6, TransactionType.EXPENSE, "25.00"),
+    ]:
+        finance_manager.create_transaction(
+            type=kind,
+            amount=Decimal(amount),
+            from_account_id=sample_account.id,
+            category_id=sample_category.id,
+            date=datetime(2023, 10, day, 12),
+        )
+
+    balances = finance_manager.get_daily_balances(
+        datetime(2023, 10, 1), datetime(2023, 10, 4)
+    )
+
+    # The balance is now 1125.00. Only the transaction after the range is
+    # rolled back from it; days inside the range accumulate their net change
+    assert list(balances.values()) == [
+        Decimal("1350.00"),
+        Decimal("1350.00"),
+        Decimal("1300.00"),
+        Decimal("1300.00"),
+    ]
+
+
+def test_monthly_summary_cache_invalidation(
+    finance_manager, sample_account, sample_category
+):
+    """Test cached monthly summaries are refreshed after writes."""
+    transaction = finance_manager.create_transaction(
+        type=TransactionType.EXPENSE,
+        amount=Decimal("40.00"),
+        from_account_id=sample_account.id,
+        category_id=sample_category.id,
+        date=datetime(2023, 5, 10),
+    )
+    summary = finance_manager.get_monthly_summary(2023, 5)
+    assert summary["total_expenses"] == Decimal("40.00")
+
+    # Mutating a returned summary must not leak into the cache
+    summary["expense_by_category"].clear()
+    assert finance_manager.get_monthly_summary(2023, 5)["expense_by_category"]
+
+    finance_manager.add_transaction(
+        amount=Decimal("10.00"),
+        transaction_type=TransactionType.EXPENSE,
+        account_id=sample_account.id,
+        category_id=sample_category.id,
+        date=datetime(2023, 5, 20),
+    )
+    assert finance_manager.get_monthly_summary(2023, 5)["total_expenses"] == (
+        Decimal("50.00")
+    )
+
+    finance_manager.update_transaction(transaction.id, date=datetime(2023, 6, 1))
+    assert finance_manager.get_monthly_summary(2023, 5)["total_expenses"] == (
+        Decimal("10.00")
+    )
+    assert finance_manager.get_monthly_summary(2023, 6)["total_expenses"] == (
+        Decimal("40.00")
+    )
+
+    finance_manager.delete_transaction(transaction.id)
+    assert finance_manager.get_monthly_summary(2023, 6)["total_expenses"] == 0
+
+
+def test_get_monthly_comparison(finance_manager, sample_account, sample_category):
+    """Test the yearly month-by-month income and expense comparison."""
+    for month, kind, amount in [
+        (1, TransactionType.INCOME, "1000.00"),
+        (1, TransactionType.EXPENSE, "300.00"),
+        (1, TransactionType.EXPENSE, "200.00"),
+        (3, TransactionType.EXPENSE, "75.00"),
+    ]:
+        finance_manager.create_transaction(
+            type=kind,
+            amount=Decimal(amount),
+            from_account_id=sample_account.id,
+            category_id=sample_category.id,
+            date=datetime(2023, month, 10),
+        )
+
+    comparison = finance_manager.get_monthly_comparison(2023)
+
+    assert len(comparison) == 12
+    assert comparison[0] == ("Jan", Decimal("1000.00"), Decimal("500.00"))
+    assert comparison[1] == ("Feb", Decimal("0"), Decimal("0"))
+    assert comparison[2] == ("Mar", Decimal("0"), Decimal("75.00"))
+
+
 def test_search_transactions(finance_manager, sample_account, sample_category):
     """Test searching transactions with various filters."""
     # Create test transactions
@@ -173,6 +395,29 @@ def test_search_transactions(finance_manager, sample_account, sample_category):
     assert len(transactions) == 2
 
 
+def test_iter_transactions(finance_manager, sample_account, sample_category):
+    """Test streaming transactions matches the search results."""
+    for day in range(1, 6):
+        finance_manager.create_transaction(
+            type=TransactionType.EXPENSE,
+            amount=Decimal("10.00"),
+            from_account_id=sample_account.id,
+            category_id=sample_category.id,
+            date=datetime(2023, 10, day),
+        )
+
+    streamed = list(
+        finance_manager.iter_transactions(
+            start_date=datetime(2023, 10, 2), batch_size=2
+        )
+    )
+    searched = finance_manager.search_transactions(start_date=datetime(2023, 10, 2))
+
+    assert [t.id for t in streamed] == [t.id for t in searched]
+    assert [t.date.day for t in streamed] == [5, 4, 3, 2]
+    assert streamed[0].category.name == sample_category.name
+
+
 def test_get_account_balance(finance_manager, sample_account):
     """Test getting account balance."""
     balance = finance_manager.get_account_balance(sample_account.id)
@@ -204,3 +449,270 @@ def test_transfer_between_accounts(finance_manager, sample_account):
     # Check balances were updated correctly
     assert sample_account.balance == initial_balance_1 - transfer_amount
     assert second_account.balance == initial_balance_2 + transfer_amount
+
+
+def test_create_default_engine_sqlite_pragmas(tmp_path):
+    """Test that default SQLite engines run in WAL mode."""
+    from sqlalchemy import text
+    from src.models.base import create_default_engine
+
+    engine = create_default_engine(f"sqlite:///{tmp_path / 'pragmas.db'}")
+    with engine.connect() as conn:
+        assert conn.execute(text("PRAGMA journal_mode")).scalar() == "wal"
+        assert conn.execute(text("PRAGMA synchronous")).scalar() == 1
+    engine.dispose()
+
+
+def test_atomic_commits_once_and_rolls_back(finance_manager, db_session):
+    """Test that atomic() groups writes and rolls them all back on error."""
+    with finance_manager.atomic():
+        finance_manager.add_account("First", AccountType.CASH, 10)
+        finance_manager.add_account("Second", AccountType.CASH, 20)
+    assert db_session.query(Account).count() == 2
+
+    with pytest.raises(RuntimeError):
+        with finance_manager.atomic():
+            finance_manager.add_account("Third", AccountType.CASH, 30)
+            raise RuntimeError("abort")
+    assert db_session.query(Account).count() == 2
+    assert finance_manager.auto_commit
+
+
+def test_failed_bulk_write_keeps_atomic_writes(
+    finance_manager, db_session, sample_account, sample_category
+):
+    """Test a failing bulk write inside atomic() keeps earlier writes."""
+    bad_row = {
+        "type": TransactionType.EXPENSE,
+        "amount": "5.00",
+        "from_account_id": None,
+        "category_id": sample_category.id,
+    }
+    with finance_manager.atomic():
+        finance_manager.add_account("Second", AccountType.CASH, 20)
+        with pytest.raises(Exception):
+            finance_manager.add_transactions([bad_row])
+
+    assert db_session.query(Account).filter_by(name="Second").count() == 1
+
+
+def test_insert_transaction_core(
+    finance_manager, sample_account, sample_category
+):
+    """Test inserting a transaction through the Core fast path."""
+    transaction_id = finance_manager.insert_transaction_core(
+        type=TransactionType.EXPENSE,
+        amount="12.34",
+        date=datetime(2024, 1, 15),
+        category_id=sample_category.id,
+        from_account_id=sample_account.id,
+    )
+
+    transaction = finance_manager.get_transaction(transaction_id)
+    assert transaction.amount == Decimal("12.34")
+    assert transaction.created_at is not None
+    assert sample_account.balance == Decimal("987.66")
+
+
+def test_monthly_category_totals_rollup(
+    finance_manager, db_session, sample_account, sample_category
+):
+    """Test the monthly rollup follows inserts, updates and deletes."""
+    from src.models.models import MonthlyCategoryTotal
+
+    transaction = finance_manager.create_transaction(
+        type=TransactionType.EXPENSE,
+        amount=Decimal("25.00"),
+        from_account_id=sample_account.id,
+        category_id=sample_category.id,
+        date=datetime(2023, 8, 3),
+    )
+    finance_manager.update_transaction(transaction.id, amount=Decimal("30.00"))
+
+    row = db_session.query(MonthlyCategoryTotal).one()
+    assert (row.year, row.month, row.total, row.count) == (
+        2023,
+        8,
+        Decimal("30.00"),
+        1,
+    )
+    assert finance_manager.get_monthly_summary(2023, 8)["expense_by_category"] == {
+        sample_category.name: Decimal("30.00")
+    }
+
+    finance_manager.delete_transaction(transaction.id)
+    assert db_session.query(MonthlyCategoryTotal).count() == 0
+
+
+def test_search_transactions_rows(
+    finance_manager, sample_account, sample_category
+):
+    """Test the read-only search returns plain rows with joined names."""
+    for day in (1, 2, 3):
+        finance_manager.create_transaction(
+            type=TransactionType.EXPENSE,
+            amount=Decimal(day),
+            from_account_id=sample_account.id,
+            category_id=sample_category.id,
+            date=datetime(2023, 9, day),
+        )
+
+    rows = finance_manager.search_transactions_rows(limit=2, offset=1)
+    assert [row.amount for row in rows] == [Decimal("2"), Decimal("1")]
+    assert rows[0].from_account_name == sample_account.name
+    assert rows[0].to_account_name is None
+    assert rows[0].category_name == sample_category.name
+
+
+def test_aggregate_query_counts(
+    finance_manager, db_session, sample_account, sample_category
+):
+    """Test that reports and searches issue a fixed number of queries."""
+    from src.utils.query_counter import count_queries
+
+    for day in range(1, 29):
+        finance_manager.create_transaction(
+            type=TransactionType.EXPENSE,
+            amount=Decimal("1.00"),
+            from_account_id=sample_account.id,
+            category_id=sample_category.id,
+            date=datetime(2023, 2, day),
+        )
+    db_session.expire_all()
+
+    with count_queries(db_session) as queries:
+        finance_manager.get_trends(12)
+    assert len(queries) == 1
+
+    with count_queries(db_session) as queries:
+        finance_manager.get_monthly_comparison(2023)
+    assert len(queries) == 1
+
+    with count_queries(db_session) as queries:
+        finance_manager.get_daily_balances(datetime(2023, 2, 1), datetime(2023, 2, 28))
+    assert len(queries) == 2
+
+    # One query for the transactions plus one per eager-loaded relationship
+    with count_queries(db_session) as queries:
+        finance_manager.search_transactions()
+    assert len(queries) <= 4
+
+
+def test_account_lookup_cache(finance_manager, sample_account, sample_category):
+    """Test cached account lookups see balance changes made in SQL."""
+    from src.utils.query_counter import count_queries
+
+    with finance_manager.atomic():
+        account = finance_manager.get_account(sample_account.id)
+        with count_queries(finance_manager.db) as queries:
+            assert finance_manager.get_account(sample_account.id) is account
+        assert queries == []
+
+        finance_manager.add_transaction(
+            amount=Decimal("100.00"),
+            transaction_type=TransactionType.INCOME,
+            account_id=sample_account.id,
+            category_id=sample_category.id,
+        )
+        assert finance_manager.get_account(sample_account.id).balance == (
+            Decimal("1100.00")
+        )
+
+    assert finance_manager._account_cache == {}
+
+
+def test_get_trends_calendar_months(finance_manager):
+    """Test trends cover exactly the last N calendar months."""
+    now = datetime.now()
+    trends = finance_manager.get_trends(months=14)
+
+    assert len(trends) == 14
+    assert trends[-1][0] == datetime(now.year, now.month, 1)
+    assert all(month_start.day == 1 for month_start, *_ in trends)
+    assert finance_manager.get_trends(months=0) == []
+
+
+def test_bulk_update_drops_cached_trends(
+    finance_manager, sample_account, sample_category
+):
+    """Test trends cached before a bulk update are not served after it."""
+    transaction = finance_manager.create_transaction(
+        type=TransactionType.EXPENSE,
+        amount=Decimal("10.00"),
+        from_account_id=sample_account.id,
+        category_id=sample_category.id,
+        date=datetime.now(),
+    )
+    assert finance_manager.get_trends(1)[-1][2] == Decimal("10.00")
+
+    finance_manager.bulk_update_transactions(
+        [{"id": transaction.id, "amount": "50.00"}]
+    )
+
+    assert finance_manager.get_trends(1)[-1][2] == Decimal("50.00")
+
+
+def test_get_recent_transactions_rows(
+    finance_manager, sample_account, sample_category
+):
+    """Test recent transaction rows come back newest first with names."""
+    for day in (1, 2):
+        finance_manager.create_transaction(
+            type=TransactionType.EXPENSE,
+            amount=Decimal(day),
+            from_account_id=sample_account.id,
+            category_id=sample_category.id,
+            date=datetime(2023, 11, day),
+        )
+
+    rows = finance_manager.get_recent_transactions_rows(limit=1)
+    assert len(rows) == 1
+    assert rows[0].date == datetime(2023, 11, 2)
+    assert rows[0].account_name == sample_account.name
+    assert rows[0].category_name == sample_category.name
+
+
+def test_summary_cache_sees_direct_orm_changes(
+    finance_manager, db_session, sample_account, sample_category
+):
+    """Test cached summaries are dropped when the session flushes edits."""
+    transaction = finance_manager.create_transaction(
+        type=TransactionType.EXPENSE,
+        amount=Decimal("10.00"),
+        from_account_id=sample_account.id,
+        category_id=sample_category.id,
+        date=datetime(2023, 12, 5),
+    )
+    assert finance_manager.get_monthly_summary(2023, 12)["total_expenses"] == (
+        Decimal("10.00")
+    )
+
+    transaction.date = datetime(2023, 11, 5)
+    db_session.commit()
+
+    assert finance_manager.get_monthly_summary(2023, 12)["total_expenses"] == 0
+    assert finance_manager.get_monthly_summary(2023, 11)["total_expenses"] == (
+        Decimal("10.00")
+    )
+
+
+def test_recompute_balances(finance_manager, sample_account, sample_category):
+    """Test balances are rebuilt from the transaction history."""
+    savings = finance_manager.add_account("Savings", AccountType.SAVINGS)
+    for kind, amount, to_account_id in [
+        (TransactionType.INCOME, "500.00", None),
+        (TransactionType.EXPENSE, "120.00", None),
+        (TransactionType.TRANSFER, "80.00", savings.id),
+    ]:
+        finance_manager.create_transaction(
+            type=kind,
+            amount=Decimal(amount),
+            from_account_id=sample_account.id,
+            to_account_id=to_account_id,
+            category_id=sample_category.id,
+        )
+
+    finance_manager.recompute_balances()
+
+    assert sample_account.balance == Decimal("300.00")
+    assert savings.balance == Decimal("80.00")